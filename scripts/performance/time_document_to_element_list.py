@@ -0,0 +1,57 @@
+"""Times `document_to_element_list` on synthetic single-page layouts of growing size.
+
+Each layout is a chain of nested sections (every element is the parent of the next) with a
+Headline, the worst case for parent resolution and Title depth inference. Time per element should
+stay flat as the page grows.
+
+Usage: `PYTHONPATH=. python scripts/performance/time_document_to_element_list.py [ITERATIONS]`
+"""
+
+import sys
+import time
+
+from PIL import Image
+from unstructured_inference.inference.layout import DocumentLayout, PageLayout
+from unstructured_inference.inference.layoutelement import LayoutElement
+
+from unstructured.partition.common import document_to_element_list
+
+PAGE_SIZES = [250, 500, 1000, 2000, 4000]
+
+
+def build_document(n_elements: int) -> DocumentLayout:
+    elements = [LayoutElement.from_coords(0, 0, 10, 10, text="Headline", type="Headline")]
+    for i in range(1, n_elements):
+        elements.append(
+            LayoutElement.from_coords(
+                0,
+                i * 10,
+                100,
+                i * 10 + 10,
+                text=f"Section {i}",
+                type="Title" if i % 3 else "NarrativeText",
+                parent=elements[-1],
+            ),
+        )
+    page = PageLayout(number=1, image=Image.new("1", (1000, 1000)))
+    page.elements = elements
+    return DocumentLayout.from_pages([page])
+
+
+def time_document_to_element_list(n_elements: int, iterations: int) -> float:
+    total_time = 0.0
+    for _ in range(iterations):
+        document = build_document(n_elements)
+        start_time = time.perf_counter()
+        document_to_element_list(document, sortable=False)
+        total_time += time.perf_counter() - start_time
+    return total_time / iterations
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print(f"{'elements':>10} {'seconds':>10} {'us/element':>12}")
+    for n_elements in PAGE_SIZES:
+        seconds = time_document_to_element_list(n_elements, iterations)
+        print(f"{n_elements:>10} {seconds:>10.4f} {seconds / n_elements * 1e6:>12.1f}")
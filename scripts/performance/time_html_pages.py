@@ -0,0 +1,58 @@
+"""Times parsing the pages of synthetic HTML documents of growing size with `HTMLDocument`.
+
+The documents are a single large table, a long list and a long run of paragraphs, the shapes where
+the element-tree walk used to be quadratic. Time per row/item should stay flat as they grow.
+
+Usage: `PYTHONPATH=. python scripts/performance/time_html_pages.py [ITERATIONS]`
+"""
+
+import sys
+import time
+
+from unstructured.documents.html import HTMLDocument
+
+SIZES = [1000, 5000, 10000, 50000]
+
+
+def build_table(n_rows: int) -> str:
+    rows = "".join(f"<tr><td>{i}</td><td>Cell number {i}</td></tr>" for i in range(n_rows))
+    return f"<html><body><table>{rows}</table></body></html>"
+
+
+def build_list(n_items: int) -> str:
+    items = "".join(
+        f"<li>Item {i} of the list <span>with a span</span></li>" for i in range(n_items)
+    )
+    return f"<html><body><ul>{items}</ul></body></html>"
+
+
+def build_paragraphs(n_paragraphs: int) -> str:
+    paragraphs = "".join(
+        f"<p>Paragraph {i} has <b>bold</b> text and <a href='#{i}'>a link</a> in it.</p>"
+        for i in range(n_paragraphs)
+    )
+    return f"<html><body><div>{paragraphs}</div></body></html>"
+
+
+def time_pages(html: str, iterations: int) -> float:
+    total_time = 0.0
+    for _ in range(iterations):
+        document = HTMLDocument.from_string(html)
+        start_time = time.perf_counter()
+        document.pages
+        total_time += time.perf_counter() - start_time
+    return total_time / iterations
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    print(f"{'document':>12} {'size':>8} {'seconds':>10} {'us/item':>10}")
+    for name, build in [
+        ("table", build_table),
+        ("list", build_list),
+        ("paragraphs", build_paragraphs),
+    ]:
+        for size in SIZES:
+            seconds = time_pages(build(size), iterations)
+            print(f"{name:>12} {size:>8} {seconds:>10.3f} {seconds / size * 1e6:>10.1f}")
@@ -0,0 +1,50 @@
+"""Times the NLTK wrappers of `unstructured.nlp.tokenize` over many distinct paragraphs.
+
+Every paragraph is unique, so the LRU caches of the wrappers never hit and each call goes to the
+tokenizer or tagger. The NLTK models are loaded once per process, so the time per paragraph should
+be the time spent tokenizing and tagging, with no filesystem lookups of the NLTK data.
+
+Requires the NLTK `punkt` and `averaged_perceptron_tagger` data (downloaded if missing).
+
+Usage: `PYTHONPATH=. python scripts/performance/time_nlp_tokenize.py [N_PARAGRAPHS]`
+"""
+
+import sys
+import time
+
+from unstructured.nlp.tokenize import load_nltk_resources, pos_tag, sent_tokenize, word_tokenize
+
+SENTENCES = [
+    "The quarterly report was filed with the commission on {i} March.",
+    "Revenue grew by {i} percent compared to the prior year.",
+    "ITEM {i}A. PROPERTIES",
+    "Please ask the teacher for apple number {i}.",
+]
+
+
+def build_paragraphs(n_paragraphs: int):
+    return [
+        " ".join(sentence.format(i=i) for sentence in SENTENCES[i % 2 :])
+        for i in range(n_paragraphs)
+    ]
+
+
+def time_function(function, paragraphs) -> float:
+    start_time = time.perf_counter()
+    for paragraph in paragraphs:
+        function(paragraph)
+    return time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    n_paragraphs = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    paragraphs = build_paragraphs(n_paragraphs)
+
+    start_time = time.perf_counter()
+    load_nltk_resources()
+    print(f"loaded NLTK resources in {time.perf_counter() - start_time:.2f}s")
+
+    print(f"{'function':>15} {'seconds':>10} {'us/paragraph':>14}")
+    for function in (sent_tokenize, word_tokenize, pos_tag):
+        seconds = time_function(function, paragraphs)
+        print(f"{function.__name__:>15} {seconds:>10.2f} {seconds / n_paragraphs * 1e6:>14.1f}")
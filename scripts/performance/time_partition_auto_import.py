@@ -0,0 +1,61 @@
+"""Times a cold `from unstructured.partition.auto import partition` in fresh interpreters.
+
+Each iteration starts a new Python process, so nothing is cached in `sys.modules`, and reports the
+time taken by the import alone. Also lists the heaviest modules loaded by the import (from
+`python -X importtime`), which is where to look when import time regresses.
+
+Usage: `PYTHONPATH=. python scripts/performance/time_partition_auto_import.py [ITERATIONS]`
+"""
+
+import statistics
+import subprocess
+import sys
+
+IMPORT_STATEMENT = "from unstructured.partition.auto import partition"
+TIMING_CODE = (
+    "import time; start = time.perf_counter(); "
+    f"{IMPORT_STATEMENT}; print(time.perf_counter() - start)"
+)
+N_HEAVIEST_MODULES = 10
+
+
+def time_import() -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", TIMING_CODE], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip())
+
+
+def heaviest_modules(n: int):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_STATEMENT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # -- modules are listed after their own imports, indented by 2 spaces per level; keep
+        # -- the ones imported directly by unstructured.partition.auto --
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name.strip() == "unstructured.partition.auto":
+                break
+            modules = []
+        elif depth == 1:
+            modules.append((int(cumulative) / 1e6, name.strip()))
+    return sorted(modules, reverse=True)[:n]
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    times = [time_import() for _ in range(iterations)]
+    print(f"{IMPORT_STATEMENT!r} over {iterations} fresh interpreters:")
+    print(f"  median {statistics.median(times):.3f}s, min {min(times):.3f}s, max {max(times):.3f}s")
+    print("heaviest modules imported by unstructured.partition.auto (cumulative seconds):")
+    for seconds, name in heaviest_modules(N_HEAVIEST_MODULES):
+        print(f"  {seconds:>8.3f} {name}")
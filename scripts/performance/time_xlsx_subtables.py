@@ -0,0 +1,71 @@
+"""Times finding the subtables of synthetic worksheets of growing size with `_ConnectedComponents`.
+
+Worksheets are stacks of 50-column tables of 1000 rows separated by blank rows, with sparse notes
+beside them, the shape of a large finance workbook. The graph-based implementation it replaced is
+kept here as the reference, run on the sizes it can handle, and both must find the same subtables.
+It needs `networkx`, which the `xlsx` extra no longer installs.
+
+Usage: `PYTHONPATH=. python scripts/performance/time_xlsx_subtables.py [MAX_REFERENCE_ROWS]`
+"""
+
+import sys
+import time
+from typing import List, Tuple
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from unstructured.partition.xlsx import _ConnectedComponent, _ConnectedComponents
+
+SIZES = [1_000, 10_000, 50_000, 200_000]
+N_COLS = 50
+
+
+def build_worksheet(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    values = np.full((n_rows, N_COLS), "1.0", dtype=object)
+    values[::1000] = None
+    # -- a few empty cells inside the tables and notes in the last columns --
+    values[rng.random((n_rows, N_COLS)) < 0.02] = None
+    values[:, -3:-1] = None
+    values[rng.random(n_rows) < 0.9, -1] = None
+    return pd.DataFrame(values)
+
+
+def reference_extents(worksheet_df: pd.DataFrame) -> List[Tuple[int, int, int, int]]:
+    max_row, max_col = worksheet_df.shape
+    node_array = np.indices((max_row, max_col)).T
+    empty_cells = worksheet_df.isna().T
+    graph = nx.grid_2d_graph(max_row, max_col)
+    graph.remove_nodes_from([tuple(pair) for pair in node_array[empty_cells]])
+    components = [
+        _ConnectedComponent(worksheet_df, node_set) for node_set in nx.connected_components(graph)
+    ]
+    merged = _ConnectedComponents(worksheet_df)._merge_overlapping_tables(components)
+    return [component._extents for component in merged]
+
+
+def extents(worksheet_df: pd.DataFrame) -> List[Tuple[int, int, int, int]]:
+    return [component._extents for component in _ConnectedComponents(worksheet_df)]
+
+
+def time_function(function, worksheet_df: pd.DataFrame) -> Tuple[float, list]:
+    start_time = time.perf_counter()
+    result = function(worksheet_df)
+    return time.perf_counter() - start_time, result
+
+
+if __name__ == "__main__":
+    max_reference_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    print(f"{'rows':>8} {'subtables':>10} {'reference s':>12} {'seconds':>10}")
+    for n_rows in SIZES:
+        worksheet_df = build_worksheet(n_rows)
+        seconds, result = time_function(extents, worksheet_df)
+        reference = "-"
+        if n_rows <= max_reference_rows:
+            reference_seconds, expected = time_function(reference_extents, worksheet_df)
+            assert result == expected, f"subtables differ for {n_rows} rows"
+            reference = f"{reference_seconds:.2f}"
+        print(f"{n_rows:>8} {len(result):>10} {reference:>12} {seconds:>10.2f}")
@@ -0,0 +1,110 @@
+"""Times the XY-cut sort of synthetic pages against the recursive implementation it replaced.
+
+Pages are dense word grids laid out in columns, the shape of OCR output for a page of text, with
+some jitter so boxes overlap and leave uneven gaps. The previous implementation is kept here as the
+reference: both must return the same order for every page, for both primary directions.
+
+Usage: `PYTHONPATH=. python scripts/performance/time_xy_cut.py [ITERATIONS]`
+"""
+
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from unstructured.partition.utils.xycut import (
+    recursive_xy_cut,
+    recursive_xy_cut_swapped,
+    split_projection_profile,
+)
+
+SIZES = [100, 1000, 3000, 10000]
+
+
+def projection_by_bboxes(boxes: np.ndarray, axis: int) -> np.ndarray:
+    length = np.max(boxes[:, axis::2])
+    res = np.zeros(length, dtype=int)
+    for start, end in boxes[:, axis::2]:
+        res[start:end] += 1
+    return res
+
+
+def reference_xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int], axis: int):
+    """The recursive XY-cut, cutting along `axis` first."""
+    other_axis = 1 - axis
+    _indices = boxes[:, axis].argsort()
+    sorted_boxes = boxes[_indices]
+    sorted_indices = indices[_indices]
+    pos = split_projection_profile(projection_by_bboxes(sorted_boxes, axis), 0, 1)
+    if not pos:
+        return
+    for start, end in zip(*pos):
+        _indices = (start <= sorted_boxes[:, axis]) & (sorted_boxes[:, axis] < end)
+        chunk_boxes = sorted_boxes[_indices]
+        chunk_indices = sorted_indices[_indices]
+        _indices = chunk_boxes[:, other_axis].argsort()
+        chunk_boxes = chunk_boxes[_indices]
+        chunk_indices = chunk_indices[_indices]
+        other_pos = split_projection_profile(projection_by_bboxes(chunk_boxes, other_axis), 0, 1)
+        if not other_pos:
+            continue
+        if len(other_pos[0]) == 1:
+            res.extend(chunk_indices)
+            continue
+        for other_start, other_end in zip(*other_pos):
+            _indices = (other_start <= chunk_boxes[:, other_axis]) & (
+                chunk_boxes[:, other_axis] < other_end
+            )
+            reference_xy_cut(chunk_boxes[_indices], chunk_indices[_indices], res, axis)
+
+
+def build_page(n_words: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    n_columns = 1 + n_words // 1500
+    words_per_line = 12
+    column_width = 2400 // n_columns
+    word = np.arange(n_words)
+    column = word % n_columns
+    line = word // n_columns // words_per_line
+    left = column * column_width + (word // n_columns % words_per_line) * (column_width // 13)
+    top = line * 30
+    left = left + rng.integers(0, 8, n_words)
+    top = top + rng.integers(0, 6, n_words)
+    width = rng.integers(column_width // 40, column_width // 12, n_words)
+    height = rng.integers(16, 26, n_words)
+    return np.stack([left, top, left + width, top + height], axis=1)
+
+
+def time_sort(func: Callable, boxes: np.ndarray, iterations: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        func(boxes, np.arange(len(boxes)), [])
+    return (time.perf_counter() - start_time) / iterations
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print(f"{'direction':>9} {'boxes':>7} {'reference s':>12} {'xy_cut s':>10} {'speedup':>8}")
+    for direction, func, axis in (
+        ("x", recursive_xy_cut_swapped, 0),
+        ("y", recursive_xy_cut, 1),
+    ):
+
+        def reference(boxes, indices, res, axis=axis):
+            reference_xy_cut(boxes, indices, res, axis)
+
+        for size in SIZES:
+            boxes = build_page(size)
+            expected: List[int] = []
+            reference(boxes, np.arange(size), expected)
+            res: List[int] = []
+            func(boxes, np.arange(size), res)
+            assert res == expected, f"orders differ for {size} boxes"
+            reference_seconds = time_sort(reference, boxes, iterations)
+            seconds = time_sort(func, boxes, iterations)
+            print(
+                f"{direction:>9} {size:>7} {reference_seconds:>12.4f} {seconds:>10.4f} "
+                f"{reference_seconds / seconds:>7.1f}x",
+            )
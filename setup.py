@@ -163,6 +163,9 @@ setup(
         "slack": load_requirements("requirements/ingest/slack.txt"),
         "wikipedia": load_requirements("requirements/ingest/wikipedia.txt"),
         "weaviate": load_requirements("requirements/ingest/weaviate.txt"),
+        # Extra requirements for the intermediate files of the ingest pipeline
+        "msgpack": load_requirements("requirements/ingest/msgpack.txt"),
+        "zstd": load_requirements("requirements/ingest/zstd.txt"),
         # Legacy extra requirements
         "huggingface": load_requirements("requirements/huggingface.txt"),
         "local-inference": all_doc_reqs,
@@ -424,17 +424,27 @@ def test_process_list_item_gets_next_section():
     assert parsed_el == ListItem(text="An excellent point!")
 
 
-def test_get_bullet_descendants():
-    div_1 = "<div><p>●</p><p>●</p></div>"
-    document_tree_1 = etree.fromstring(div_1, etree.HTMLParser())
-    element = document_tree_1.find(".//div")
+def test_last_descendant():
+    document_tree = etree.fromstring(
+        "<div><p>A <b>bold</b></p><ul><li>One</li><li>Two <span>last</span></li></ul></div>",
+        etree.HTMLParser(),
+    )
+    div = document_tree.find(".//div")
+
+    assert html._last_descendant(div).text == "last"
+    assert html._last_descendant(div.find(".//p")).tag == "b"
+    assert html._last_descendant(div.find(".//span")) is div.find(".//span")
+
+
+def test_parses_large_table_once_without_repeating_cells():
+    rows = "".join(f"<tr><td>{i}</td><td>cell {i}</td></tr>" for i in range(5000))
+    doc = HTMLDocument.from_string(f"<html><body><table>{rows}</table></body></html>")
 
-    div_2 = "<div><p>An excellent point!</p></div>"
-    document_tree_2 = etree.fromstring(div_2, etree.HTMLParser())
-    next_element = document_tree_2.find(".//div")
+    elements = doc.pages[0].elements
 
-    descendants = html._get_bullet_descendants(element, next_element)
-    assert len(descendants) == 1
+    assert len(elements) == 1
+    assert isinstance(elements[0], html.HTMLTable)
+    assert elements[0].text.startswith("0 cell 0 1 cell 1")
 
 
 def test_process_list_item_returns_none_if_next_blank():
@@ -1,11 +1,13 @@
 import os
 import pathlib
 import shutil
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from unstructured.metrics import evaluate as evaluate_module
 from unstructured.metrics.evaluate import (
     filter_metrics,
     get_mean_grouping,
@@ -13,6 +15,7 @@ from unstructured.metrics.evaluate import (
     measure_table_structure_accuracy,
     measure_text_extraction_accuracy,
 )
+from unstructured.metrics.text_extraction import calculate_accuracy
 
 is_in_docker = os.path.exists("/.dockerenv")
 
@@ -171,6 +174,50 @@ def test_text_extraction_with_grouping():
     assert len(df) == 4  # metrics row and doctype rows
 
 
+@pytest.mark.skipif(is_in_docker, reason="Skipping this test in Docker container")
+def test_text_extraction_with_workers_matches_serial_evaluation(tmp_path: pathlib.Path):
+    output_dir = os.path.join(TESTING_FILE_DIR, UNSTRUCTURED_OUTPUT_DIRNAME)
+    source_dir = os.path.join(TESTING_FILE_DIR, GOLD_CCT_DIRNAME)
+    for workers in (1, 2):
+        measure_text_extraction_accuracy(
+            output_dir=output_dir,
+            source_dir=source_dir,
+            export_dir=str(tmp_path / str(workers)),
+            workers=workers,
+        )
+
+    assert (tmp_path / "2" / "all-docs-cct.tsv").read_text() == (
+        tmp_path / "1" / "all-docs-cct.tsv"
+    ).read_text()
+
+
+@pytest.mark.skipif(is_in_docker, reason="Skipping this test in Docker container")
+def test_text_extraction_reuses_cached_scores(tmp_path: pathlib.Path):
+    output_dir = os.path.join(TESTING_FILE_DIR, UNSTRUCTURED_OUTPUT_DIRNAME)
+    source_dir = os.path.join(TESTING_FILE_DIR, GOLD_CCT_DIRNAME)
+    cache_dir = str(tmp_path / "cache")
+
+    def evaluate(export_dir: str, **kwargs):
+        with patch.object(evaluate_module, "calculate_accuracy", wraps=calculate_accuracy) as spy:
+            measure_text_extraction_accuracy(
+                output_dir=output_dir,
+                source_dir=source_dir,
+                export_dir=str(tmp_path / export_dir),
+                cache_dir=cache_dir,
+                **kwargs,
+            )
+        return spy.call_count, (tmp_path / export_dir / "all-docs-cct.tsv").read_text()
+
+    calls, scores = evaluate("first")
+    cached_calls, cached_scores = evaluate("second", group_by="doctype")
+    reweighted_calls, _ = evaluate("third", weights=(2, 1, 1))
+
+    assert calls == 3
+    assert cached_calls == 0
+    assert cached_scores == scores
+    assert reweighted_calls == 3
+
+
 @pytest.mark.skipif(is_in_docker, reason="Skipping this test in Docker container")
 def test_text_extraction_wrong_type():
     output_dir = os.path.join(TESTING_FILE_DIR, UNSTRUCTURED_OUTPUT_DIRNAME)
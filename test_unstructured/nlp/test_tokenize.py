@@ -1,5 +1,5 @@
 from typing import List, Tuple
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import nltk
 
@@ -75,3 +75,34 @@ def test_tokenizers_functions_run():
     tokenize.sent_tokenize(sentence)
     tokenize.word_tokenize(sentence)
     tokenize.pos_tag(sentence)
+
+
+def test_nltk_resources_are_loaded_once(monkeypatch):
+    sentence_tokenizer = MagicMock()
+    sentence_tokenizer.tokenize.side_effect = mock_sent_tokenize
+    tagger = MagicMock()
+    tagger.tag.side_effect = mock_pos_tag
+    monkeypatch.setattr(tokenize.nltk.data, "load", MagicMock(return_value=sentence_tokenizer))
+    monkeypatch.setattr(tokenize, "PerceptronTagger", MagicMock(return_value=tagger))
+    tokenize._get_sentence_tokenizer.cache_clear()
+    tokenize._get_pos_tagger.cache_clear()
+
+    try:
+        with patch.object(nltk, "find") as mock_find:
+            tokenize.load_nltk_resources()
+            for i in range(3):
+                tokenize.sent_tokenize(f"Ask the teacher for apple {i}. Eat it.")
+                tokenize.word_tokenize(f"Ask the teacher for apple {i}. Eat it.")
+                tokenize.pos_tag(f"Ask the teacher for apple {i}. Eat it.")
+            tagged = tokenize.pos_tag_sentences([["Ask", "me"], ["Apples"]])
+    finally:
+        tokenize._get_sentence_tokenizer.cache_clear()
+        tokenize._get_pos_tagger.cache_clear()
+        tokenize.sent_tokenize.cache_clear()
+        tokenize.word_tokenize.cache_clear()
+        tokenize.pos_tag.cache_clear()
+
+    assert mock_find.call_count == 2
+    tokenize.nltk.data.load.assert_called_once_with("tokenizers/punkt/english.pickle")
+    tokenize.PerceptronTagger.assert_called_once_with()
+    assert tagged == [[("Ask", "VB"), ("me", "")], [("Apples", "")]]
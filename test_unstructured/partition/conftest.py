@@ -0,0 +1,12 @@
+import pytest
+
+from unstructured.partition.text import clear_element_class_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_element_class_cache():
+    """Keeps the element classes cached by one test, possibly with patched classification checks,
+    from leaking into the next."""
+    clear_element_class_cache()
+    yield
+    clear_element_class_cache()
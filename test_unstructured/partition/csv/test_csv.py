@@ -270,3 +270,17 @@ def test_partition_csv_header():
         == "Stanley Cups Unnamed: 1 Unnamed: 2 " + EXPECTED_TEXT_XLSX
     )
     assert "<thead>" in elements[0].metadata.text_as_html
+
+
+def test_partition_csv_emits_a_table_per_window_of_rows_with_the_header_repeated():
+    elements = partition_csv(
+        filename="example-docs/stanley-cups.csv", include_header=True, rows_per_table=2
+    )
+
+    assert [clean_extra_whitespace(e.text) for e in elements] == [
+        "Stanley Cups Unnamed: 1 Unnamed: 2 Team Location Stanley Cups Blues STL 1",
+        "Stanley Cups Unnamed: 1 Unnamed: 2 Flyers PHI 2 Maple Leafs TOR 13",
+    ]
+    assert all(isinstance(e, Table) for e in elements)
+    assert all(e.metadata.text_as_html.count("<th>") == 3 for e in elements)
+    assert all(e.metadata.filename == "stanley-cups.csv" for e in elements)
@@ -236,3 +236,14 @@ def test_partition_csv_header():
         == "Stanley Cups Unnamed: 1 Unnamed: 2 " + EXPECTED_TEXT_XLSX
     )
     assert "<thead>" in elements[0].metadata.text_as_html
+
+
+def test_partition_tsv_emits_a_table_per_window_of_rows():
+    with open("example-docs/stanley-cups.tsv", "rb") as f:
+        elements = partition_tsv(file=f, rows_per_table=3)
+
+    assert [clean_extra_whitespace(e.text) for e in elements] == [
+        "Stanley Cups Team Location Stanley Cups Blues STL 1",
+        "Flyers PHI 2 Maple Leafs TOR 13",
+    ]
+    assert all(isinstance(e, Table) for e in elements)
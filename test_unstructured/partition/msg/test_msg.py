@@ -239,6 +239,14 @@ def test_partition_msg_raises_with_no_partitioner(
         partition_msg(filename=filename, process_attachments=True)
 
 
+def test_partition_msg_without_attachments_needs_no_partitioner():
+    filename = "example-docs/fake-email.msg"
+
+    elements = partition_msg(filename=filename, process_attachments=True)
+
+    assert elements == partition_msg(filename=filename)
+
+
 def test_partition_msg_metadata_date_from_header(
     mocker,
     filename="example-docs/fake-email.msg",
@@ -0,0 +1,65 @@
+import random
+
+import numpy as np
+import pytest
+from unstructured_inference.inference.elements import Rectangle, TextRegion
+
+from unstructured.partition.pdf_image.bbox_index import BBoxIndex
+
+
+def _random_regions(rng: random.Random, n: int, integer: bool):
+    regions = []
+    for _ in range(n):
+        x1, y1 = rng.uniform(0, 1000), rng.uniform(0, 1000)
+        x2, y2 = x1 + rng.uniform(0, 300), y1 + rng.uniform(0, 60)
+        if integer:
+            x1, y1, x2, y2 = (round(v) for v in (x1, y1, x2, y2))
+        regions.append(TextRegion.from_coords(x1, y1, x2, y2, text=None))
+    return regions
+
+
+@pytest.mark.parametrize("integer", [False, True])
+@pytest.mark.parametrize("subregion_threshold", [0.0, 0.5, 0.75, -0.1])
+def test_almost_subregions_of_matches_rectangle_method(integer, subregion_threshold):
+    rng = random.Random(42)
+    regions = _random_regions(rng, 300, integer)
+    # -- include a duplicate, a zero-area box, a box touching another and one inside another --
+    regions.append(TextRegion.from_coords(*regions[0].bbox.coordinates[0], 2000, 2000))
+    regions.append(TextRegion(bbox=regions[1].bbox))
+    regions.append(TextRegion.from_coords(10, 10, 10, 50))
+    regions.append(TextRegion.from_coords(100, 100, 200, 200))
+    regions.append(TextRegion.from_coords(200, 100, 300, 200))
+    regions.append(TextRegion.from_coords(120, 120, 150, 150))
+    index = BBoxIndex.from_regions(regions)
+
+    for query in regions + _random_regions(rng, 50, integer):
+        expected = [
+            i
+            for i, region in enumerate(regions)
+            if region.bbox.is_almost_subregion_of(query.bbox, subregion_threshold)
+        ]
+        assert index.almost_subregions_of(query.bbox, subregion_threshold).tolist() == expected
+
+
+def test_any_almost_subregion_of():
+    regions = [
+        TextRegion.from_coords(0, 0, 10, 10),
+        TextRegion.from_coords(50, 50, 60, 60),
+        TextRegion.from_coords(95, 0, 120, 10),
+    ]
+    index = BBoxIndex.from_regions(regions)
+
+    mask = index.any_almost_subregion_of(
+        [Rectangle(0, 0, 100, 20), Rectangle(40, 40, 45, 45)],
+        subregion_threshold=0.5,
+    )
+
+    assert mask.tolist() == [True, False, False]
+
+
+def test_empty_index():
+    index = BBoxIndex.from_regions([])
+
+    assert len(index) == 0
+    assert index.almost_subregions_of(Rectangle(0, 0, 10, 10), 0.5).tolist() == []
+    assert index.any_almost_subregion_of([Rectangle(0, 0, 10, 10)], 0.5).dtype == np.bool_
@@ -13,7 +13,7 @@ from test_unstructured.unit_utils import assert_round_trips_through_JSON, exampl
 from unstructured.chunking.title import chunk_by_title
 from unstructured.documents.elements import ElementType
 from unstructured.partition import image, pdf
-from unstructured.partition.pdf_image import ocr
+from unstructured.partition.pdf_image import inference_utils, ocr
 from unstructured.partition.utils.constants import (
     UNSTRUCTURED_INCLUDE_DEBUG_METADATA,
     PartitionStrategy,
@@ -95,13 +95,8 @@ class MockDocumentLayout(layout.DocumentLayout):
 )
 def test_partition_image_local(monkeypatch, filename, file):
     monkeypatch.setattr(
-        layout,
-        "process_data_with_model",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
-    monkeypatch.setattr(
-        layout,
-        "process_file_with_model",
+        inference_utils,
+        "process_page_images_with_model",
         lambda *args, **kwargs: MockDocumentLayout(),
     )
     monkeypatch.setattr(
@@ -682,7 +677,7 @@ def test_partition_image_has_filename(inference_results):
     filename = "layout-parser-paper-fast.jpg"
     # Mock inference call with known return results
     with mock.patch(
-        "unstructured_inference.inference.layout.process_file_with_model",
+        "unstructured.partition.pdf_image.inference_utils.process_page_images_with_model",
         return_value=inference_results,
     ) as mock_inference_func:
         elements = image.partition_image(
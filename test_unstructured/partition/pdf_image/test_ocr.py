@@ -1,3 +1,7 @@
+import functools
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import patch
 
 import numpy as np
@@ -7,11 +11,12 @@ import unstructured_pytesseract
 from pdf2image.exceptions import PDFPageCountError
 from PIL import Image, UnidentifiedImageError
 from unstructured_inference.inference.elements import EmbeddedTextRegion, TextRegion
-from unstructured_inference.inference.layout import DocumentLayout
+from unstructured_inference.inference.layout import DocumentLayout, PageLayout
 from unstructured_inference.inference.layoutelement import (
     LayoutElement,
 )
 
+from test_unstructured.unit_utils import example_doc_path
 from unstructured.documents.elements import ElementType
 from unstructured.partition.pdf_image import ocr
 from unstructured.partition.pdf_image.ocr import pad_element_bboxes
@@ -405,3 +410,86 @@ def test_merge_out_layout_with_cid_code(mock_out_layout, mock_ocr_regions):
     # Check if the final layout contains both original elements and OCR-derived elements
     assert all(element in final_layout for element in mock_out_layout)
     assert any(element in final_layout for element in ocr_elements)
+
+
+def _slow_page(page_number, image):
+    # later pages finish first, so results come back out of order from the pool
+    time.sleep(0.05 * (4 - page_number))
+    return page_number, image.format
+
+
+@pytest.mark.parametrize("ocr_workers", [1, 3])
+def test_map_over_pages_generates_results_in_page_order(ocr_workers):
+    pages_kwargs = []
+    for page_number in range(1, 4):
+        image = Image.new("RGB", (10, 10))
+        image.format = "PNG"
+        pages_kwargs.append({"page_number": page_number, "image": image})
+
+    results = list(ocr.map_over_pages(_slow_page, pages_kwargs, ocr_workers=ocr_workers))
+
+    assert results == [(1, "PNG"), (2, "PNG"), (3, "PNG")]
+
+
+def test_map_over_pages_defaults_to_ocr_workers_env_var(monkeypatch):
+    monkeypatch.setenv("OCR_WORKERS", "2")
+    with patch.object(ocr, "ProcessPoolExecutor", wraps=ocr.ProcessPoolExecutor) as mock_pool:
+        list(ocr.map_over_pages(_slow_page, [{"page_number": 3, "image": Image.new("1", (1, 1))}]))
+
+    mock_pool.assert_called_once_with(max_workers=2)
+
+
+class _ErrorWithRequiredArgs(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def _failing_page(page_number, image):
+    raise _ErrorWithRequiredArgs(page_number, f"page {page_number} failed")
+
+
+def test_map_over_pages_reraises_worker_errors_with_their_message():
+    pages_kwargs = [{"page_number": 1, "image": Image.new("1", (1, 1))}]
+
+    with pytest.raises(ocr.OCRWorkerError, match="_ErrorWithRequiredArgs: page 1 failed"):
+        list(ocr.map_over_pages(_failing_page, pages_kwargs, ocr_workers=2))
+
+
+class MockOCRAgent:
+    def get_layout_from_image(self, image, ocr_languages="eng"):
+        return [
+            TextRegion.from_coords(0, 0, 50, 10, text=f"{image.format} {image.size}", source=None),
+        ]
+
+
+def test_process_file_with_ocr_in_parallel_matches_serial(monkeypatch):
+    monkeypatch.setattr(ocr, "get_ocr_agent", MockOCRAgent)
+    # -- forked workers see the patched agent whatever the default start method is --
+    monkeypatch.setattr(
+        ocr,
+        "ProcessPoolExecutor",
+        functools.partial(ProcessPoolExecutor, mp_context=mp.get_context("fork")),
+    )
+    filename = example_doc_path("layout-parser-paper-combined.tiff")
+
+    def ocr_text_by_page(ocr_workers):
+        out_layout = DocumentLayout.from_pages(
+            [
+                PageLayout(number=number, image=Image.new("1", (1, 1)))
+                for number in range(Image.open(filename).n_frames)
+            ]
+        )
+        document_layout = ocr.process_file_with_ocr(
+            filename=filename,
+            out_layout=out_layout,
+            extracted_layout=[],
+            is_image=True,
+            ocr_workers=ocr_workers,
+        )
+        return [[el.text for el in page.elements] for page in document_layout.pages]
+
+    serial_text = ocr_text_by_page(ocr_workers=1)
+
+    assert serial_text == [["TIFF (612, 792)"], ["TIFF (791, 1024)"]]
+    assert ocr_text_by_page(ocr_workers=2) == serial_text
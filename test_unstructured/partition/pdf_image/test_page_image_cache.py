@@ -0,0 +1,128 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.documents.coordinates import PixelSpace
+from unstructured.documents.elements import ElementMetadata, ElementType
+from unstructured.documents.elements import Image as ImageElement
+from unstructured.partition.pdf_image import pdf_image_utils
+from unstructured.partition.pdf_image.page_image_cache import PageImageCache, PageImageStage
+
+
+def _fake_convert_from_path(filename, dpi, first_page, last_page, output_folder, paths_only):
+    image_path = os.path.join(output_folder, f"page-{first_page}.ppm")
+    Image.new("RGB", (dpi, dpi)).save(image_path)
+    return [image_path]
+
+
+@pytest.fixture()
+def mock_convert_from_path():
+    with patch(
+        "unstructured.partition.pdf_image.page_image_cache.pdf2image.convert_from_path",
+        side_effect=_fake_convert_from_path,
+    ) as mock_convert:
+        yield mock_convert
+
+
+def test_page_image_cache_renders_each_page_once(mock_convert_from_path):
+    with PageImageCache(filename="fake.pdf", dpi=50) as page_image_cache:
+        first_path = page_image_cache.get_image_path(1)
+        image = page_image_cache.get_image(1)
+        assert page_image_cache.get_image_path(1) == first_path
+        page_image_cache.get_image(2)
+
+    assert image.size == (50, 50)
+    assert mock_convert_from_path.call_count == 2
+    assert [c.kwargs["first_page"] for c in mock_convert_from_path.call_args_list] == [1, 2]
+
+
+def test_page_image_cache_evicts_page_once_every_stage_released_it(mock_convert_from_path):
+    stages = [PageImageStage.LAYOUT, PageImageStage.OCR]
+    with PageImageCache(filename="fake.pdf", stages=stages) as page_image_cache:
+        image_path = page_image_cache.get_image_path(1)
+
+        page_image_cache.release(1, PageImageStage.LAYOUT)
+        assert os.path.isfile(image_path)
+        assert page_image_cache.cached_page_numbers == {1}
+
+        page_image_cache.release(1, PageImageStage.OCR)
+        assert not os.path.isfile(image_path)
+        assert page_image_cache.cached_page_numbers == set()
+
+
+def test_page_image_cache_release_all_counts_for_pages_not_yet_rendered(mock_convert_from_path):
+    stages = [PageImageStage.LAYOUT, PageImageStage.IMAGE_BLOCK_EXTRACTION]
+    with PageImageCache(filename="fake.pdf", stages=stages) as page_image_cache:
+        page_image_cache.release_all(PageImageStage.IMAGE_BLOCK_EXTRACTION)
+        page_image_cache.get_image_path(3)
+        page_image_cache.release(3, PageImageStage.LAYOUT)
+
+        assert page_image_cache.cached_page_numbers == set()
+
+
+def test_page_image_cache_keeps_pages_without_registered_stages(mock_convert_from_path):
+    with PageImageCache(filename="fake.pdf") as page_image_cache:
+        image_path = page_image_cache.get_image_path(1)
+        page_image_cache.release(1, PageImageStage.LAYOUT)
+        assert os.path.isfile(image_path)
+
+    assert not os.path.isfile(image_path)
+
+
+def test_page_image_cache_reads_image_frames():
+    filename = example_doc_path("layout-parser-paper-combined.tiff")
+    with PageImageCache(filename=filename, is_image=True) as page_image_cache:
+        assert page_image_cache.number_of_pages == 2
+        image = page_image_cache.get_image(2)
+
+    assert image.mode == "RGB"
+    assert image.format == "TIFF"
+
+
+def test_page_image_cache_from_file():
+    filename = example_doc_path("layout-parser-paper-fast.jpg")
+    with open(filename, "rb") as f, PageImageCache(file=f, is_image=True) as page_image_cache:
+        assert page_image_cache.filename != filename
+        assert page_image_cache.number_of_pages == 1
+        assert page_image_cache.get_image(1).format == "JPEG"
+        assert f.tell() == 0
+
+    assert not os.path.exists(page_image_cache.filename)
+
+
+def test_page_image_cache_raises_with_missing_file():
+    with PageImageCache(filename="i am not a valid file name") as page_image_cache:
+        with pytest.raises(FileNotFoundError):
+            page_image_cache.number_of_pages
+
+
+def test_save_elements_reads_from_page_image_cache():
+    filename = example_doc_path("layout-parser-paper-fast.jpg")
+    elements = [
+        ImageElement(
+            text="Image Text 1",
+            coordinates=((78, 86), (78, 519), (512, 519), (512, 86)),
+            coordinate_system=PixelSpace(width=1575, height=1166),
+            metadata=ElementMetadata(page_number=1),
+        ),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir, PageImageCache(
+        filename=filename, is_image=True
+    ) as page_image_cache, patch.object(
+        pdf_image_utils, "convert_pdf_to_image"
+    ) as mock_convert_pdf_to_image:
+        pdf_image_utils.save_elements(
+            elements=elements,
+            element_category_to_save=ElementType.IMAGE,
+            pdf_image_dpi=200,
+            output_dir_path=tmpdir,
+            page_image_cache=page_image_cache,
+        )
+
+        mock_convert_pdf_to_image.assert_not_called()
+        assert os.path.isfile(elements[0].metadata.image_path)
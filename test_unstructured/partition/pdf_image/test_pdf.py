@@ -27,7 +27,8 @@ from unstructured.documents.elements import (
 )
 from unstructured.partition import pdf, strategies
 from unstructured.partition.pdf import get_uris_from_annots
-from unstructured.partition.pdf_image import ocr, pdfminer_processing
+from unstructured.partition.pdf_image import inference_utils, ocr, pdfminer_processing
+from unstructured.partition.pdf_image.page_image_cache import PageImageCache
 from unstructured.partition.utils.constants import (
     UNSTRUCTURED_INCLUDE_DEBUG_METADATA,
     PartitionStrategy,
@@ -107,13 +108,8 @@ class MockDocumentLayout(layout.DocumentLayout):
 )
 def test_partition_pdf_local(monkeypatch, filename, file):
     monkeypatch.setattr(
-        layout,
-        "process_data_with_model",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
-    monkeypatch.setattr(
-        layout,
-        "process_file_with_model",
+        inference_utils,
+        "process_page_images_with_model",
         lambda *args, **kwargs: MockDocumentLayout(),
     )
     monkeypatch.setattr(
@@ -196,8 +192,8 @@ def test_partition_pdf_with_model_name_env_var(
 ):
     monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
     with mock.patch.object(
-        layout,
-        "process_file_with_model",
+        inference_utils,
+        "process_page_images_with_model",
         mock.MagicMock(),
     ) as mock_process:
         pdf.partition_pdf(filename=filename, strategy=PartitionStrategy.HI_RES)
@@ -212,8 +208,8 @@ def test_partition_pdf_with_model_name(
 ):
     monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
     with mock.patch.object(
-        layout,
-        "process_file_with_model",
+        inference_utils,
+        "process_page_images_with_model",
         mock.MagicMock(),
     ) as mock_process:
         pdf.partition_pdf(
@@ -224,8 +220,8 @@ def test_partition_pdf_with_model_name(
         assert mock_process.call_args[1]["model_name"] == model_name
 
     with mock.patch.object(
-        layout,
-        "process_data_with_model",
+        inference_utils,
+        "process_page_images_with_model",
         mock.MagicMock(),
     ) as mock_process:
         with open(filename, "rb") as f:
@@ -243,8 +239,8 @@ def test_partition_pdf_with_hi_res_model_name(
 ):
     monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
     with mock.patch.object(
-        layout,
-        "process_file_with_model",
+        inference_utils,
+        "process_page_images_with_model",
         mock.MagicMock(),
     ) as mock_process:
         pdf.partition_pdf(
@@ -260,8 +256,8 @@ def test_partition_pdf_or_image_with_hi_res_model_name(
 ):
     monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
     with mock.patch.object(
-        layout,
-        "process_file_with_model",
+        inference_utils,
+        "process_page_images_with_model",
         mock.MagicMock(),
     ) as mock_process:
         pdf.partition_pdf_or_image(
@@ -544,9 +540,12 @@ def test_partition_pdf_with_copy_protection():
 
 def test_partition_pdf_with_dpi():
     filename = os.path.join("example-docs", "copy-protected.pdf")
-    with mock.patch.object(layout, "process_file_with_model", mock.MagicMock()) as mock_process:
+    with mock.patch.object(
+        inference_utils, "process_page_images_with_model", mock.MagicMock()
+    ) as mock_process:
         pdf.partition_pdf(filename=filename, strategy=PartitionStrategy.HI_RES, pdf_image_dpi=100)
-        assert mock_process.call_args[1]["pdf_image_dpi"] == 100
+        page_image_cache = mock_process.call_args[0][0]
+        assert page_image_cache.dpi == 100
 
 
 def test_partition_pdf_requiring_recursive_text_grab(filename=example_doc_path("reliance.pdf")):
@@ -1230,3 +1229,77 @@ def test_partition_pdf_always_keep_all_image_elements(
     )
     image_elements = [el for el in elements if el.category == ElementType.IMAGE]
     assert len(image_elements) == 3
+
+
+def _mock_iter_page_layouts_with_model(page_image_cache, model_name, **kwargs):
+    for page_number in range(1, page_image_cache.number_of_pages + 1):
+        page = layout.PageLayout(
+            number=page_number, image=Image.new("RGB", (100, 100)), image_metadata={}
+        )
+        page.elements = [
+            layout.LayoutElement.from_coords(
+                type="Title", x1=0, y1=0, x2=50, y2=10, text=f"Title of page {page_number}"
+            ),
+            layout.LayoutElement.from_coords(
+                type="Text", x1=0, y1=20, x2=50, y2=30, text=f"Text of page {page_number}"
+            ),
+        ]
+        yield page
+
+
+@pytest.fixture()
+def _mock_three_page_hi_res(monkeypatch):
+    monkeypatch.setattr(
+        inference_utils, "iter_page_layouts_with_model", _mock_iter_page_layouts_with_model
+    )
+    monkeypatch.setattr(
+        ocr, "supplement_page_layout_with_ocr", lambda page_layout, **kwargs: page_layout
+    )
+    monkeypatch.setattr(PageImageCache, "number_of_pages", 3)
+    monkeypatch.setattr(PageImageCache, "get_image", lambda self, page: Image.new("RGB", (1, 1)))
+    monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
+    monkeypatch.setattr(pdf, "_pdf_has_extractable_text", lambda *args, **kwargs: False)
+
+
+@pytest.mark.usefixtures("_mock_three_page_hi_res")
+@pytest.mark.parametrize("include_page_breaks", [False, True])
+def test_partition_pdf_iter_matches_partition_pdf_hi_res(include_page_breaks):
+    filename = example_doc_path("layout-parser-paper-fast.pdf")
+
+    elements = pdf.partition_pdf(
+        filename=filename,
+        strategy=PartitionStrategy.HI_RES,
+        include_page_breaks=include_page_breaks,
+    )
+    streamed_elements = list(
+        pdf.partition_pdf_iter(filename=filename, include_page_breaks=include_page_breaks)
+    )
+
+    assert [el.metadata.page_number for el in elements if el.metadata.page_number] == [
+        1,
+        1,
+        2,
+        2,
+        3,
+        3,
+    ]
+    assert [el.to_dict() for el in streamed_elements] == [el.to_dict() for el in elements]
+
+
+@pytest.mark.usefixtures("_mock_three_page_hi_res")
+def test_partition_pdf_iter_generates_a_page_before_inferring_the_next():
+    inferred_pages = []
+
+    def iter_page_layouts(page_image_cache, model_name, **kwargs):
+        for page in _mock_iter_page_layouts_with_model(page_image_cache, model_name, **kwargs):
+            inferred_pages.append(page.number)
+            yield page
+
+    with mock.patch.object(inference_utils, "iter_page_layouts_with_model", iter_page_layouts):
+        elements = pdf.partition_pdf_iter(filename=example_doc_path("layout-parser-paper-fast.pdf"))
+        first_element = next(elements)
+
+        assert first_element.text == "Title of page 1"
+        assert inferred_pages == [1]
+        assert len(list(elements)) == 5
+        assert inferred_pages == [1, 2, 3]
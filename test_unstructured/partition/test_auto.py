@@ -1,6 +1,8 @@
 import json
 import os
 import pathlib
+import subprocess
+import sys
 import tempfile
 import warnings
 from importlib import import_module
@@ -1058,6 +1060,30 @@ def test_get_partition_with_extras_prompts_for_install_if_missing():
     assert 'Install the pdf dependencies with pip install "unstructured[pdf]"' in msg
 
 
+def test_get_partition_with_extras_imports_partitioner_on_first_use(monkeypatch):
+    monkeypatch.setattr(auto, "PARTITION_WITH_EXTRAS_MAP", {})
+
+    partition_csv = _get_partition_with_extras("csv")
+
+    assert partition_csv is import_module("unstructured.partition.csv").partition_csv
+    assert auto.PARTITION_WITH_EXTRAS_MAP["csv"] is partition_csv
+
+
+def test_importing_auto_does_not_import_partitioners():
+    code = (
+        "import sys; from unstructured.partition.auto import partition; "
+        "print([m for m in ('unstructured.partition.pdf', 'unstructured.partition.html', "
+        "'unstructured.partition.email', 'pandas', 'docx', 'pptx', 'pdfminer') "
+        "if m in sys.modules])"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
 def test_add_chunking_strategy_on_partition_auto():
     filename = "example-docs/example-10k-1p.html"
     elements = partition(filename)
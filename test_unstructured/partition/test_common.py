@@ -435,6 +435,29 @@ def test_set_element_hierarchy_custom_rule_set():
     ), "FigureCaption should be child of Title 2"
 
 
+def test_set_element_hierarchy_with_shared_stack_matches_a_single_pass():
+    def make_elements():
+        return [
+            Title(text="Title", element_id="0"),
+            NarrativeText(text="NarrativeText", element_id="1"),
+            ListItem(text="ListItem", element_id="2"),
+            ListItem(text="ListItem", element_id="3", metadata=ElementMetadata(category_depth=1)),
+            Title(text="Title 2", element_id="4"),
+            Text(text="Text", element_id="5"),
+        ]
+
+    elements = common.set_element_hierarchy(make_elements())
+
+    stack = []
+    batched_elements = make_elements()
+    for batch in (batched_elements[:3], batched_elements[3:5], batched_elements[5:]):
+        common.set_element_hierarchy(batch, stack=stack)
+
+    assert [e.metadata.parent_id for e in batched_elements] == [
+        e.metadata.parent_id for e in elements
+    ]
+
+
 @dataclass
 class MockImage:
     width = 640
@@ -463,6 +486,39 @@ def test_document_to_element_list_handles_parent():
     assert el2.metadata.parent_id == el1.id
 
 
+def test_document_to_element_list_handles_deep_hierarchies():
+    blocks = [LayoutElement.from_coords(1, 2, 3, 4, text="block 0", type="Title")]
+    for i in range(1, 50):
+        blocks.append(
+            LayoutElement.from_coords(
+                1, 2, 3, 4, text=f"block {i}", parent=blocks[-1], type="NarrativeText"
+            ),
+        )
+    page = PageLayout(number=1, image=MockImage())
+    # -- children listed before their parents still resolve --
+    page.elements = list(reversed(blocks))
+    doc = DocumentLayout.from_pages([page])
+
+    elements = common.document_to_element_list(doc)
+
+    assert elements[-1].metadata.parent_id is None
+    assert all(
+        child.metadata.parent_id == parent.id for child, parent in zip(elements, elements[1:])
+    )
+
+
+def test_document_to_element_list_raises_when_parent_is_not_on_the_page():
+    orphan_parent = LayoutElement.from_coords(1, 2, 3, 4, text="parent", type="Title")
+    block = LayoutElement.from_coords(
+        1, 2, 3, 4, text="block", parent=orphan_parent, type="NarrativeText"
+    )
+    page = PageLayout(number=1, image=MockImage())
+    page.elements = [block]
+
+    with pytest.raises(ValueError):
+        common.document_to_element_list(DocumentLayout.from_pages([page]))
+
+
 @pytest.mark.parametrize(
     ("sort_mode", "call_count"),
     [(SORT_MODE_DONT, 0), (SORT_MODE_BASIC, 1), (SORT_MODE_XY_CUT, 1)],
@@ -2,6 +2,7 @@ import datetime
 import email
 import os
 import pathlib
+from unittest.mock import Mock
 
 import pytest
 
@@ -29,6 +30,7 @@ from unstructured.documents.email_elements import (
 from unstructured.partition.email import (
     convert_to_iso_8601,
     extract_attachment_info,
+    partition_attachments,
     partition_email,
     partition_email_header,
 )
@@ -535,6 +537,14 @@ def test_partition_msg_raises_with_no_partitioner(
         partition_email(filename=filename, process_attachments=True)
 
 
+def test_partition_email_without_attachments_needs_no_partitioner():
+    filename = "example-docs/eml/fake-email.eml"
+
+    elements = partition_email(filename=filename, process_attachments=True)
+
+    assert elements == partition_email(filename=filename)
+
+
 def test_partition_email_metadata_date_from_header(
     mocker,
     filename="example-docs/eml/fake-email-attachment.eml",
@@ -660,3 +670,64 @@ def test_partition_eml_add_signature_to_metadata():
     assert len(elements) == 1
     assert elements[0].text == "This is a test"
     assert elements[0].metadata.signature == "<SIGNATURE>\n"
+
+
+def _partition_attachment_bytes(file, metadata_filename=None, **kwargs):
+    return [Text(file.read().decode()), Text(f"size {len(file.getvalue())}")]
+
+
+def _attachments():
+    return [
+        {"filename": "logo.txt", "payload": b"logo"},
+        {"filename": "report.txt", "payload": b"quarterly report"},
+        {"filename": "logo-again.txt", "payload": b"logo"},
+        {"filename": "empty-part.txt", "payload": None},
+    ]
+
+
+def test_partition_attachments_partitions_identical_payloads_once():
+    attachment_partitioner = Mock(wraps=_partition_attachment_bytes)
+
+    elements = partition_attachments(
+        _attachments(),
+        attachment_partitioner,
+        attached_to_filename="mail.eml",
+    )
+
+    assert attachment_partitioner.call_count == 2
+    assert [(e.text, e.metadata.filename) for e in elements] == [
+        ("logo", "logo.txt"),
+        ("size 4", "logo.txt"),
+        ("quarterly report", "report.txt"),
+        ("size 16", "report.txt"),
+        ("logo", "logo-again.txt"),
+        ("size 4", "logo-again.txt"),
+    ]
+    assert all(e.metadata.attached_to_filename == "mail.eml" for e in elements)
+    assert elements[0] is not elements[4]
+
+
+def test_partition_attachments_with_workers_matches_serial():
+    serial = partition_attachments(_attachments(), _partition_attachment_bytes, "mail.eml")
+
+    parallel = partition_attachments(
+        _attachments(),
+        _partition_attachment_bytes,
+        "mail.eml",
+        attachment_workers=2,
+    )
+
+    assert [e.to_dict() for e in parallel] == [e.to_dict() for e in serial]
+
+
+def test_partition_attachments_passes_a_temporary_file_to_filename_only_partitioners():
+    def partition_file(filename, **kwargs):
+        with open(filename, "rb") as f:
+            return [Text(f"{os.path.basename(filename)}: {f.read().decode()}")]
+
+    elements = partition_attachments(_attachments()[:2], partition_file, "mail.eml")
+
+    assert [(e.text, e.metadata.filename) for e in elements] == [
+        ("logo.txt: logo", "logo.txt"),
+        ("report.txt: quarterly report", "report.txt"),
+    ]
@@ -11,13 +11,30 @@ from typing import Optional, Type
 import pytest
 from pytest_mock import MockerFixture
 
+from test_unstructured.nlp.mock_nltk import mock_pos_tag, mock_sent_tokenize, mock_word_tokenize
 from test_unstructured.unit_utils import assert_round_trips_through_JSON, example_doc_path
 from unstructured.chunking.title import chunk_by_title
 from unstructured.cleaners.core import group_broken_paragraphs
-from unstructured.documents.elements import Address, ListItem, NarrativeText, Title
+from unstructured.documents.coordinates import PixelSpace
+from unstructured.documents.elements import (
+    Address,
+    EmailAddress,
+    Footer,
+    Header,
+    ListItem,
+    NarrativeText,
+    Text,
+    Title,
+)
+from unstructured.partition import text as text_module
+from unstructured.partition import text_type
 from unstructured.partition.text import (
     _combine_paragraphs_less_than_min,
     _split_content_to_fit_max,
+    clear_element_class_cache,
+    element_classes_from_texts,
+    element_from_text,
+    elements_from_texts,
     partition_text,
 )
 from unstructured.partition.utils.constants import UNSTRUCTURED_INCLUDE_DEBUG_METADATA
@@ -575,3 +592,108 @@ def test_partition_text_detects_more_than_3_languages():
         {element.metadata.languages[0] for element in elements if element.metadata.languages},
     )
     assert len(langs) > 10
+
+
+# -- batch classification --------------------------------------------------------------------
+
+
+@pytest.fixture()
+def mock_nlp(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture):
+    monkeypatch.setattr(text_type, "sent_tokenize", mock_sent_tokenize)
+    monkeypatch.setattr(text_type, "word_tokenize", mock_word_tokenize)
+    monkeypatch.setattr(text_type, "pos_tag", mock_pos_tag)
+    monkeypatch.setattr(text_module, "_element_class_cache", text_module.OrderedDict())
+    return mocker.patch.object(
+        text_type,
+        "pos_tag_sentences",
+        side_effect=lambda sentences: [mock_pos_tag(" ".join(tokens)) for tokens in sentences],
+    )
+
+
+BATCH_TEXTS = [
+    "Ask the teacher for an apple",
+    "An apple for the teacher",
+    "• Hamburgers are delicious",
+    "Doylestown, PA 18901",
+    "fake@example.com",
+    "1. Take the test",
+    "Important points:",
+    "Ask the teacher for an apple",
+    "12345 67890 12345 67890",
+]
+
+
+def test_elements_from_texts_matches_element_from_text(mock_nlp):
+    coordinates = [((0, y), (0, y + 5), (10, y + 5), (10, y)) for y in range(0, 81, 10)]
+    coordinates[-1] = ((0, 95), (0, 99), (10, 99), (10, 95))
+    coordinate_system = PixelSpace(width=100, height=100)
+
+    elements = elements_from_texts(BATCH_TEXTS, coordinates, coordinate_system)
+
+    assert elements == [
+        element_from_text(text, points, coordinate_system)
+        for text, points in zip(BATCH_TEXTS, coordinates)
+    ]
+    assert [type(e) for e in elements] == [
+        Header,
+        Title,
+        ListItem,
+        Address,
+        EmailAddress,
+        ListItem,
+        Title,
+        NarrativeText,
+        Footer,
+    ]
+    assert elements[2].text == "Hamburgers are delicious"
+
+
+def test_element_classes_from_texts_tags_verbs_once_per_batch(mock_nlp):
+    assert element_classes_from_texts(BATCH_TEXTS) == [
+        NarrativeText,
+        Title,
+        ListItem,
+        Address,
+        EmailAddress,
+        ListItem,
+        Title,
+        NarrativeText,
+        Text,
+    ]
+    mock_nlp.assert_called_once()
+
+
+def test_element_classes_from_texts_caches_classes(mock_nlp, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(text_module, "ELEMENT_CLASS_CACHE_MAX_SIZE", 2)
+    element_classes_from_texts(["Ask the teacher for an apple", "An apple for the teacher"])
+    mock_nlp.reset_mock()
+
+    assert element_classes_from_texts(["Ask the teacher for an apple"]) == [NarrativeText]
+    mock_nlp.assert_not_called()
+
+    element_classes_from_texts(["Hello there"])
+    assert list(text_module._element_class_cache) == [
+        ("Ask the teacher for an apple", (None,) * 5),
+        ("Hello there", (None,) * 5),
+    ]
+
+
+def test_clear_element_class_cache_makes_texts_be_classified_again(
+    mock_nlp, monkeypatch: pytest.MonkeyPatch
+):
+    assert element_classes_from_texts(["Ask the teacher for an apple"]) == [NarrativeText]
+    monkeypatch.setattr(text_module, "is_possible_narrative_text", lambda text: False)
+    assert element_classes_from_texts(["Ask the teacher for an apple"]) == [NarrativeText]
+
+    clear_element_class_cache()
+
+    assert element_classes_from_texts(["Ask the teacher for an apple"]) == [Title]
+
+
+def test_element_classes_from_texts_cache_respects_env_vars(
+    mock_nlp, monkeypatch: pytest.MonkeyPatch
+):
+    assert element_classes_from_texts(["Ask the teacher for an apple"]) == [NarrativeText]
+
+    monkeypatch.setenv("UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD", "0.1")
+    assert element_classes_from_texts(["Ask the teacher for an apple"]) == [Title]
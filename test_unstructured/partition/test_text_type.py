@@ -322,3 +322,40 @@ def test_is_email_address(text, expected):
 def test_under_non_alpha_ratio_zero_divide():
     # Threw an error before changes
     text_type.under_non_alpha_ratio(" ")
+
+
+def _mock_pos_tag_sentences(sentences):
+    return [mock_pos_tag(" ".join(tokens)) for tokens in sentences]
+
+
+def test_tag_verbs_tags_all_texts_at_once_and_contains_verb_reuses_the_tags(monkeypatch):
+    monkeypatch.setattr(text_type, "sent_tokenize", mock_sent_tokenize)
+    monkeypatch.setattr(text_type, "word_tokenize", mock_word_tokenize)
+    with patch.object(
+        text_type,
+        "pos_tag_sentences",
+        side_effect=_mock_pos_tag_sentences,
+    ) as pos_tag_sentences, patch.object(text_type, "pos_tag") as pos_tag:
+        with text_type.batch_text_features():
+            text_type.tag_verbs(["Ask the teacher", "An apple", "ASK AGAIN"])
+
+            assert text_type.contains_verb("Ask the teacher") is True
+            assert text_type.contains_verb("An apple") is False
+            assert text_type.contains_verb("ASK AGAIN") is True
+
+    pos_tag_sentences.assert_called_once()
+    pos_tag.assert_not_called()
+
+
+def test_narrative_text_needs_verb(monkeypatch):
+    monkeypatch.setattr(text_type, "sent_tokenize", mock_sent_tokenize)
+    monkeypatch.setattr(text_type, "word_tokenize", mock_word_tokenize)
+
+    assert text_type.narrative_text_needs_verb("Ask the teacher for an apple") is True
+    assert text_type.narrative_text_needs_verb("1234") is False
+    assert (
+        text_type.narrative_text_needs_verb(
+            "Ask the teacher for an apple. Then eat the apple with care.",
+        )
+        is False
+    )
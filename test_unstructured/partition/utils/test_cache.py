@@ -0,0 +1,120 @@
+import os
+import pickle
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from unstructured.documents.elements import Element, ElementMetadata, NarrativeText, Title
+from unstructured.partition import auto
+from unstructured.partition.auto import partition
+from unstructured.partition.utils.cache import (
+    PartitionCacheBackend,
+    cache_partition,
+    get_partition_cache,
+)
+from unstructured.staging.base import elements_to_json
+
+
+@pytest.fixture(params=[PartitionCacheBackend.DISK, PartitionCacheBackend.SQLITE])
+def cache_path(request, tmp_path: Path):
+    get_partition_cache.cache_clear()
+    path = tmp_path / "cache"
+    if request.param == PartitionCacheBackend.SQLITE:
+        path = path / "cache.db"
+    return lambda max_size=1024**2: get_partition_cache(
+        path=str(path),
+        backend=request.param,
+        max_size=max_size,
+    )
+
+
+def test_cache_evicts_the_least_recently_used_results(cache_path):
+    cache = cache_path(max_size=25)
+
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+    assert cache.get("a") == b"a" * 10
+    cache.put("c", b"c" * 10)
+
+    assert cache.get("a") == b"a" * 10
+    assert cache.get("b") is None
+    assert cache.get("c") == b"c" * 10
+
+
+def test_cache_can_be_used_in_another_process(cache_path):
+    cache = cache_path()
+    cache.put("a", b"result")
+
+    assert pickle.loads(pickle.dumps(cache)).get("a") == b"result"
+
+
+@pytest.fixture()
+def json_files(tmp_path: Path) -> List[str]:
+    content = elements_to_json([Title("Hello"), NarrativeText("Some text in the document.")])
+    paths = []
+    for directory, name in (("a", "one.json"), ("b", "two.json")):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / name).write_text(content)
+        paths.append(str(tmp_path / directory / name))
+    os.utime(paths[1], (0, 0))
+    return paths
+
+
+def test_partition_partitions_the_same_bytes_once(cache_path, json_files: List[str]):
+    cache = cache_path()
+
+    with patch.object(auto, "_get_partition_func", wraps=auto._get_partition_func) as get_func:
+        elements = partition(filename=json_files[0], partition_cache=cache)
+        cached_elements = partition(filename=json_files[1], partition_cache=cache)
+
+    assert get_func.call_count == 1
+    assert [e.text for e in cached_elements] == [e.text for e in elements]
+    assert [e.id for e in cached_elements] == [e.id for e in elements]
+    assert cached_elements == partition(filename=json_files[1])
+
+
+def test_partition_results_depend_on_the_options(cache_path, json_files: List[str]):
+    cache = cache_path()
+
+    with patch.object(auto, "_get_partition_func", wraps=auto._get_partition_func) as get_func:
+        partition(filename=json_files[0], partition_cache=cache)
+        partition(filename=json_files[0], partition_cache=cache, languages=["fra"])
+        # -- options that can't be serialized aren't cached --
+        partition(filename=json_files[0], partition_cache=cache, paragraph_grouper=str.strip)
+        partition(filename=json_files[0], partition_cache=cache, paragraph_grouper=str.strip)
+
+    assert get_func.call_count == 4
+
+
+def test_cache_partition_keeps_metadata_derived_from_the_content(cache_path, tmp_path: Path):
+    cache = cache_path()
+    calls = []
+
+    @cache_partition
+    def partition_email(filename: Optional[str] = None, **kwargs) -> List[Element]:
+        calls.append(filename)
+        return [
+            Title("Subject", metadata=ElementMetadata(filename=filename)),
+            NarrativeText(
+                "Attached.",
+                metadata=ElementMetadata(
+                    filename="report.pdf",
+                    last_modified="2020-01-01",
+                    attached_to_filename=filename,
+                ),
+            ),
+        ]
+
+    for name in ("one.eml", "two.eml"):
+        (tmp_path / name).write_bytes(b"email")
+    partition_email(filename=str(tmp_path / "one.eml"), partition_cache=cache)
+    elements = partition_email(filename=str(tmp_path / "two.eml"), partition_cache=cache)
+
+    assert len(calls) == 1
+    assert elements[0].metadata.filename == "two.eml"
+    assert elements[0].metadata.file_directory == str(tmp_path)
+    assert elements[1].metadata.filename == "report.pdf"
+    assert elements[1].metadata.last_modified == "2020-01-01"
+    assert elements[1].metadata.attached_to_filename == str(tmp_path / "two.eml")
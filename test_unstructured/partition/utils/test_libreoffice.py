@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from unstructured.partition import common
+from unstructured.partition.utils import libreoffice
+from unstructured.partition.utils.libreoffice import OfficeConversionError, SofficePool
+
+
+class FakeInstance:
+    """Stands in for a `SofficeInstance`, "converting" files by writing their name."""
+
+    def __init__(self, hang_on: str = "", fail_on: str = ""):
+        self.hang_on = hang_on
+        self.fail_on = fail_on
+        self.healthy = True
+        self.stopped = False
+        self.converted: List[str] = []
+
+    def is_healthy(self, timeout: float) -> bool:
+        return self.healthy
+
+    def convert(self, input_filename, output_directory, target_format, filter_name, timeout):
+        if input_filename == self.hang_on:
+            raise OfficeConversionError(f"converting {input_filename} took more than {timeout}s")
+        if input_filename == self.fail_on:
+            raise OfficeConversionError(f"soffice could not open {input_filename}")
+        time.sleep(0.05)
+        self.converted.append(input_filename)
+        base_filename, _ = os.path.splitext(os.path.basename(input_filename))
+        output_filename = os.path.join(output_directory, f"{base_filename}.{target_format}")
+        with open(output_filename, "w") as f:
+            f.write(f"{input_filename} {filter_name}")
+        return output_filename
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture()
+def instances():
+    started: List[FakeInstance] = []
+
+    def start_instance(self):
+        started.append(FakeInstance(hang_on="hangs.doc", fail_on="corrupt.doc"))
+        return started[-1]
+
+    with patch.object(SofficePool, "_start_instance", start_instance):
+        yield started
+
+
+def test_pool_reuses_its_instances(instances, tmp_path):
+    pool = SofficePool(size=1, timeout=10)
+
+    for name in ("one.doc", "two.doc"):
+        pool.convert(name, str(tmp_path))
+
+    assert len(instances) == 1
+    assert instances[0].converted == ["one.doc", "two.doc"]
+    assert (tmp_path / "two.docx").read_text() == "two.doc MS Word 2007 XML"
+
+
+def test_pool_restarts_instances_that_hang_or_stop_responding(instances, tmp_path):
+    pool = SofficePool(size=1, timeout=10)
+
+    with pytest.raises(OfficeConversionError, match="took more than"):
+        pool.convert("hangs.doc", str(tmp_path))
+    pool.convert("one.doc", str(tmp_path))
+    instances[-1].healthy = False
+    pool.convert("two.doc", str(tmp_path))
+
+    assert len(instances) == 3
+    assert instances[0].stopped
+    assert instances[1].stopped
+    assert instances[2].converted == ["two.doc"]
+
+
+def test_convert_many_converts_files_concurrently(instances, tmp_path):
+    pool = SofficePool(size=3, timeout=10)
+    names = [f"doc{i}.ppt" for i in range(9)] + ["corrupt.doc"]
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+    convert = FakeInstance.convert
+
+    def count_running(self, *args):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        try:
+            return convert(self, *args)
+        finally:
+            with lock:
+                running -= 1
+
+    with patch.object(FakeInstance, "convert", count_running):
+        outputs = pool.convert_many(names, str(tmp_path), target_format="pptx")
+
+    assert outputs[:-1] == [str(tmp_path / f"doc{i}.pptx") for i in range(9)]
+    assert outputs[-1] is None
+    assert max_running == 3
+    assert [instance.stopped for instance in instances].count(True) == 1
+
+
+def test_pool_needs_a_filter_for_formats_without_a_default(instances, tmp_path):
+    with pytest.raises(ValueError, match="target_filter"):
+        SofficePool(size=1, timeout=10).convert("one.doc", str(tmp_path), target_format="odt")
+
+
+def test_get_soffice_pool_is_only_used_when_enabled(monkeypatch):
+    monkeypatch.delenv("LIBREOFFICE_INSTANCES", raising=False)
+    assert libreoffice.get_soffice_pool() is None
+
+    monkeypatch.setenv("LIBREOFFICE_INSTANCES", "2")
+    with patch.object(libreoffice, "_uno_is_available", return_value=True):
+        pool = libreoffice.get_soffice_pool()
+        assert pool is libreoffice.get_soffice_pool()
+    assert pool.size == 2
+
+
+class MockPopen:
+    commands: List[List[str]] = []
+
+    def __init__(self, command, *args, **kwargs):
+        self.commands.append(command)
+
+    def communicate(self):
+        return b"", b""
+
+
+def test_convert_office_docs_runs_soffice_once(monkeypatch):
+    import subprocess
+
+    monkeypatch.delenv("LIBREOFFICE_INSTANCES", raising=False)
+    monkeypatch.setattr(subprocess, "Popen", MockPopen)
+    MockPopen.commands = []
+
+    common.convert_office_docs(["a.doc", "b.doc"], "out", target_format="docx")
+
+    assert MockPopen.commands == [
+        ["soffice", "--headless", "--convert-to", "docx", "--outdir", "out", "a.doc", "b.doc"],
+    ]
+
+
+def test_convert_office_doc_uses_the_pool_when_enabled(instances, tmp_path, monkeypatch):
+    monkeypatch.setenv("LIBREOFFICE_INSTANCES", "1")
+
+    with patch.object(libreoffice, "_uno_is_available", return_value=True):
+        common.convert_office_doc("one.ppt", str(tmp_path), target_format="pptx")
+
+    assert (tmp_path / "one.pptx").read_text() == "one.ppt Impress MS PowerPoint 2007 XML"
@@ -58,6 +58,49 @@ def test_recursive_xy_cut(recursive_func, expected):
     assert res == expected
 
 
+@pytest.mark.parametrize("axis", [0, 1])
+def test_split_boxes_by_projection_matches_the_projection_profile(axis):
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        n = rng.integers(1, 40)
+        left, top = rng.integers(0, 200, n), rng.integers(0, 200, n)
+        right, bottom = left + rng.integers(-2, 30, n), top + rng.integers(-2, 30, n)
+        # -- including boxes spanning no pixel --
+        boxes = np.stack([left, top, np.maximum(right, 0), np.maximum(bottom, 0)], axis=1)
+        boxes = boxes[boxes[:, axis].argsort(kind="stable")]
+        indices = np.arange(n)
+
+        groups = xycut.split_boxes_by_projection(boxes, indices, axis)
+
+        pos = xycut.split_projection_profile(xycut.projection_by_bboxes(boxes, axis), 0, 1)
+        expected = [] if pos is None else list(zip(*pos))
+        assert len(groups) == len(expected)
+        for (group_boxes, group_indices), (start, end) in zip(groups, expected):
+            mask = (start <= boxes[:, axis]) & (boxes[:, axis] < end)
+            assert np.array_equal(group_boxes, boxes[mask])
+            assert np.array_equal(group_indices, indices[mask])
+
+
+@pytest.mark.parametrize(
+    "xy_cut_func",
+    [xycut.recursive_xy_cut, xycut.recursive_xy_cut_swapped],
+)
+def test_xy_cut_handles_nesting_deeper_than_the_recursion_limit(xy_cut_func):
+    # -- nested "L" shapes: a bar across the top of what's left of the page and a bar down its
+    # -- left side, each shape splitting off once the previous one was cut --
+    boxes = []
+    for level in range(1500):
+        offset = 2 * level
+        boxes.append([offset, offset, 10000, offset + 1])
+        boxes.append([offset, offset + 2, offset + 1, 10000])
+    boxes = np.array(boxes)
+
+    res = []
+    xy_cut_func(boxes, np.arange(len(boxes)), res)
+
+    assert sorted(res) == list(range(len(boxes)))
+
+
 def test_points_to_bbox():
     # Test a valid case
     points = [10, 20, 30, 40, 50, 60, 70, 80]
@@ -25,6 +25,7 @@ from unstructured.documents.elements import ListItem, Table, Text, Title
 from unstructured.partition.xlsx import (
     _CellCoordinate,
     _ConnectedComponent,
+    _ConnectedComponents,
     _SubtableParser,
     partition_xlsx,
 )
@@ -387,6 +388,40 @@ def test_partition_xlsx_with_more_than_1k_cells():
         sys.setrecursionlimit(old_recursion_limit)
 
 
+def test_partition_xlsx_emits_a_table_per_window_of_rows_with_the_header_repeated():
+    elements = partition_xlsx(
+        "example-docs/stanley-cups.xlsx", include_header=True, rows_per_table=2
+    )
+
+    assert [(e.metadata.page_name, e.metadata.page_number) for e in elements] == [
+        ("Stanley Cups", 1),
+        ("Stanley Cups", 1),
+        ("Stanley Cups Since 67", 2),
+        ("Stanley Cups Since 67", 2),
+    ]
+    assert all(isinstance(e, Table) for e in elements)
+    assert [clean_extra_whitespace(e.text) for e in elements[:2]] == [
+        "Stanley Cups Unnamed: 1 Unnamed: 2 Team Location Stanley Cups Blues STL 1",
+        "Stanley Cups Unnamed: 1 Unnamed: 2 Flyers PHI 2 Maple Leafs TOR 13",
+    ]
+
+
+@pytest.mark.parametrize("include_header", [True, False])
+@pytest.mark.parametrize(
+    "filename", ["stanley-cups.xlsx", "emoji.xlsx", "2023-half-year-analyses-by-segment.xlsx"]
+)
+def test_partition_xlsx_with_a_window_spanning_each_sheet_matches_the_whole_sheet_tables(
+    filename: str, include_header: bool
+):
+    kwargs = {"include_header": include_header, "languages": [""]}
+    tables = partition_xlsx(example_doc_path(filename), find_subtable=False, **kwargs)
+    windows = partition_xlsx(example_doc_path(filename), rows_per_table=10**6, **kwargs)
+
+    assert [(e.text, e.metadata.text_as_html, e.metadata.page_number) for e in windows] == [
+        (e.text, e.metadata.text_as_html, e.metadata.page_number) for e in tables
+    ]
+
+
 # ------------------------------------------------------------------------------------------------
 # UNIT TESTS
 # ------------------------------------------------------------------------------------------------
@@ -430,6 +465,38 @@ class Describe_ConnectedComponent:
         )
 
 
+class Describe_ConnectedComponents:
+    """Unit-test suite for `unstructured.partition.xlsx._ConnectedComponents` objects."""
+
+    def it_finds_the_groups_of_2d_connected_cells_in_the_order_of_their_first_cell(self):
+        worksheet_df = pd.DataFrame(
+            [
+                ["a", None, "b", None, "c"],
+                ["d", None, "e", None, None],
+                ["f", "g", "h", None, "i"],
+                [None, None, None, "j", None],
+            ]
+        )
+
+        component_extents = _ConnectedComponents(worksheet_df)._component_extents
+
+        # -- the "U" joined on its bottom row is a single group, "j" only touches others diagonally
+        assert component_extents == [(0, 0, 2, 2), (0, 4, 0, 4), (2, 4, 2, 4), (3, 3, 3, 3)]
+
+    def it_merges_groups_that_overlap_row_wise(self):
+        worksheet_df = pd.DataFrame(
+            [["a", None, "b"], ["c", None, None], [None, None, None], [None, "d", None]]
+        )
+
+        components = list(_ConnectedComponents(worksheet_df))
+
+        assert [c._extents for c in components] == [(0, 0, 1, 2), (3, 1, 3, 1)]
+        pdt.assert_frame_equal(components[0].subtable, worksheet_df.iloc[0:2, 0:3])
+
+    def it_has_no_components_for_an_empty_worksheet(self):
+        assert list(_ConnectedComponents(pd.DataFrame([[None, None]]))) == []
+
+
 class Describe_SubtableParser:
     """Unit-test suite for `unstructured.partition.xlsx._SubtableParser` objects."""
 
@@ -60,6 +60,17 @@ def test_elements_from_dicts():
     ]
 
 
+def test_elements_from_dicts_without_copying_shares_metadata_values():
+    element_dicts = [{"text": "Blurb1", "type": "Title", "metadata": {"languages": ["eng"]}}]
+
+    copied = base.elements_from_dicts(element_dicts)
+    not_copied = base.elements_from_dicts(element_dicts, copy_dicts=False)
+
+    assert copied == not_copied
+    assert copied[0].metadata.languages is not element_dicts[0]["metadata"]["languages"]
+    assert not_copied[0].metadata.languages is element_dicts[0]["metadata"]["languages"]
+
+
 def test_convert_to_csv(tmp_path: str):
     output_csv_path = os.path.join(tmp_path, "isd_data.csv")
     elements = [Title(text="Title 1"), NarrativeText(text="Narrative 1")]
@@ -0,0 +1,81 @@
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from unstructured.ingest.connector.sql import (
+    SimpleSqlConfig,
+    SqlAccessConfig,
+    SqlDestinationConnector,
+    SqlWriteConfig,
+)
+
+SQLITE_SCHEMA = (
+    Path(__file__).parents[2] / "scripts" / "sql-test-helpers" / "create-sqlite-schema.sql"
+)
+
+
+@pytest.fixture()
+def sqlite_database(tmp_path: Path) -> str:
+    database = str(tmp_path / "elements.db")
+    with sqlite3.connect(database) as connection:
+        connection.executescript(SQLITE_SCHEMA.read_text())
+    connection.close()
+    return database
+
+
+def _sqlite_connector(database: str, batch_size: int) -> SqlDestinationConnector:
+    return SqlDestinationConnector(
+        write_config=SqlWriteConfig(batch_size=batch_size),
+        connector_config=SimpleSqlConfig(
+            db_type="sqlite",
+            host=None,
+            database=database,
+            port=None,
+            access_config=SqlAccessConfig(username=None, password=None),
+        ),
+    )
+
+
+def _elements(n: int):
+    elements = []
+    for i in range(n):
+        element = {"id": str(i), "element_id": f"element-{i}", "text": f"text {i}", "type": "Text"}
+        # -- every third element has extra columns --
+        if i % 3 == 0:
+            element["page_number"] = str(i // 10)
+            element["languages"] = ["eng"]
+        elements.append(element)
+    return elements
+
+
+def test_write_dict_writes_elements_with_different_columns(sqlite_database):
+    connector = _sqlite_connector(sqlite_database, batch_size=7)
+
+    connector.write_dict(elements_dict=_elements(50))
+
+    with sqlite3.connect(sqlite_database) as connection:
+        rows = connection.execute(
+            "SELECT id, text, page_number, languages FROM elements ORDER BY CAST(id AS INT)"
+        ).fetchall()
+    connection.close()
+    assert len(rows) == 50
+    assert rows[3] == ("3", "text 3", "0", '["eng"]')
+    assert rows[4] == ("4", "text 4", None, None)
+
+
+def test_write_dict_commits_once_per_batch_with_one_insert_per_column_set():
+    connector = _sqlite_connector("unused.db", batch_size=20)
+    connection = MagicMock()
+    connection.__enter__.return_value = connection
+    cursor = connection.cursor.return_value
+
+    with patch.object(SimpleSqlConfig, "connection", lambda self: connection):
+        connector.write_dict(elements_dict=_elements(50))
+
+    assert connection.commit.call_count == 3
+    # -- 2 column sets in each of the 3 batches --
+    assert cursor.executemany.call_count == 6
+    assert sum(len(c.args[1]) for c in cursor.executemany.call_args_list) == 50
+    cursor.execute.assert_not_called()
@@ -0,0 +1,59 @@
+import multiprocessing as mp
+import pickle
+
+import pytest
+
+from unstructured.ingest.pipeline.doc_registry import IngestDocRegistry
+
+
+def _register_in_child(registry: IngestDocRegistry, i: int) -> str:
+    registry[f"doc-{i}"] = {"unique_id": str(i), "updated": True}
+    return registry["doc-0"]["unique_id"]
+
+
+def test_registry_sets_gets_and_links_docs(tmp_path):
+    registry = IngestDocRegistry(path=tmp_path / "ingest_docs.db")
+    registry["source"] = {"unique_id": "a", "nested": {"values": [1, 2]}}
+
+    registry.link("chunked", "source")
+    registry.link("embedded", "chunked")
+    registry["source"] = {"unique_id": "a", "updated": True}
+
+    assert registry["embedded"] == {"unique_id": "a", "updated": True}
+    assert "chunked" in registry
+    assert "missing" not in registry
+    assert len(registry) == 3
+    with pytest.raises(KeyError):
+        registry["missing"]
+    with pytest.raises(KeyError):
+        registry.link("other", "missing")
+
+
+def test_registry_get_many_returns_registered_docs_in_batches(tmp_path):
+    registry = IngestDocRegistry(path=tmp_path / "ingest_docs.db")
+    registry.update({f"doc-{i}": {"unique_id": str(i)} for i in range(1200)})
+
+    docs = registry.get_many([f"doc-{i}" for i in range(0, 1300, 2)])
+
+    assert len(docs) == 600
+    assert docs["doc-1198"] == {"unique_id": "1198"}
+
+
+def test_registry_persists_across_instances(tmp_path):
+    IngestDocRegistry(path=tmp_path / "ingest_docs.db")["doc"] = {"unique_id": "a"}
+
+    assert IngestDocRegistry(path=tmp_path / "ingest_docs.db")["doc"] == {"unique_id": "a"}
+
+
+def test_registry_is_shared_with_worker_processes(tmp_path):
+    registry = IngestDocRegistry(path=tmp_path / "ingest_docs.db")
+    registry["doc-0"] = {"unique_id": "0"}
+    registry = pickle.loads(pickle.dumps(registry))
+
+    with mp.Pool(processes=2) as pool:
+        results = pool.starmap(_register_in_child, [(registry, i) for i in range(1, 9)])
+
+    assert results == ["0"] * 8
+    assert registry.get_many([f"doc-{i}" for i in range(1, 9)]) == {
+        f"doc-{i}": {"unique_id": str(i), "updated": True} for i in range(1, 9)
+    }
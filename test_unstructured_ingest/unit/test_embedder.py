@@ -0,0 +1,126 @@
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from unstructured.documents.elements import Element, NarrativeText, Title
+from unstructured.embed.interfaces import BaseEmbeddingEncoder, EmbeddingConfig
+from unstructured.ingest.interfaces import EmbeddingConfig as IngestEmbeddingConfig
+from unstructured.ingest.pipeline.doc_registry import IngestDocRegistry
+from unstructured.ingest.pipeline.embedding_cache import get_embedding_cache
+from unstructured.ingest.pipeline.interfaces import PipelineContext
+from unstructured.ingest.pipeline.reformat import embedding
+from unstructured.ingest.pipeline.reformat.embedding import Embedder
+from unstructured.ingest.pipeline.serialization import read_element_dicts
+from unstructured.staging.base import elements_to_json
+
+
+@dataclass
+class FakeEmbeddingEncoder(BaseEmbeddingEncoder):
+    embed_batch_size: t.ClassVar[int] = 3
+
+    def __post_init__(self):
+        self.batches: t.List[t.List[str]] = []
+
+    def initialize(self):
+        pass
+
+    @property
+    def num_of_dimensions(self):
+        return (2,)
+
+    @property
+    def is_unit_vector(self):
+        return False
+
+    def embed_documents(self, elements: t.List[Element]) -> t.List[Element]:
+        self.batches.append([str(e) for e in elements])
+        for element in elements:
+            element.embeddings = [len(str(element)) / 3, float(len(self.batches))]
+        return elements
+
+    def embed_query(self, query: str) -> t.List[float]:
+        return [len(query) / 3, 0.0]
+
+
+@pytest.fixture()
+def encoders():
+    created = []
+
+    def get_embedder(self):
+        created.append(FakeEmbeddingEncoder(config=EmbeddingConfig()))
+        return created[-1]
+
+    embedding._embedders.clear()
+    get_embedding_cache.cache_clear()
+    with patch.object(IngestEmbeddingConfig, "get_embedder", get_embedder):
+        yield created
+    embedding._embedders.clear()
+
+
+@pytest.fixture()
+def elements_jsons(tmp_path: Path) -> t.List[str]:
+    paths = []
+    for i in range(4):
+        path = tmp_path / "partitioned" / f"doc{i}.json"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(elements_to_json([Title("Disclaimer"), NarrativeText(f"Text of doc {i}")]))
+        paths.append(str(path))
+    return paths
+
+
+def _embedder(tmp_path: Path, work_dir: str, cache_path: t.Optional[str] = None) -> Embedder:
+    context = PipelineContext(work_dir=str(tmp_path / work_dir), num_processes=1)
+    context.ingest_docs_map = IngestDocRegistry(tmp_path / f"{work_dir}.db")
+    context.ingest_docs_map.update({f"doc{i}": {"unique_id": str(i)} for i in range(4)})
+    return Embedder(
+        pipeline_context=context,
+        embedder_config=IngestEmbeddingConfig(provider="fake", cache_path=cache_path),
+    )
+
+
+def _embeddings(paths: t.List[str]) -> t.List[t.List[t.List[float]]]:
+    return [[e["embeddings"] for e in read_element_dicts(path)] for path in paths]
+
+
+def test_embedder_packs_distinct_texts_of_all_docs_in_batches(tmp_path, encoders, elements_jsons):
+    outputs = _embedder(tmp_path, "work")(elements_jsons)
+
+    assert len(outputs) == 4
+    assert len(encoders) == 1
+    batches = encoders[0].batches
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert sorted(text for batch in batches for text in batch) == sorted(
+        ["Disclaimer"] + [f"Text of doc {i}" for i in range(4)],
+    )
+    embeddings = _embeddings(outputs)
+    assert all(doc_embeddings[0] == embeddings[0][0] for doc_embeddings in embeddings)
+
+
+def test_embedder_reuses_cached_embeddings(tmp_path, encoders, elements_jsons):
+    cache_path = str(tmp_path / "embeddings.db")
+    outputs = _embedder(tmp_path, "first", cache_path=cache_path)(elements_jsons)
+    embedding._embedders.clear()
+
+    cached_outputs = _embedder(tmp_path, "second", cache_path=cache_path)(elements_jsons)
+
+    assert len(encoders) == 2
+    assert encoders[1].batches == []
+    assert _embeddings(cached_outputs) == _embeddings(outputs)
+
+
+def test_embedder_only_drops_the_docs_that_fail(tmp_path, encoders, elements_jsons):
+    Path(elements_jsons[1]).write_text(elements_to_json([NarrativeText("fail")]))
+    embed_documents = FakeEmbeddingEncoder.embed_documents
+
+    def fail_on_text(self, elements):
+        if "fail" in [str(e) for e in elements]:
+            raise ValueError("can't embed")
+        return embed_documents(self, elements)
+
+    with patch.object(FakeEmbeddingEncoder, "embed_documents", fail_on_text):
+        outputs = _embedder(tmp_path, "work")(elements_jsons)
+
+    assert len(outputs) == 3
@@ -1,8 +1,20 @@
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
 from unittest.mock import MagicMock, patch
 
 from fsspec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
 
-from unstructured.ingest.connector.fsspec.fsspec import FsspecIngestDoc, SimpleFsspecConfig
+from unstructured.ingest.connector.fsspec.fsspec import (
+    FsspecDestinationConnector,
+    FsspecIngestDoc,
+    FsspecWriteConfig,
+    SimpleFsspecConfig,
+)
 from unstructured.ingest.interfaces import ProcessorConfig, ReadConfig
 
 
@@ -23,3 +35,82 @@ def test_version_is_string(mock_get_filesystem_class):
         remote_file_path="test.txt",
     )
     assert isinstance(doc.source_metadata.version, str)
+
+
+def _output_docs(tmp_path: Path, n_docs: int):
+    docs = []
+    for i in range(n_docs):
+        output_path = tmp_path / f"doc-{i}.json"
+        output_path.write_text(json.dumps([{"text": f"element {i}"}], indent=4))
+        docs.append(
+            SimpleNamespace(_output_filename=str(output_path), base_output_filename=f"doc-{i}.json")
+        )
+    return docs
+
+
+def test_destination_writes_outputs_compactly_with_a_single_filesystem(tmp_path):
+    connector = FsspecDestinationConnector(
+        write_config=FsspecWriteConfig(),
+        connector_config=SimpleFsspecConfig("s3://destination/out", access_config={}),
+    )
+    fs = MemoryFileSystem()
+
+    with patch("fsspec.get_filesystem_class", return_value=MagicMock(return_value=fs)) as fs_class:
+        connector.write(docs=_output_docs(tmp_path, n_docs=3))
+        connector.write_dict(elements_dict=[{"text": "extra"}], filename="extra.json")
+
+    fs_class.return_value.assert_called_once_with()
+    assert fs.cat("s3://destination/out/doc-1.json") == b'[{"text": "element 1"}]'
+    assert fs.cat("s3://destination/out/extra.json") == b'[{"text": "extra"}]'
+    assert connector.to_dict()["_fs"] is None
+
+
+def test_destination_deletes_the_outputs_of_docs(tmp_path):
+    connector = FsspecDestinationConnector(
+        write_config=FsspecWriteConfig(),
+        connector_config=SimpleFsspecConfig("s3://destination/out", access_config={}),
+    )
+    fs = MemoryFileSystem()
+    docs = _output_docs(tmp_path, n_docs=3)
+
+    with patch("fsspec.get_filesystem_class", return_value=MagicMock(return_value=fs)):
+        connector.write(docs=docs)
+        connector.delete(docs=docs[1:] + [SimpleNamespace(base_output_filename=None)])
+
+    assert fs.exists("s3://destination/out/doc-0.json")
+    assert not fs.exists("s3://destination/out/doc-1.json")
+    assert not fs.exists("s3://destination/out/doc-2.json")
+
+
+class _AsyncMemoryFileSystem(AsyncFileSystem):
+    """Async filesystem keeping files in a dict, recording how many uploads run concurrently."""
+
+    cachable = False
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.files: Dict[str, bytes] = {}
+        self.running = 0
+        self.max_running = 0
+
+    async def _pipe_file(self, path, value, **kwargs):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.files[path] = value
+        self.running -= 1
+
+
+def test_destination_uploads_concurrently_to_async_filesystems(tmp_path):
+    connector = FsspecDestinationConnector(
+        write_config=FsspecWriteConfig(max_concurrent_uploads=4),
+        connector_config=SimpleFsspecConfig("s3://destination/out", access_config={}),
+    )
+    fs = _AsyncMemoryFileSystem()
+
+    with patch("fsspec.get_filesystem_class", return_value=lambda **kwargs: fs):
+        connector.write(docs=_output_docs(tmp_path, n_docs=40))
+
+    assert len(fs.files) == 40
+    assert fs.files["s3://destination/out/doc-7.json"] == b'[{"text": "element 7"}]'
+    assert fs.max_running == 4
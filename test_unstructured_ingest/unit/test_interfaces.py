@@ -1,18 +1,25 @@
+import json
 import os
 import pathlib
-from dataclasses import dataclass
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, List
 
 import pytest
 
 from unstructured.documents.elements import DataSourceMetadata
+from unstructured.ingest.connector.local import SimpleLocalConfig
 from unstructured.ingest.interfaces import (
     BaseConnectorConfig,
+    BaseDestinationConnector,
     BaseSingleIngestDoc,
     PartitionConfig,
     ProcessorConfig,
     ReadConfig,
+    WriteConfig,
 )
+from unstructured.ingest.runner.local import LocalRunner
+from unstructured.ingest.runner.writers.base_writer import Writer
 from unstructured.partition.auto import partition
 from unstructured.staging.base import elements_to_dicts
 
@@ -255,3 +262,100 @@ def test_process_file_flatten_metadata(mocker, partition_test_results):
     expected_keys = {"element_id", "text", "type", "filename", "file_directory", "filetype"}
     for elem in isd_elems:
         assert expected_keys == set(elem.keys())
+
+
+@dataclass
+class ExampleDestinationConnector(BaseDestinationConnector):
+    write_config: WriteConfig
+    connector_config: ExampleConfig
+    batches: List[List[Dict[str, Any]]] = field(default_factory=list)
+
+    def initialize(self):
+        pass
+
+    def check_connection(self):
+        pass
+
+    def conform_dict(self, data: dict) -> None:
+        data["conformed"] = True
+
+    def normalize_dict(self, element_dict: dict) -> dict:
+        return {"normalized": element_dict}
+
+    def write_dict(self, *args, elements_dict: List[Dict[str, Any]], **kwargs) -> None:
+        self.batches.append(elements_dict)
+
+
+def _output_docs(tmp_path: pathlib.Path, n_docs: int, n_elements: int):
+    docs = []
+    for i in range(n_docs):
+        output_path = tmp_path / f"doc-{i}.json"
+        output_path.write_text(json.dumps([{"text": f"{i}-{j}"} for j in range(n_elements)]))
+        docs.append(SimpleNamespace(_output_filename=str(output_path)))
+    return docs
+
+
+def test_destination_write_hands_elements_to_write_dict_in_batches(tmp_path, monkeypatch):
+    connector = ExampleDestinationConnector(
+        write_config=WriteConfig(), connector_config=TEST_CONFIG
+    )
+    monkeypatch.setattr(connector, "write_batch_size", 4)
+
+    connector.write(docs=_output_docs(tmp_path, n_docs=3, n_elements=3))
+
+    assert [len(batch) for batch in connector.batches] == [4, 4, 1]
+    assert connector.batches[0][0] == {"normalized": {"text": "0-0", "conformed": True}}
+    assert [d["normalized"]["text"] for batch in connector.batches for d in batch] == [
+        f"{i}-{j}" for i in range(3) for j in range(3)
+    ]
+
+
+def test_destination_write_hands_all_elements_at_once_without_batch_size(tmp_path, monkeypatch):
+    connector = ExampleDestinationConnector(
+        write_config=WriteConfig(), connector_config=TEST_CONFIG
+    )
+    monkeypatch.setattr(connector, "write_batch_size", None)
+
+    connector.write(docs=_output_docs(tmp_path, n_docs=3, n_elements=3))
+
+    assert [len(batch) for batch in connector.batches] == [9]
+
+
+@dataclass
+class ExampleWriter(Writer):
+    def get_connector_cls(self):
+        return ExampleDestinationConnector
+
+
+@pytest.mark.parametrize(
+    ("write_batch_size", "batch_sizes"), [(None, [9]), (2, [2, 2, 2, 2, 1]), (5, [5, 4])]
+)
+def test_destination_write_hands_elements_in_batches_of_the_configured_size(
+    tmp_path, monkeypatch, write_batch_size, batch_sizes
+):
+    runner = LocalRunner(
+        connector_config=SimpleLocalConfig(input_path=str(tmp_path)),
+        processor_config=ProcessorConfig(write_batch_size=write_batch_size),
+        read_config=ReadConfig(),
+        partition_config=PartitionConfig(),
+        writer=ExampleWriter(connector_config=TEST_CONFIG, write_config=WriteConfig()),
+    )
+    connector = runner.get_dest_doc_connector()
+    # -- without a configured size, the default batch size of the connector applies --
+    monkeypatch.setattr(ExampleDestinationConnector, "write_batch_size", 9)
+
+    connector.write(docs=_output_docs(tmp_path, n_docs=3, n_elements=3))
+
+    assert [len(batch) for batch in connector.batches] == batch_sizes
+
+
+def test_destination_write_ignores_the_configured_size_when_written_at_once(tmp_path, monkeypatch):
+    connector = ExampleDestinationConnector(
+        write_config=WriteConfig(), connector_config=TEST_CONFIG
+    )
+    connector.configured_write_batch_size = 2
+    monkeypatch.setattr(ExampleDestinationConnector, "write_batch_size", None)
+
+    connector.write(docs=_output_docs(tmp_path, n_docs=3, n_elements=3))
+
+    assert [len(batch) for batch in connector.batches] == [9]
@@ -0,0 +1,120 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from unstructured.ingest.connector.local import LocalSourceConnector, SimpleLocalConfig
+from unstructured.ingest.interfaces import ProcessorConfig, ReadConfig
+from unstructured.ingest.pipeline import DocFactory, Pipeline, PipelineContext, Reader
+from unstructured.ingest.pipeline.doc_registry import IngestDocRegistry
+from unstructured.ingest.pipeline.manifest import DocChange, IngestManifest
+
+
+def _doc(unique_id: str, version: str = "1", date_modified: str = "2024-01-01") -> dict:
+    return {"unique_id": unique_id, "version": version, "date_modified": date_modified}
+
+
+@pytest.fixture()
+def manifest(tmp_path: Path) -> IngestManifest:
+    return IngestManifest(path=tmp_path / "manifest.db", source_id="s3", pipeline_hash="abc")
+
+
+def test_get_change_compares_recorded_versions(manifest: IngestManifest):
+    manifest.record({"out-a": _doc("a"), "out-b": _doc("b", version=None)})
+
+    assert manifest.get_change("a", "1", "2024-01-01") == DocChange.UNCHANGED
+    assert manifest.get_change("a", "2", "2024-01-01") == DocChange.CHANGED
+    assert manifest.get_change("a", "1", "2024-02-01") == DocChange.CHANGED
+    # -- there's no telling whether docs without a version or modification date changed --
+    assert manifest.get_change("b", None, None) == DocChange.CHANGED
+    assert manifest.get_change("c", "1", "2024-01-01") == DocChange.NEW
+
+
+def test_get_change_of_another_source_or_pipeline(manifest: IngestManifest, tmp_path: Path):
+    manifest.record({"out-a": _doc("a")})
+
+    other_pipeline = IngestManifest(manifest.path, source_id="s3", pipeline_hash="def")
+    other_source = IngestManifest(manifest.path, source_id="gcs", pipeline_hash="abc")
+
+    assert other_pipeline.get_change("a", "1", "2024-01-01") == DocChange.CHANGED
+    assert other_source.get_change("a", "1", "2024-01-01") == DocChange.NEW
+
+
+def test_get_removed_returns_the_recorded_docs_no_longer_listed(manifest: IngestManifest):
+    manifest.record({f"out-{i}": _doc(str(i)) for i in range(1200)})
+    IngestManifest(manifest.path, source_id="gcs", pipeline_hash="abc").record({"x": _doc("x")})
+
+    removed = manifest.get_removed(str(i) for i in range(1200) if i % 100)
+
+    assert sorted(removed, key=int) == [str(i) for i in range(0, 1200, 100)]
+    assert removed["100"] == _doc("100")
+    manifest.remove(removed.keys())
+    assert manifest.get_removed(str(i) for i in range(1200) if i % 100) == {}
+
+
+@pytest.fixture()
+def local_pipeline(tmp_path: Path) -> Pipeline:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("a", "b"):
+        (input_dir / name).write_text(f"content of {name}")
+    processor_config = ProcessorConfig(
+        work_dir=str(tmp_path / "work"),
+        output_dir=str(tmp_path / "output"),
+        incremental=True,
+        delete_removed_docs=True,
+    )
+    context = PipelineContext.from_dict(processor_config.to_dict())
+    context.ingest_docs_map = IngestDocRegistry(path=tmp_path / "work" / "ingest_docs.db")
+    source_connector = LocalSourceConnector(
+        processor_config=processor_config,
+        read_config=ReadConfig(),
+        connector_config=SimpleLocalConfig(input_path=str(input_dir)),
+    )
+    pipeline = Pipeline(
+        pipeline_context=context,
+        doc_factory_node=DocFactory(
+            pipeline_context=context, source_doc_connector=source_connector
+        ),
+        source_node=Reader(pipeline_context=context, read_config=ReadConfig()),
+    )
+    context.manifest = pipeline.get_manifest()
+    return pipeline
+
+
+def _list_docs(pipeline: Pipeline) -> dict:
+    docs = pipeline.doc_factory_node.source_doc_connector.get_ingest_docs()
+    return {Path(doc.path).stem: doc.to_dict() for doc in docs}
+
+
+def test_reader_skips_the_docs_unchanged_since_the_last_run(local_pipeline: Pipeline):
+    reader = local_pipeline.source_node
+    docs = _list_docs(local_pipeline)
+    for name, doc in docs.items():
+        assert reader.run(doc)
+        local_pipeline.pipeline_context.ingest_docs_map[name] = doc
+    local_pipeline.record_processed_docs(json_paths=list(docs))
+
+    docs = _list_docs(local_pipeline)
+    path_b = docs["b"]["path"]
+    os.utime(path_b, (0, 0))
+
+    assert reader.run(docs["a"]) is None
+    assert reader.run(docs["b"]) == Path(path_b)
+
+
+def test_delete_removed_docs_deletes_their_outputs(local_pipeline: Pipeline):
+    docs = _list_docs(local_pipeline)
+    local_pipeline.pipeline_context.ingest_docs_map.update(docs)
+    local_pipeline.record_processed_docs(json_paths=list(docs))
+    for doc in docs.values():
+        Path(doc["_output_filename"]).parent.mkdir(parents=True, exist_ok=True)
+        Path(doc["_output_filename"]).write_text("[]")
+
+    os.remove(docs["a"]["path"])
+    local_pipeline.delete_removed_docs(dict_docs=list(_list_docs(local_pipeline).values()))
+
+    assert not Path(docs["a"]["_output_filename"]).exists()
+    assert Path(docs["b"]["_output_filename"]).exists()
+    manifest = local_pipeline.pipeline_context.manifest
+    assert manifest.get_removed(unique_ids=[]).keys() == {docs["b"]["unique_id"]}
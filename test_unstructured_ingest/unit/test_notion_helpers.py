@@ -0,0 +1,137 @@
+import logging
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+from uuid import UUID
+
+import httpx
+from notion_client.errors import APIErrorCode, APIResponseError
+
+import unstructured.ingest.connector.notion.types.blocks as notion_blocks
+from unstructured.ingest.connector.notion.client import RateLimiter
+from unstructured.ingest.connector.notion.helpers import (
+    get_recursive_content_from_database,
+    get_recursive_content_from_page,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _id(n: int) -> str:
+    return str(UUID(int=n))
+
+
+ROOT, PAGE_A, PAGE_B, PAGE_C, DATABASE, DATABASE_PAGE, MISSING = (_id(n) for n in range(1, 8))
+
+
+def _child_page(page_id: str):
+    return SimpleNamespace(id=page_id, block=notion_blocks.ChildPage(title=f"page {page_id}"))
+
+
+def _child_database(database_id: str):
+    return SimpleNamespace(id=database_id, block=notion_blocks.ChildDatabase(title="database"))
+
+
+def _link(page_id: str):
+    return SimpleNamespace(
+        id=_id(100),
+        block=notion_blocks.LinkToPage(type="page_id", page_id=page_id),
+    )
+
+
+def _database_entry(page_id: str):
+    return SimpleNamespace(id=page_id, url=f"https://www.notion.so/Entry-{UUID(page_id).hex}")
+
+
+class StubClient:
+    """Serves a small workspace in which pages link back to each other, recording the requests."""
+
+    page_children = {
+        ROOT: [_child_page(PAGE_A), _child_page(PAGE_B), _child_database(DATABASE)],
+        PAGE_A: [_child_page(PAGE_C), _link(ROOT), _link(PAGE_B)],
+        PAGE_B: [_link(PAGE_C), _link(MISSING)],
+        PAGE_C: [],
+        DATABASE_PAGE: [_link(PAGE_A)],
+    }
+    database_entries = {DATABASE: [_database_entry(DATABASE_PAGE)]}
+
+    def __init__(self):
+        self.requests: Counter = Counter()
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+        self.blocks = SimpleNamespace(children=SimpleNamespace(iterate_list=self.iterate_list))
+        self.databases = SimpleNamespace(
+            iterate_query=self.iterate_query,
+            retrieve_status=lambda database_id: (
+                200 if str(UUID(database_id)) in self.database_entries else 404
+            ),
+        )
+        self.pages = SimpleNamespace(
+            retrieve_status=lambda page_id: (
+                200 if str(UUID(page_id)) in self.page_children else 404
+            ),
+        )
+
+    def _request(self, object_id: str):
+        with self._lock:
+            self.requests[object_id] += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.02)
+        with self._lock:
+            self.running -= 1
+
+    def iterate_list(self, block_id: str):
+        self._request(block_id)
+        if block_id not in self.page_children:
+            raise APIResponseError(httpx.Response(404), "not found", APIErrorCode.ObjectNotFound)
+        yield self.page_children[block_id]
+
+    def iterate_query(self, database_id: str):
+        self._request(database_id)
+        yield self.database_entries[database_id]
+
+
+def test_get_recursive_content_from_page_crawls_each_page_once_concurrently():
+    client = StubClient()
+
+    content = get_recursive_content_from_page(
+        client=client,  # type: ignore
+        page_id=ROOT,
+        logger=logger,
+        max_workers=4,
+    )
+
+    assert sorted(content.child_pages) == sorted([PAGE_A, PAGE_B, PAGE_C, DATABASE_PAGE])
+    assert content.child_databases == [DATABASE]
+    assert set(client.requests.values()) == {1}
+    assert client.max_running > 1
+
+
+def test_get_recursive_content_is_the_same_with_a_single_worker():
+    client = StubClient()
+
+    content = get_recursive_content_from_database(
+        client=client,  # type: ignore
+        database_id=DATABASE,
+        logger=logger,
+    )
+
+    assert sorted(content.child_pages) == sorted([DATABASE_PAGE, PAGE_A, ROOT, PAGE_B, PAGE_C])
+    assert content.child_databases == []
+    assert client.max_running == 1
+
+
+def test_rate_limiter_spaces_out_requests_across_threads():
+    rate_limiter = RateLimiter(requests_per_second=50)
+
+    start_time = time.monotonic()
+    threads = [threading.Thread(target=rate_limiter.wait) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start_time >= 0.1
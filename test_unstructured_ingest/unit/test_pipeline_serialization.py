@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from unstructured.ingest.pipeline.serialization import (
+    get_intermediate_filename,
+    get_intermediate_name,
+    is_plain_json,
+    read_element_dicts,
+    write_element_dicts,
+)
+
+ELEMENT_DICTS = [
+    {
+        "type": "Title",
+        "element_id": "a1",
+        "text": "Héllo wörld",
+        "metadata": {"page_number": 1, "languages": ["eng"], "filename": "doc.pdf"},
+    },
+    {
+        "type": "NarrativeText",
+        "element_id": "b2",
+        "text": "Some text",
+        "embeddings": [0.1, -0.25, 1e-8],
+        "metadata": {"parent_id": "a1", "coordinates": {"points": [[1.5, 2.0], [3.0, 4.5]]}},
+    },
+]
+
+
+@pytest.mark.parametrize(
+    ("intermediate_format", "intermediate_compression", "expected"),
+    [
+        ("json", None, "abc.json"),
+        ("msgpack", None, "abc.msgpack"),
+        ("msgpack", "zstd", "abc.msgpack.zst"),
+        ("json", "zstd", "abc.json.zst"),
+    ],
+)
+def test_get_intermediate_filename(intermediate_format, intermediate_compression, expected):
+    filename = get_intermediate_filename("abc", intermediate_format, intermediate_compression)
+
+    assert filename == expected
+    assert get_intermediate_name(f"/work/dir/{filename}") == "abc"
+    assert is_plain_json(filename) is (expected == "abc.json")
+
+
+@pytest.mark.parametrize(
+    ("intermediate_format", "intermediate_compression"), [("parquet", None), ("json", "gzip")]
+)
+def test_get_intermediate_filename_raises_on_unsupported_values(
+    intermediate_format, intermediate_compression
+):
+    with pytest.raises(ValueError, match="Unsupported intermediate"):
+        get_intermediate_filename("abc", intermediate_format, intermediate_compression)
+
+
+@pytest.mark.parametrize("filename", ["abc.json", "abc.msgpack", "abc.msgpack.zst", "abc.json.zst"])
+def test_element_dicts_round_trip(tmp_path, filename):
+    path = tmp_path / filename
+
+    write_element_dicts(path, ELEMENT_DICTS)
+
+    assert read_element_dicts(path) == ELEMENT_DICTS
+
+
+def test_sorted_msgpack_converts_to_the_same_json_as_sorted_json(tmp_path):
+    json_path = tmp_path / "abc.json"
+    msgpack_path = tmp_path / "abc.msgpack.zst"
+
+    write_element_dicts(json_path, ELEMENT_DICTS, sort_keys=True)
+    write_element_dicts(msgpack_path, ELEMENT_DICTS, sort_keys=True)
+
+    converted = json.dumps(read_element_dicts(msgpack_path), ensure_ascii=False, indent=2)
+    assert converted == json_path.read_text(encoding="utf8")
+
+
+def test_read_element_dicts_raises_on_unknown_extension(tmp_path):
+    path = tmp_path / "abc.txt"
+    path.write_text("[]")
+
+    with pytest.raises(ValueError, match="Unable to determine the intermediate format"):
+        read_element_dicts(path)
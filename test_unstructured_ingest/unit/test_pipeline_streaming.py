@@ -0,0 +1,91 @@
+import time
+import typing as t
+from dataclasses import dataclass
+
+import pytest
+
+from unstructured.ingest.pipeline.interfaces import PipelineContext, ReformatNode
+from unstructured.ingest.pipeline.streaming import StreamingStage, run_streaming
+
+
+@dataclass
+class Double(ReformatNode):
+    def run(self, elements_json: int) -> t.Optional[int]:
+        # -- drop multiples of 5 like a doc that failed without raising --
+        return None if elements_json % 5 == 0 else elements_json * 2
+
+
+@dataclass
+class SlowIncrement(ReformatNode):
+    def run(self, elements_json: int) -> t.Optional[int]:
+        time.sleep(0.05)
+        return elements_json + 1
+
+
+@dataclass
+class Fail(ReformatNode):
+    def run(self, elements_json: int) -> t.Optional[int]:
+        raise ValueError(f"failed on {elements_json}")
+
+
+def test_run_streaming_matches_running_stages_in_sequence():
+    context = PipelineContext()
+    stages = [
+        StreamingStage(node=Double(pipeline_context=context)),
+        # -- each result feeds two inputs to the next stage, like a batch of docs --
+        StreamingStage(
+            node=SlowIncrement(pipeline_context=context),
+            get_next_inputs=lambda item, result: [result, -result],
+        ),
+        StreamingStage(node=Double(pipeline_context=context)),
+    ]
+
+    outputs = run_streaming(stages=stages, inputs=range(1, 21), num_processes=2, queue_size=3)
+
+    expected = []
+    for i in range(1, 21):
+        if i % 5:
+            expected.extend(2 * j for j in (2 * i + 1, -(2 * i + 1)) if j % 5)
+    assert sorted(outputs) == sorted(expected)
+
+
+def test_run_streaming_bounds_the_docs_waiting_for_a_slow_stage():
+    context = PipelineContext()
+    completed = {"Double": 0, "SlowIncrement": 0}
+    max_backlog = 0
+
+    def count(stage_name):
+        def get_next_inputs(item, result):
+            nonlocal max_backlog
+            if result is None:
+                return []
+            completed[stage_name] += 1
+            max_backlog = max(max_backlog, completed["Double"] - completed["SlowIncrement"])
+            return [result]
+
+        return get_next_inputs
+
+    stages = [
+        StreamingStage(node=Double(pipeline_context=context), get_next_inputs=count("Double")),
+        StreamingStage(
+            node=SlowIncrement(pipeline_context=context),
+            get_next_inputs=count("SlowIncrement"),
+        ),
+    ]
+
+    outputs = run_streaming(stages=stages, inputs=range(1, 41), num_processes=1, queue_size=2)
+
+    assert len(outputs) == 32
+    # -- the queue of the slow stage plus the doc it's working on --
+    assert max_backlog <= 3
+
+
+def test_run_streaming_raises_errors_of_a_stage():
+    context = PipelineContext()
+    stages = [
+        StreamingStage(node=Double(pipeline_context=context)),
+        StreamingStage(node=Fail(pipeline_context=context)),
+    ]
+
+    with pytest.raises(ValueError, match="failed on"):
+        run_streaming(stages=stages, inputs=range(1, 5), num_processes=2, queue_size=2)
@@ -315,14 +315,18 @@ class ElementMetadata:
         super().__setattr__(__name, __value)
 
     @classmethod
-    def from_dict(cls, meta_dict: dict[str, Any]) -> ElementMetadata:
+    def from_dict(cls, meta_dict: dict[str, Any], copy_dict: bool = True) -> ElementMetadata:
         """Construct from a metadata-dict.
 
         This would generally be a dict formed using the `.to_dict()` method and stored as JSON
         before "rehydrating" it using this method.
+
+        The dict is deep-copied unless `copy_dict` is False, which is only safe when the caller
+        owns `meta_dict` and won't use it again, like when it was just deserialized.
         """
         # -- avoid unexpected mutation by working on a copy of provided dict --
-        meta_dict = copy.deepcopy(meta_dict)
+        if copy_dict:
+            meta_dict = copy.deepcopy(meta_dict)
         self = ElementMetadata()
         for field_name, field_value in meta_dict.items():
             if field_name == "coordinates":
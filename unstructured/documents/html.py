@@ -157,11 +157,17 @@ class HTMLDocument(XMLDocument):
         page_number = 0
         page = Page(number=page_number)
         for article in articles:
-            descendanttag_elems: Tuple[etree._Element, ...] = ()
+            # -- The descendants of `consumed_elem` were parsed along with an element and are
+            # -- skipped once the walk reaches them, so as not to repeat something that's been
+            # -- flagged as text as we chase it down a chain. Only the most recently consumed
+            # -- element counts. Its subtree ends at `last_consumed_elem` in document order, so
+            # -- skipping takes no membership tests and the walk stays linear in the tree size.
+            consumed_elem: Optional[etree._Element] = None
+            last_consumed_elem: Optional[etree._Element] = None
+            skipping = False
             for tag_elem in article.iter():
-                if tag_elem in descendanttag_elems:
-                    # Prevent repeating something that's been flagged as text as we chase it
-                    # down a chain
+                if skipping:
+                    skipping = tag_elem is not last_consumed_elem
                     continue
 
                 if _is_text_tag(tag_elem):
@@ -176,7 +182,7 @@ class HTMLDocument(XMLDocument):
                         element = _parse_tag(tag_elem)
                         if element is not None:
                             page.elements.append(element)
-                    descendanttag_elems = tuple(tag_elem.iterdescendants())
+                    consumed_elem = tag_elem
 
                 elif _is_container_with_text(tag_elem):
                     links = _get_links_from_tag(tag_elem)
@@ -197,29 +203,31 @@ class HTMLDocument(XMLDocument):
                 elif _is_bulleted_table(tag_elem):
                     bulleted_text = _bulleted_text_from_table(tag_elem)
                     page.elements.extend(bulleted_text)
-                    descendanttag_elems = tuple(tag_elem.iterdescendants())
+                    consumed_elem = tag_elem
 
                 elif is_list_item_tag(tag_elem):
                     element, next_element = _process_list_item(tag_elem)
                     if element is not None:
                         page.elements.append(element)
-                        descendanttag_elems = _get_bullet_descendants(
-                            tag_elem,
-                            next_element,
-                        )
+                        # -- for bulleted text this is the next element, which holds the text --
+                        consumed_elem = next_element
 
                 elif tag_elem.tag in TABLE_TAGS:
                     element = _parse_HTMLTable_from_table_elem(tag_elem)
                     if element is not None:
                         page.elements.append(element)
                     if element or tag_elem.tag == "table":
-                        descendanttag_elems = tuple(tag_elem.iterdescendants())
+                        consumed_elem = tag_elem
 
                 elif tag_elem.tag in PAGEBREAK_TAGS and len(page.elements) > 0:
                     pages.append(page)
                     page_number += 1
                     page = Page(number=page_number)
 
+                if tag_elem is consumed_elem and len(tag_elem) > 0:
+                    last_consumed_elem = _last_descendant(tag_elem)
+                    skipping = True
+
             if len(page.elements) > 0:
                 pages.append(page)
                 page_number += 1
@@ -638,14 +646,11 @@ def _process_list_item(
     return None, None
 
 
-def _get_bullet_descendants(
-    element: Optional[etree._Element], next_element: Optional[etree._Element]
-) -> Tuple[etree._Element, ...]:
-    """Helper for list-item processing.
-
-    Gathers the descendants of `next_element` so they can be marked visited.
-    """
-    return () if element is None or next_element is None else tuple(next_element.iterdescendants())
+def _last_descendant(tag_elem: etree._Element) -> etree._Element:
+    """The descendant of `tag_elem` that comes last in document order, `tag_elem` if it has none."""
+    while len(tag_elem) > 0:
+        tag_elem = tag_elem[-1]
+    return tag_elem
 
 
 def is_list_item_tag(tag_elem: etree._Element) -> bool:
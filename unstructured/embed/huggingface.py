@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 
 import numpy as np
 
@@ -25,6 +25,8 @@ class HuggingFaceEmbeddingConfig(EmbeddingConfig):
 @dataclass
 class HuggingFaceEmbeddingEncoder(BaseEmbeddingEncoder):
     config: HuggingFaceEmbeddingConfig
+    # -- embedded locally, in batches of the `batch_size` of the encode kwargs within a call --
+    embed_batch_size: ClassVar[int] = 256
     _client: Optional["HuggingFaceEmbeddings"] = field(init=False, default=None)
     _exemplary_embedding: Optional[List[float]] = field(init=False, default=None)
 
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import ClassVar, List, Tuple
 
 from unstructured.documents.elements import Element
 from unstructured.ingest.enhanced_dataclass import EnhancedDataClassJsonMixin
@@ -14,6 +14,9 @@ class EmbeddingConfig(EnhancedDataClassJsonMixin):
 @dataclass
 class BaseEmbeddingEncoder(EnhancedDataClassJsonMixin, ABC):
     config: EmbeddingConfig
+    # -- the number of elements to embed in each `embed_documents()` call when there are many, e.g.
+    # -- the elements of several documents --
+    embed_batch_size: ClassVar[int] = 100
 
     @abstractmethod
     def initialize(self):
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 
 import numpy as np
 
@@ -23,6 +23,8 @@ class OpenAIEmbeddingConfig(EmbeddingConfig):
 @dataclass
 class OpenAIEmbeddingEncoder(BaseEmbeddingEncoder):
     config: OpenAIEmbeddingConfig
+    # -- the langchain client sends up to 1000 texts in each request --
+    embed_batch_size: ClassVar[int] = 1000
     _client: Optional["OpenAIEmbeddings"] = field(init=False, default=None)
     _exemplary_embedding: Optional[List[float]] = field(init=False, default=None)
 
@@ -9,7 +9,11 @@ from unstructured.ingest.cli.cmd_factory import get_src_cmd
 from unstructured.ingest.cli.common import (
     log_options,
 )
-from unstructured.ingest.cli.interfaces import BaseConfig, CliFilesStorageConfig
+from unstructured.ingest.cli.interfaces import (
+    BaseConfig,
+    CliFilesStorageConfig,
+    CliFsspecWriteConfig,
+)
 from unstructured.ingest.cli.utils import (
     add_options,
     conform_click_options,
@@ -83,5 +87,7 @@ class BaseDestCmd(BaseCmd):
         options += self.additional_cli_options
         if self.is_fsspec and CliFilesStorageConfig not in options:
             options.append(CliFilesStorageConfig)
+        if self.is_fsspec and CliFsspecWriteConfig not in options:
+            options.append(CliFsspecWriteConfig)
         add_options(cmd, extras=options, is_src=False)
         return cmd
@@ -35,6 +35,22 @@ class NotionCliConfig(SimpleNotionConfig, CliConfig):
                 type=DelimitedString(),
                 help="Notion database IDs to pull text from",
             ),
+            click.Option(
+                ["--crawl-workers"],
+                default=8,
+                type=int,
+                show_default=True,
+                help="Number of pages and databases fetched concurrently when looking for "
+                "child pages and databases with --recursive",
+            ),
+            click.Option(
+                ["--requests-per-second"],
+                default=3.0,
+                type=float,
+                show_default=True,
+                help="Maximum number of requests sent to the Notion API per second, "
+                "in each process",
+            ),
         ]
         return options
 
@@ -4,8 +4,7 @@ from dataclasses import dataclass
 import click
 
 from unstructured.ingest.cli.interfaces import CliConfig
-from unstructured.ingest.connector.sql import SimpleSqlConfig
-from unstructured.ingest.interfaces import WriteConfig
+from unstructured.ingest.connector.sql import SimpleSqlConfig, SqlWriteConfig
 
 SQL_DRIVERS = {"postgresql", "sqlite"}
 
@@ -55,12 +54,28 @@ class SqlCliConfig(SimpleSqlConfig, CliConfig):
         return options
 
 
+@dataclass
+class SqlCliWriteConfig(SqlWriteConfig, CliConfig):
+    @staticmethod
+    def get_cli_options() -> t.List[click.Option]:
+        options = [
+            click.Option(
+                ["--batch-size"],
+                default=1000,
+                type=click.IntRange(1),
+                help="Number of elements written and committed per multi-row insert batch",
+            ),
+        ]
+        return options
+
+
 def get_base_dest_cmd():
     from unstructured.ingest.cli.base.dest import BaseDestCmd
 
     cmd_cls = BaseDestCmd(
         cmd_name="sql",
         cli_config=SqlCliConfig,
-        write_config=WriteConfig,
+        additional_cli_options=[SqlCliWriteConfig],
+        write_config=SqlWriteConfig,
     )
     return cmd_cls
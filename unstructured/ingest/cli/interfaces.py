@@ -24,6 +24,16 @@ from unstructured.ingest.interfaces import (
     ReadConfig,
     RetryStrategyConfig,
 )
+from unstructured.ingest.pipeline.serialization import (
+    INTERMEDIATE_COMPRESSIONS,
+    INTERMEDIATE_FORMATS,
+    IntermediateFormat,
+)
+from unstructured.partition.utils.cache import (
+    DEFAULT_MAX_SIZE,
+    PARTITION_CACHE_BACKENDS,
+    PartitionCacheBackend,
+)
 
 
 class Dict(click.ParamType):
@@ -213,6 +223,60 @@ class CliProcessorConfig(ProcessorConfig, CliMixin):
                 help="Is set, will raise error if any doc in the pipeline fail. Otherwise will "
                 "log error and continue with other docs",
             ),
+            click.Option(
+                ["--intermediate-format"],
+                type=click.Choice(INTERMEDIATE_FORMATS),
+                default=IntermediateFormat.JSON,
+                show_default=True,
+                help="Format of the files each step writes to the work dir. msgpack is more "
+                "compact and faster to read and write, notably with embeddings, and requires the "
+                "msgpack extra. Final outputs are always written as JSON.",
+            ),
+            click.Option(
+                ["--intermediate-compression"],
+                type=click.Choice(INTERMEDIATE_COMPRESSIONS),
+                default=None,
+                help="Compression of the files each step writes to the work dir. zstd requires "
+                "the zstd extra.",
+            ),
+            click.Option(
+                ["--streaming"],
+                is_flag=True,
+                default=False,
+                help="Move each doc on to the next step (download, partition, chunk, embed, ...) "
+                "as soon as it's ready instead of waiting for all docs to finish a step. Each "
+                "step then gets its own pool of --num-processes workers.",
+            ),
+            click.Option(
+                ["--queue-size"],
+                type=int,
+                default=None,
+                help="With --streaming, the maximum number of docs waiting for each step, "
+                "after which the previous step pauses. Defaults to twice --num-processes.",
+            ),
+            click.Option(
+                ["--incremental"],
+                is_flag=True,
+                default=False,
+                help="Only process the docs that are new or changed since the last run over the "
+                "same work dir, going by the version and modification date the source reports "
+                "for each doc. Docs the source doesn't report either for are always processed.",
+            ),
+            click.Option(
+                ["--delete-removed-docs"],
+                is_flag=True,
+                default=False,
+                help="With --incremental, remove the outputs of the docs that are no longer in "
+                "the source from the output dir and the destination.",
+            ),
+            click.Option(
+                ["--write-batch-size"],
+                type=click.IntRange(min=1),
+                default=None,
+                help="Number of elements handed to the destination in each write, holding at most "
+                "that many in memory. Defaults to 10000, destinations that can only be written to "
+                "at once, like Delta Table, ignore it.",
+            ),
             click.Option(["-v", "--verbose"], is_flag=True, default=False),
         ]
         return options
@@ -353,6 +417,30 @@ class CliPartitionConfig(PartitionConfig, CliMixin):
                 default=None,
                 help="Model name for hi-res strategy.",
             ),
+            click.Option(
+                ["--partition-cache-path"],
+                type=str,
+                default=None,
+                help="Where to cache partition results, keyed by the content of each file and the "
+                "partition options, so files with the same content are only partitioned once, "
+                "across runs. A directory for the disk backend, a database file for sqlite. "
+                "Results aren't cached by default.",
+            ),
+            click.Option(
+                ["--partition-cache-backend"],
+                type=click.Choice(PARTITION_CACHE_BACKENDS),
+                default=PartitionCacheBackend.DISK,
+                show_default=True,
+                help="How partition results are stored with --partition-cache-path.",
+            ),
+            click.Option(
+                ["--partition-cache-max-size"],
+                type=int,
+                default=DEFAULT_MAX_SIZE,
+                show_default=True,
+                help="Size in bytes past which the least recently used partition results are "
+                "evicted from the cache.",
+            ),
         ]
         return options
 
@@ -409,6 +497,22 @@ class CliFilesStorageConfig(FileStorageConfig, CliMixin):
         return options
 
 
+class CliFsspecWriteConfig(CliMixin):
+    @staticmethod
+    def get_cli_options() -> t.List[click.Option]:
+        options = [
+            click.Option(
+                ["--max-concurrent-uploads"],
+                type=int,
+                default=32,
+                show_default=True,
+                help="Number of outputs uploaded concurrently to filesystems that support "
+                "async uploads (e.g. s3, gcs, azure).",
+            ),
+        ]
+        return options
+
+
 class CliEmbeddingConfig(EmbeddingConfig, CliMixin):
     @staticmethod
     def get_cli_options() -> t.List[click.Option]:
@@ -434,6 +538,20 @@ class CliEmbeddingConfig(EmbeddingConfig, CliMixin):
                 type=str,
                 default=None,
             ),
+            click.Option(
+                ["--embedding-batch-size"],
+                help="Number of texts to embed in each request, packing the texts of several "
+                "documents together. Defaults to a batch size suited to the provider.",
+                type=int,
+                default=None,
+            ),
+            click.Option(
+                ["--embedding-cache-path"],
+                help="SQLite database in which to cache embeddings by text, so texts repeated "
+                "across documents and runs are only embedded once. Not cached by default.",
+                type=str,
+                default=None,
+            ),
         ]
         return options
 
@@ -160,6 +160,8 @@ class DeltaTableWriteConfig(WriteConfig):
 class DeltaTableDestinationConnector(BaseDestinationConnector):
     write_config: DeltaTableWriteConfig
     connector_config: SimpleDeltaTableConfig
+    # -- each write creates or overwrites the table depending on the mode, write it all at once --
+    write_batch_size = None
 
     @requires_dependencies(["deltalake"], extras="delta-table")
     def initialize(self):
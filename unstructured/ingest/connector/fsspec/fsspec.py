@@ -1,13 +1,15 @@
+import copy
 import fnmatch
 import json
 import os
 import typing as t
 from abc import ABC
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path, PurePath
 
 from unstructured.ingest.enhanced_dataclass import EnhancedDataClassJsonMixin
+from unstructured.ingest.enhanced_dataclass.core import _asdict
 from unstructured.ingest.error import (
     DestinationConnectionError,
     SourceConnectionError,
@@ -30,10 +32,14 @@ from unstructured.ingest.utils.compression import (
     ZIP_FILE_EXT,
     CompressionSourceConnectorMixin,
 )
+from unstructured.ingest.utils.data_prep import chunk_generator
 from unstructured.utils import (
     requires_dependencies,
 )
 
+if t.TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
 SUPPORTED_REMOTE_FSSPEC_PROTOCOLS = [
     "s3",
     "s3a",
@@ -275,6 +281,7 @@ class WriteTextConfig(EnhancedDataClassJsonMixin, ABC):
 @dataclass
 class FsspecWriteConfig(WriteConfig):
     write_text_config: t.Optional[WriteTextConfig] = None
+    max_concurrent_uploads: int = 32
 
     def get_write_text_config(self) -> t.Dict[str, t.Any]:
         if write_text_kwargs := self.write_text_config:
@@ -286,74 +293,113 @@ class FsspecWriteConfig(WriteConfig):
 class FsspecDestinationConnector(BaseDestinationConnector):
     connector_config: SimpleFsspecConfig
     write_config: FsspecWriteConfig
+    _fs: t.Optional["AbstractFileSystem"] = field(init=False, default=None)
 
-    def initialize(self):
-        from fsspec import AbstractFileSystem, get_filesystem_class
+    def to_dict(self, **kwargs):
+        """
+        The filesystem may hold clients, sessions or an event loop that can't be deep copied.
+        When serializing, remove it, it will be recreated when needed after being deserialized
+        """
+        self_cp = copy.copy(self)
+        setattr(self_cp, "_fs", None)
+        return _asdict(self_cp, **kwargs)
 
-        self.fs: AbstractFileSystem = get_filesystem_class(self.connector_config.protocol)(
-            **self.connector_config.get_access_config(),
-        )
-        self.check_connection()
-
-    def check_connection(self):
-        from fsspec import AbstractFileSystem, get_filesystem_class
+    @property
+    def fs(self) -> "AbstractFileSystem":
+        """Filesystem of the destination, created once and reused for every upload."""
+        if self._fs is None:
+            from fsspec import get_filesystem_class
 
-        try:
-            fs: AbstractFileSystem = get_filesystem_class(self.connector_config.protocol)(
+            self._fs = get_filesystem_class(self.connector_config.protocol)(
                 **self.connector_config.get_access_config(),
             )
+        return self._fs
 
+    def initialize(self):
+        _ = self.fs
+        self.check_connection()
+
+    def check_connection(self):
+        try:
             # e.g. Dropbox path starts with /
             bucket_name = "/" if self.connector_config.path_without_protocol.startswith("/") else ""
             bucket_name += self.connector_config.dir_path.split("/")[0]
 
             logger.info(f"checking connection for destination {bucket_name}")
-            fs.ls(path=bucket_name, detail=False)
+            self.fs.ls(path=bucket_name, detail=False)
         except Exception as e:
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
+    def get_output_path(self, filename: t.Optional[str] = None) -> str:
+        output_folder = self.connector_config.path_without_protocol
+        output_folder = os.path.join(output_folder)  # Make sure folder ends with file seperator
+        filename = (
+            filename.strip(os.sep) if filename else filename
+        )  # Make sure filename doesn't begin with file seperator
+        output_path = str(PurePath(output_folder, filename)) if filename else output_folder
+        return f"{self.connector_config.protocol}://{output_path}"
+
     def write_dict(
         self,
         *args,
         elements_dict: t.List[t.Dict[str, t.Any]],
         filename: t.Optional[str] = None,
-        indent: int = 4,
+        indent: t.Optional[int] = None,
         encoding: str = "utf-8",
         **kwargs,
     ) -> None:
-        from fsspec import AbstractFileSystem, get_filesystem_class
-
-        fs: AbstractFileSystem = get_filesystem_class(self.connector_config.protocol)(
-            **self.connector_config.get_access_config(),
-        )
+        logger.info(f"Writing content using filesystem: {type(self.fs).__name__}")
+        full_output_path = self.get_output_path(filename=filename)
+        logger.debug(f"uploading content to {full_output_path}")
+        self.upload({full_output_path: json.dumps(elements_dict, indent=indent).encode(encoding)})
 
-        logger.info(f"Writing content using filesystem: {type(fs).__name__}")
+    def upload(self, contents: t.Dict[str, bytes]) -> None:
+        """Writes each of `contents` to its path.
 
-        output_folder = self.connector_config.path_without_protocol
-        output_folder = os.path.join(output_folder)  # Make sure folder ends with file seperator
-        filename = (
-            filename.strip(os.sep) if filename else filename
-        )  # Make sure filename doesn't begin with file seperator
-        output_path = str(PurePath(output_folder, filename)) if filename else output_folder
-        full_output_path = f"{self.connector_config.protocol}://{output_path}"
-        logger.debug(f"uploading content to {full_output_path}")
+        Filesystems with an async implementation (e.g. s3, gcs, azure) upload up to
+        `max_concurrent_uploads` of them concurrently, others upload them one at a time.
+        """
         write_text_configs = self.write_config.get_write_text_config() if self.write_config else {}
-        fs.write_text(
-            full_output_path,
-            json.dumps(elements_dict, indent=indent),
-            encoding=encoding,
-            **write_text_configs,
-        )
+        if self.fs.async_impl:
+            self.fs.pipe(
+                contents,
+                batch_size=max(self.write_config.max_concurrent_uploads, 1),
+                **write_text_configs,
+            )
+        else:
+            for path, data in contents.items():
+                self.fs.pipe_file(path, data, **write_text_configs)
 
     def get_elements_dict(self, docs: t.List[BaseSingleIngestDoc]) -> t.List[t.Dict[str, t.Any]]:
         pass
 
     def write(self, docs: t.List[BaseSingleIngestDoc]) -> None:
-        for doc in docs:
-            file_path = doc.base_output_filename
-            filename = file_path if file_path else None
-            with open(doc._output_filename) as json_file:
-                logger.debug(f"uploading content from {doc._output_filename}")
-                json_list = json.load(json_file)
-                self.write_dict(elements_dict=json_list, filename=filename)
+        logger.info(f"Writing content using filesystem: {type(self.fs).__name__}")
+        # -- the outputs are read and uploaded a group at a time, keeping all the uploads of a
+        # -- group in flight while bounding how much is held in memory --
+        group_size = 4 * max(self.write_config.max_concurrent_uploads, 1)
+        for group in chunk_generator(docs, group_size):
+            contents: t.Dict[str, bytes] = {}
+            for doc in group:
+                file_path = doc.base_output_filename
+                filename = file_path if file_path else None
+                with open(doc._output_filename, "rb") as json_file:
+                    logger.debug(f"uploading content from {doc._output_filename}")
+                    json_list = json.load(json_file)
+                contents[self.get_output_path(filename=filename)] = json.dumps(json_list).encode(
+                    "utf-8"
+                )
+            self.upload(contents)
+
+    def delete(self, docs: t.List[BaseSingleIngestDoc]) -> None:
+        # -- docs without an output filename were written to the output folder itself --
+        paths = [
+            self.get_output_path(filename=doc.base_output_filename)
+            for doc in docs
+            if doc.base_output_filename
+        ]
+        logger.info(f"Deleting {len(paths)} outputs using filesystem: {type(self.fs).__name__}")
+        for path in paths:
+            if self.fs.exists(path):
+                self.fs.rm(path)
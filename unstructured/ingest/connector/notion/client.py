@@ -1,3 +1,5 @@
+import threading
+import time
 from typing import Any, Generator, List, Optional, Tuple
 
 import backoff
@@ -41,6 +43,25 @@ def get_retry_handler(endpoint: Endpoint) -> Optional[RetryHandler]:
     return None
 
 
+class RateLimiter:
+    """Spaces out requests so at most `requests_per_second` of them are sent each second, across
+    all the threads sharing the limiter."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second
+        self._lock = threading.Lock()
+        self._next_request_time = 0.0
+
+    def wait(self):
+        """Blocks until the next request can be sent."""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
 class BlocksChildrenEndpoint(NotionBlocksChildrenEndpoint):
     def __init__(
         self,
@@ -111,6 +132,7 @@ class DatabasesEndpoint(NotionDatabasesEndpoint):
             path=f"databases/{database_id}",
             auth=kwargs.get("auth"),
         )
+        self.parent.wait_for_rate_limit()
         try:
             response: httpx.Response = (
                 self.retry_handler(self.parent.client.send, request)
@@ -209,6 +231,7 @@ class PagesEndpoint(NotionPagesEndpoint):
             path=f"pages/{page_id}",
             auth=kwargs.get("auth"),
         )
+        self.parent.wait_for_rate_limit()
         try:
             response: httpx.Response = (
                 self.retry_handler(self.parent.client.send, request)
@@ -225,9 +248,19 @@ class Client(NotionClient):
         self,
         *args: Any,
         retry_strategy_config: Optional[RetryStrategyConfig] = None,
+        requests_per_second: Optional[float] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
+        self.rate_limiter = RateLimiter(requests_per_second) if requests_per_second else None
         self.blocks = BlocksEndpoint(retry_strategy_config=retry_strategy_config, parent=self)
         self.pages = PagesEndpoint(retry_strategy_config=retry_strategy_config, parent=self)
         self.databases = DatabasesEndpoint(retry_strategy_config=retry_strategy_config, parent=self)
+
+    def wait_for_rate_limit(self):
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        self.wait_for_rate_limit()
+        return super().request(*args, **kwargs)
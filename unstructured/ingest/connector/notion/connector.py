@@ -39,6 +39,10 @@ class SimpleNotionConfig(BaseConnectorConfig):
     page_ids: t.Optional[t.List[str]] = None
     database_ids: t.Optional[t.List[str]] = None
     recursive: bool = False
+    # -- number of pages and databases fetched concurrently when crawling recursively --
+    crawl_workers: int = 8
+    # -- Notion allows an average of 3 requests per second per integration --
+    requests_per_second: t.Optional[float] = 3.0
 
     def __post_init__(self):
         if self.page_ids:
@@ -85,6 +89,7 @@ class NotionPageIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             logger=logger,
             log_level=logger.level,
             retry_strategy_config=self.retry_strategy_config,
+            requests_per_second=self.connector_config.requests_per_second,
         )
 
     @BaseSingleIngestDoc.skip_if_file_exists
@@ -205,6 +210,7 @@ class NotionDatabaseIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             logger=logger,
             log_level=logger.level,
             retry_strategy_config=self.retry_strategy_config,
+            requests_per_second=self.connector_config.requests_per_second,
         )
 
     @BaseSingleIngestDoc.skip_if_file_exists
@@ -314,6 +320,7 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             logger=logger,
             log_level=logger.level,
             retry_strategy_config=self.retry_strategy_config,
+            requests_per_second=self.connector_config.requests_per_second,
         )
 
     def check_connection(self):
@@ -347,6 +354,7 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             client=self.client,
             page_id=page_id,
             logger=logger,
+            max_workers=self.connector_config.crawl_workers,
         )
         return child_content
 
@@ -359,6 +367,7 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             client=self.client,
             page_id=page_id,
             logger=logger,
+            max_workers=self.connector_config.crawl_workers,
         )
         return child_content
 
@@ -379,6 +388,7 @@ class NotionSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
             client=self.client,
             database_id=database_id,
             logger=logger,
+            max_workers=self.connector_config.crawl_workers,
         )
         return child_content
 
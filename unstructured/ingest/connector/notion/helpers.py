@@ -1,7 +1,8 @@
 import enum
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 from uuid import UUID
 
@@ -204,11 +205,13 @@ def get_recursive_content_from_page(
     client: Client,
     page_id: str,
     logger: logging.Logger,
+    max_workers: int = 1,
 ) -> ChildExtractionResponse:
     return get_recursive_content(
         client=client,
         init_entry=QueueEntry(type=QueueEntryType.PAGE, id=UUID(page_id)),
         logger=logger,
+        max_workers=max_workers,
     )
 
 
@@ -216,11 +219,13 @@ def get_recursive_content_from_database(
     client: Client,
     database_id: str,
     logger: logging.Logger,
+    max_workers: int = 1,
 ) -> ChildExtractionResponse:
     return get_recursive_content(
         client=client,
         init_entry=QueueEntry(type=QueueEntryType.DATABASE, id=UUID(database_id)),
         logger=logger,
+        max_workers=max_workers,
     )
 
 
@@ -228,144 +233,150 @@ def get_recursive_content(
     client: Client,
     init_entry: QueueEntry,
     logger: logging.Logger,
+    max_workers: int = 1,
 ) -> ChildExtractionResponse:
-    parents: List[QueueEntry] = [init_entry]
+    """Ids of all the pages and databases found under `init_entry`, following child pages and
+    databases, links to pages and database entries.
+
+    The children of up to `max_workers` pages and databases are fetched concurrently, and each
+    page or database is only fetched once. Pages and databases that can't be fetched are left out.
+    """
     child_pages: List[str] = []
     child_dbs: List[str] = []
-    processed: List[str] = []
-    while len(parents) > 0:
-        parent: QueueEntry = parents.pop()
-        processed.append(str(parent.id))
-        if parent.type == QueueEntryType.PAGE:
-            logger.debug(f"Getting child data from page: {parent.id}")
-            page_children = []
-            try:
-                for children_block in client.blocks.children.iterate_list(  # type: ignore
-                    block_id=str(parent.id),
+    processed: Set[str] = {str(init_entry.id)}
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures: Dict[Future, QueueEntry] = {
+            executor.submit(_get_child_content, client, init_entry, logger): init_entry,
+        }
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                parent = futures.pop(future)
+                try:
+                    child_content = future.result()
+                except APIResponseError as api_error:
+                    logger.error(
+                        f"failed to get {parent.type.value} with id {parent.id}: {api_error}",
+                    )
+                    if str(parent.id) in child_pages:
+                        child_pages.remove(str(parent.id))
+                    if str(parent.id) in child_dbs:
+                        child_dbs.remove(str(parent.id))
+                    continue
+
+                for entry_type, ids, found in (
+                    (QueueEntryType.PAGE, child_content.child_pages, child_pages),
+                    (QueueEntryType.DATABASE, child_content.child_databases, child_dbs),
                 ):
-                    page_children.extend(children_block)
-            except APIResponseError as api_error:
-                logger.error(f"failed to get page with id {parent.id}: {api_error}")
-                if str(parent.id) in child_pages:
-                    child_pages.remove(str(parent.id))
-                continue
-            if not page_children:
-                continue
-
-            # Extract child pages
-            child_pages_from_page = [
-                c for c in page_children if isinstance(c.block, notion_blocks.ChildPage)
-            ]
-            if child_pages_from_page:
-                child_page_blocks: List[notion_blocks.ChildPage] = [
-                    p.block
-                    for p in child_pages_from_page
-                    if isinstance(p.block, notion_blocks.ChildPage)
-                ]
-                logger.debug(
-                    "found child pages from parent page {}: {}".format(
-                        parent.id,
-                        ", ".join([block.title for block in child_page_blocks]),
-                    ),
-                )
-            new_pages = [p.id for p in child_pages_from_page if p.id not in processed]
-            new_pages = list(set(new_pages))
-            child_pages.extend(new_pages)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.PAGE, id=UUID(i)) for i in new_pages],
-            )
+                    for child_id in ids:
+                        if child_id in processed:
+                            continue
+                        processed.add(child_id)
+                        found.append(child_id)
+                        entry = QueueEntry(type=entry_type, id=UUID(child_id))
+                        futures[executor.submit(_get_child_content, client, entry, logger)] = entry
 
-            # Extract child databases
-            child_dbs_from_page = [
-                c for c in page_children if isinstance(c.block, notion_blocks.ChildDatabase)
-            ]
-            if child_dbs_from_page:
-                child_db_blocks: List[notion_blocks.ChildDatabase] = [
-                    c.block
-                    for c in page_children
-                    if isinstance(c.block, notion_blocks.ChildDatabase)
-                ]
-                logger.debug(
-                    "found child database from parent page {}: {}".format(
-                        parent.id,
-                        ", ".join([block.title for block in child_db_blocks]),
-                    ),
-                )
-            new_dbs = [db.id for db in child_dbs_from_page if db.id not in processed]
-            new_dbs = list(set(new_dbs))
-            child_dbs.extend(new_dbs)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.DATABASE, id=UUID(i)) for i in new_dbs],
-            )
+    return ChildExtractionResponse(
+        child_pages=child_pages,
+        child_databases=child_dbs,
+    )
 
-            linked_to_others: List[notion_blocks.LinkToPage] = [
-                c.block for c in page_children if isinstance(c.block, notion_blocks.LinkToPage)
-            ]
-            for link in linked_to_others:
-                if (page_id := link.page_id) and (
-                    page_id not in processed and page_id not in child_pages
-                ):
-                    child_pages.append(page_id)
-                    parents.append(QueueEntry(type=QueueEntryType.PAGE, id=UUID(page_id)))
-                if (database_id := link.database_id) and (
-                    database_id not in processed and database_id not in child_dbs
-                ):
-                    child_dbs.append(database_id)
-                    parents.append(
-                        QueueEntry(type=QueueEntryType.DATABASE, id=UUID(database_id)),
-                    )
 
-        elif parent.type == QueueEntryType.DATABASE:
-            logger.debug(f"Getting child data from database: {parent.id}")
-            database_pages = []
-            try:
-                for page_entries in client.databases.iterate_query(  # type: ignore
-                    database_id=str(parent.id),
-                ):
-                    database_pages.extend(page_entries)
-            except APIResponseError as api_error:
-                logger.error(f"failed to get database with id {parent.id}: {api_error}")
-                if str(parent.id) in child_dbs:
-                    child_dbs.remove(str(parent.id))
-                continue
-            if not database_pages:
-                continue
-
-            child_pages_from_db = [
-                p for p in database_pages if is_page_url(client=client, url=p.url)
-            ]
-            if child_pages_from_db:
-                logger.debug(
-                    "found child pages from parent database {}: {}".format(
-                        parent.id,
-                        ", ".join([p.url for p in child_pages_from_db]),
-                    ),
-                )
-            new_pages = [p.id for p in child_pages_from_db if p.id not in processed]
-            child_pages.extend(new_pages)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.PAGE, id=UUID(i)) for i in new_pages],
-            )
+def _get_child_content(
+    client: Client,
+    parent: QueueEntry,
+    logger: logging.Logger,
+) -> ChildExtractionResponse:
+    """Ids of the pages and databases directly under a page or database."""
+    if parent.type == QueueEntryType.PAGE:
+        return _get_child_content_from_page(client=client, page_id=str(parent.id), logger=logger)
+    return _get_child_content_from_database(
+        client=client,
+        database_id=str(parent.id),
+        logger=logger,
+    )
 
-            child_dbs_from_db = [
-                p for p in database_pages if is_database_url(client=client, url=p.url)
-            ]
-            if child_dbs_from_db:
-                logger.debug(
-                    "found child database from parent database {}: {}".format(
-                        parent.id,
-                        ", ".join([db.url for db in child_dbs_from_db]),
-                    ),
-                )
-            new_dbs = [db.id for db in child_dbs_from_db if db.id not in processed]
-            child_dbs.extend(new_dbs)
-            parents.extend(
-                [QueueEntry(type=QueueEntryType.DATABASE, id=UUID(i)) for i in new_dbs],
-            )
+
+def _get_child_content_from_page(
+    client: Client,
+    page_id: str,
+    logger: logging.Logger,
+) -> ChildExtractionResponse:
+    logger.debug(f"Getting child data from page: {page_id}")
+    page_children = []
+    for children_block in client.blocks.children.iterate_list(  # type: ignore
+        block_id=page_id,
+    ):
+        page_children.extend(children_block)
+    child_pages: List[str] = []
+    child_dbs: List[str] = []
+
+    # Extract child pages
+    child_page_blocks = [c for c in page_children if isinstance(c.block, notion_blocks.ChildPage)]
+    if child_page_blocks:
+        logger.debug(
+            "found child pages from parent page {}: {}".format(
+                page_id,
+                ", ".join([c.block.title for c in child_page_blocks]),
+            ),
+        )
+    child_pages.extend(str(UUID(c.id)) for c in child_page_blocks)
+
+    # Extract child databases
+    child_db_blocks = [c for c in page_children if isinstance(c.block, notion_blocks.ChildDatabase)]
+    if child_db_blocks:
+        logger.debug(
+            "found child database from parent page {}: {}".format(
+                page_id,
+                ", ".join([c.block.title for c in child_db_blocks]),
+            ),
+        )
+    child_dbs.extend(str(UUID(c.id)) for c in child_db_blocks)
+
+    for c in page_children:
+        if isinstance(c.block, notion_blocks.LinkToPage):
+            if linked_page_id := c.block.page_id:
+                child_pages.append(str(UUID(linked_page_id)))
+            if linked_database_id := c.block.database_id:
+                child_dbs.append(str(UUID(linked_database_id)))
+
+    return ChildExtractionResponse(child_pages=child_pages, child_databases=child_dbs)
+
+
+def _get_child_content_from_database(
+    client: Client,
+    database_id: str,
+    logger: logging.Logger,
+) -> ChildExtractionResponse:
+    logger.debug(f"Getting child data from database: {database_id}")
+    database_pages = []
+    for page_entries in client.databases.iterate_query(  # type: ignore
+        database_id=database_id,
+    ):
+        database_pages.extend(page_entries)
+
+    child_pages_from_db = [p for p in database_pages if is_page_url(client=client, url=p.url)]
+    if child_pages_from_db:
+        logger.debug(
+            "found child pages from parent database {}: {}".format(
+                database_id,
+                ", ".join([p.url for p in child_pages_from_db]),
+            ),
+        )
+
+    child_dbs_from_db = [p for p in database_pages if is_database_url(client=client, url=p.url)]
+    if child_dbs_from_db:
+        logger.debug(
+            "found child database from parent database {}: {}".format(
+                database_id,
+                ", ".join([db.url for db in child_dbs_from_db]),
+            ),
+        )
 
     return ChildExtractionResponse(
-        child_pages=child_pages,
-        child_databases=child_dbs,
+        child_pages=[str(UUID(p.id)) for p in child_pages_from_db],
+        child_databases=[str(UUID(db.id)) for db in child_dbs_from_db],
     )
 
 
@@ -11,6 +11,7 @@ from unstructured.ingest.interfaces import (
     AccessConfig,
     BaseConnectorConfig,
     BaseDestinationConnector,
+    WriteConfig,
 )
 from unstructured.ingest.logger import logger
 from unstructured.utils import requires_dependencies
@@ -65,8 +66,14 @@ class SimpleSqlConfig(BaseConnectorConfig):
         )
 
 
+@dataclass
+class SqlWriteConfig(WriteConfig):
+    batch_size: int = 1000
+
+
 @dataclass
 class SqlDestinationConnector(BaseDestinationConnector):
+    write_config: SqlWriteConfig
     connector_config: SimpleSqlConfig
     _client: t.Optional[t.Any] = field(init=False, default=None)
 
@@ -169,6 +176,34 @@ class SqlDestinationConnector(BaseDestinationConnector):
         if data.get("metadata", {}):
             data.update(data.pop("metadata", None))
 
+    def _prepare_values(self, elem: t.Dict[str, t.Any]) -> t.List[t.Any]:
+        values = []
+        for v in elem.values():
+            if self.connector_config.db_type == "sqlite" and isinstance(v, list):
+                values.append(json.dumps(v))
+            else:
+                values.append(v)
+        return values
+
+    def _insert_rows(
+        self,
+        cursor: t.Any,
+        columns: t.Tuple[str, ...],
+        rows: t.List[t.List[t.Any]],
+    ) -> None:
+        """Inserts rows that all have the same columns with a single statement."""
+        if self.connector_config.db_type == "postgresql":
+            from psycopg2.extras import execute_values
+
+            query = f"INSERT INTO {ELEMENTS_TABLE_NAME} ({','.join(columns)}) VALUES %s"
+            execute_values(cursor, query, rows, page_size=len(rows))
+        else:
+            placeholders = ",".join(["?"] * len(columns))
+            query = (
+                f"INSERT INTO {ELEMENTS_TABLE_NAME} ({','.join(columns)}) VALUES({placeholders})"
+            )
+            cursor.executemany(query, rows)
+
     @DestinationConnectionError.wrap
     def write_dict(self, *args, elements_dict: t.List[t.Dict[str, t.Any]], **kwargs) -> None:
         logger.info(
@@ -176,23 +211,29 @@ class SqlDestinationConnector(BaseDestinationConnector):
             f"at {self.connector_config.host}"
         )
 
+        batch_size = max(self.write_config.batch_size, 1)
         with self.client as conn:
             cursor = conn.cursor()
 
-            # Since we have no guarantee that each element will have the same keys
-            # we insert each element individually
-            for elem in elements_dict:
-                query = f"INSERT INTO {ELEMENTS_TABLE_NAME} ({','.join(elem.keys())}) \
-                VALUES({','.join(['?' if self.connector_config.db_type=='sqlite' else '%s' for x in elem])})"  # noqa E501
-                values = []
-                for v in elem.values():
-                    if self.connector_config.db_type == "sqlite" and isinstance(v, list):
-                        values.append(json.dumps(v))
-                    else:
-                        values.append(v)
-                cursor.execute(query, values)
-
-            conn.commit()
+            for batch_start in range(0, len(elements_dict), batch_size):
+                batch = elements_dict[batch_start : batch_start + batch_size]
+
+                # Since we have no guarantee that each element will have the same keys,
+                # elements of the batch are grouped by their columns and each group is
+                # inserted with a single multi-row statement
+                rows_by_columns: t.Dict[t.Tuple[str, ...], t.List[t.List[t.Any]]] = {}
+                for elem in batch:
+                    rows_by_columns.setdefault(tuple(elem.keys()), []).append(
+                        self._prepare_values(elem)
+                    )
+                for columns, rows in rows_by_columns.items():
+                    self._insert_rows(cursor, columns, rows)
+
+                conn.commit()
+                logger.debug(
+                    f"committed batch of {len(batch)} elements as "
+                    f"{len(rows_by_columns)} multi-row inserts"
+                )
             cursor.close()
 
         # Leaving contexts doesn't close the connection, so doing it here
@@ -65,6 +65,19 @@ def main():
     show_default=True,
     help="Takes in either `txt` or `json` as output_type.",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of processes to score the documents with.",
+)
+@click.option(
+    "--cache_dir",
+    type=str,
+    help="Optional: directory to cache the scores of each document in, reused as long as the \
+        document, its gold-standard and the options of the metric don't change.",
+)
 def measure_text_extraction_accuracy_command(
     output_dir: str,
     source_dir: str,
@@ -72,9 +85,11 @@ def measure_text_extraction_accuracy_command(
     weights: Tuple[int, int, int],
     visualize: bool,
     output_type: str,
+    workers: int,
     output_list: Optional[List[str]] = None,
     source_list: Optional[List[str]] = None,
     group_by: Optional[str] = None,
+    cache_dir: Optional[str] = None,
 ):
     return measure_text_extraction_accuracy(
         output_dir,
@@ -86,6 +101,8 @@ def measure_text_extraction_accuracy_command(
         weights,
         visualize,
         output_type,
+        workers,
+        cache_dir,
     )
 
 
@@ -120,16 +137,38 @@ def measure_text_extraction_accuracy_command(
     default=False,
     help="Add the flag to show progress bar.",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of processes to score the documents with.",
+)
+@click.option(
+    "--cache_dir",
+    type=str,
+    help="Optional: directory to cache the scores of each document in, reused as long as the \
+        document, its gold-standard and the options of the metric don't change.",
+)
 def measure_element_type_accuracy_command(
     output_dir: str,
     source_dir: str,
     export_dir: str,
     visualize: bool,
+    workers: int,
     output_list: Optional[List[str]] = None,
     source_list: Optional[List[str]] = None,
+    cache_dir: Optional[str] = None,
 ):
     return measure_element_type_accuracy(
-        output_dir, source_dir, output_list, source_list, export_dir, visualize
+        output_dir,
+        source_dir,
+        output_list,
+        source_list,
+        export_dir,
+        visualize=visualize,
+        workers=workers,
+        cache_dir=cache_dir,
     )
 
 
@@ -206,17 +245,40 @@ def get_mean_grouping_command(
     help="The cutoff value for the element level alignment. \
         If not set, a default value is used",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of processes to score the documents with.",
+)
+@click.option(
+    "--cache_dir",
+    type=str,
+    help="Optional: directory to cache the scores of each document in, reused as long as the \
+        document, its gold-standard and the options of the metric don't change.",
+)
 def measure_table_structure_accuracy_command(
     output_dir: str,
     source_dir: str,
     export_dir: str,
     visualize: bool,
+    workers: int,
     output_list: Optional[List[str]] = None,
     source_list: Optional[List[str]] = None,
     cutoff: Optional[float] = None,
+    cache_dir: Optional[str] = None,
 ):
     return measure_table_structure_accuracy(
-        output_dir, source_dir, output_list, source_list, export_dir, visualize, cutoff
+        output_dir,
+        source_dir,
+        output_list,
+        source_list,
+        export_dir,
+        visualize,
+        cutoff,
+        workers,
+        cache_dir,
     )
 
 
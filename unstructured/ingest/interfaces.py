@@ -22,6 +22,8 @@ from unstructured.ingest.enhanced_dataclass import EnhancedDataClassJsonMixin, e
 from unstructured.ingest.enhanced_dataclass.core import _asdict
 from unstructured.ingest.error import PartitionError, SourceConnectionError
 from unstructured.ingest.logger import logger
+from unstructured.ingest.utils.data_prep import chunk_generator
+from unstructured.partition.utils.cache import DEFAULT_MAX_SIZE, PartitionCacheBackend
 from unstructured.staging.base import elements_to_dicts, flatten_dict
 
 A = t.TypeVar("A", bound="DataClassJsonMixin")
@@ -97,6 +99,10 @@ class PartitionConfig(BaseConfig):
     partition_by_api: bool = False
     api_key: t.Optional[str] = enhanced_field(default=None, sensitive=True)
     hi_res_model_name: t.Optional[str] = None
+    # -- partition results are cached when a path is set, which doesn't change the results --
+    partition_cache_path: t.Optional[str] = None
+    partition_cache_backend: str = PartitionCacheBackend.DISK
+    partition_cache_max_size: int = DEFAULT_MAX_SIZE
 
 
 @dataclass
@@ -107,6 +113,13 @@ class ProcessorConfig(BaseConfig):
     output_dir: str = "structured-output"
     num_processes: int = 2
     raise_on_error: bool = False
+    intermediate_format: str = "json"
+    intermediate_compression: t.Optional[str] = None
+    streaming: bool = False
+    queue_size: t.Optional[int] = None
+    incremental: bool = False
+    delete_removed_docs: bool = False
+    write_batch_size: t.Optional[int] = None
 
 
 @dataclass
@@ -186,6 +199,10 @@ class EmbeddingConfig(BaseConfig):
     provider: str
     api_key: t.Optional[str] = enhanced_field(default=None, sensitive=True)
     model_name: t.Optional[str] = None
+    # -- the number of texts per request, packed across documents, defaults to the encoder's --
+    batch_size: t.Optional[int] = None
+    # -- where embeddings are cached by text, to only embed each text once across runs --
+    cache_path: t.Optional[str] = None
 
     def get_embedder(self) -> BaseEmbeddingEncoder:
         kwargs = {}
@@ -676,6 +693,13 @@ class BaseSourceConnector(BaseConnector, ABC):
 class BaseDestinationConnector(BaseConnector, ABC):
     write_config: WriteConfig
     connector_config: BaseConnectorConfig
+    # -- the number of elements handed to each `write_dict()` call by `write()`, which reads the
+    # -- outputs of the docs one at a time, so that many elements at most are held in memory
+    # -- whatever the number of docs. None writes all the elements in a single call, for
+    # -- destinations that can't be written to in several calls. --
+    write_batch_size: t.ClassVar[t.Optional[int]] = 10_000
+    # -- the batch size set with `--write-batch-size`, in place of `write_batch_size` --
+    configured_write_batch_size: t.Optional[int] = field(init=False, default=None)
 
     def __init__(self, write_config: WriteConfig, connector_config: BaseConnectorConfig):
         self.write_config = write_config
@@ -698,26 +722,56 @@ class BaseDestinationConnector(BaseConnector, ABC):
         """Initializes the connector. Should also validate the connector is properly
         configured."""
 
+    def get_write_batch_size(self) -> t.Optional[int]:
+        """The number of elements handed to each `write_dict()` call, the configured one unless
+        the destination can only be written to in a single call."""
+        if self.write_batch_size is None:
+            return None
+        return self.configured_write_batch_size or self.write_batch_size
+
     def write(self, docs: t.List[BaseSingleIngestDoc]) -> None:
-        elements_dict = self.get_elements_dict(docs=docs)
-        self.modify_and_write_dict(elements_dict=elements_dict)
+        elements_dict = self._modify_dicts(self.iter_elements_dict(docs=docs))
+        batch_size = self.get_write_batch_size()
+        if batch_size is None:
+            self.write_dict(elements_dict=list(elements_dict))
+            return
+        for batch in chunk_generator(elements_dict, batch_size):
+            self.write_dict(elements_dict=list(batch))
 
-    def get_elements_dict(self, docs: t.List[BaseSingleIngestDoc]) -> t.List[t.Dict[str, t.Any]]:
-        dict_list: t.List[t.Dict[str, t.Any]] = []
+    def iter_elements_dict(
+        self, docs: t.Iterable[BaseSingleIngestDoc]
+    ) -> t.Iterator[t.Dict[str, t.Any]]:
+        """Elements of `docs`, reading the output of a single doc at a time."""
         for doc in docs:
             local_path = doc._output_filename
             with open(local_path) as json_file:
                 dict_content = json.load(json_file)
-                logger.info(
-                    f"Extending {len(dict_content)} json elements from content in {local_path}",
-                )
-                dict_list.extend(dict_content)
-        return dict_list
+            logger.info(
+                f"Extending {len(dict_content)} json elements from content in {local_path}",
+            )
+            yield from dict_content
+
+    def get_elements_dict(self, docs: t.List[BaseSingleIngestDoc]) -> t.List[t.Dict[str, t.Any]]:
+        return list(self.iter_elements_dict(docs=docs))
 
     @abstractmethod
     def write_dict(self, *args, elements_dict: t.List[t.Dict[str, t.Any]], **kwargs) -> None:
         pass
 
+    def delete(self, docs: t.List[BaseSingleIngestDoc]) -> None:
+        """Removes the elements written for `docs` by earlier runs, which is how docs deleted
+        from the source get deleted from the destination with incremental runs."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't support deleting the elements of docs",
+        )
+
+    def _modify_dicts(
+        self, elements_dict: t.Iterable[t.Dict[str, t.Any]]
+    ) -> t.Iterator[t.Dict[str, t.Any]]:
+        for d in elements_dict:
+            self.conform_dict(data=d)
+            yield self.normalize_dict(element_dict=d)
+
     def modify_and_write_dict(
         self, *args, elements_dict: t.List[t.Dict[str, t.Any]], **kwargs
     ) -> None:
@@ -725,9 +779,7 @@ class BaseDestinationConnector(BaseConnector, ABC):
         Modify in this instance means this method wraps calls to conform_dict() and
         normalize() before actually processing the content via write_dict()
         """
-        for d in elements_dict:
-            self.conform_dict(data=d)
-        elements_dict_normalized = [self.normalize_dict(element_dict=d) for d in elements_dict]
+        elements_dict_normalized = list(self._modify_dicts(elements_dict))
         return self.write_dict(*args, elements_dict=elements_dict_normalized, **kwargs)
 
     def write_elements(self, elements: t.List[Element], *args, **kwargs) -> None:
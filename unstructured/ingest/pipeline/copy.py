@@ -1,19 +1,28 @@
-import os
+import json
 import shutil
 from pathlib import Path
 
 from unstructured.ingest.connector.registry import create_ingest_doc_from_dict
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import CopyNode
+from unstructured.ingest.pipeline.serialization import (
+    get_intermediate_name,
+    is_plain_json,
+    read_element_dicts,
+)
 
 
 class Copier(CopyNode):
     def run(self, json_path: str):
-        filename = os.path.basename(json_path)
-        doc_hash = os.path.splitext(filename)[0]
+        doc_hash = get_intermediate_name(json_path)
         ingest_doc_dict = self.pipeline_context.ingest_docs_map[doc_hash]
         ingest_doc = create_ingest_doc_from_dict(ingest_doc_dict)
         desired_output = ingest_doc._output_filename
         Path(desired_output).parent.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Copying {json_path} -> {desired_output}")
-        shutil.copy(json_path, desired_output)
+        if is_plain_json(json_path):
+            logger.info(f"Copying {json_path} -> {desired_output}")
+            shutil.copy(json_path, desired_output)
+        else:
+            logger.info(f"Converting {json_path} -> {desired_output}")
+            with open(desired_output, "w", encoding="utf8") as output_f:
+                json.dump(read_element_dicts(json_path), output_f, ensure_ascii=False, indent=2)
@@ -0,0 +1,83 @@
+"""Registry of the ingest docs of a pipeline, keyed by the hashes used to name intermediate files.
+
+The registry is a SQLite database in the `work_dir`, so every worker process reads and writes it
+directly instead of going through a manager process, and it outlives the run: docs registered by
+an interrupted run can still be looked up when the pipeline is run again over the same `work_dir`.
+"""
+
+import json
+import typing as t
+from pathlib import Path
+
+from unstructured.sqlite import MAX_QUERY_PARAMS, SQLiteStore
+
+
+class IngestDocRegistry(SQLiteStore):
+    """Dict-like mapping of hashes to ingest doc dicts, stored in a SQLite database.
+
+    A hash can also be linked to the doc of another hash with `link()`, which is how reformat
+    nodes register their outputs without storing another copy of the doc.
+    """
+
+    def __init__(self, path: t.Union[str, Path]):
+        super().__init__(path)
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ingest_docs "
+                "(hash TEXT PRIMARY KEY, doc TEXT, source_hash TEXT)",
+            )
+
+    def __setitem__(self, doc_hash: str, doc: t.Dict[str, t.Any]):
+        self.update({doc_hash: doc})
+
+    def update(self, docs: t.Mapping[str, t.Dict[str, t.Any]]):
+        """Registers all of `docs` in a single transaction."""
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO ingest_docs (hash, doc, source_hash) VALUES (?, ?, NULL)",
+                [(doc_hash, json.dumps(dict(doc))) for doc_hash, doc in docs.items()],
+            )
+
+    def link(self, doc_hash: str, existing_hash: str):
+        """Registers `doc_hash` as referring to the same doc as `existing_hash`."""
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "INSERT OR REPLACE INTO ingest_docs (hash, doc, source_hash) "
+                "SELECT ?, NULL, COALESCE(source_hash, hash) FROM ingest_docs WHERE hash = ?",
+                (doc_hash, existing_hash),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(existing_hash)
+
+    def __getitem__(self, doc_hash: str) -> t.Dict[str, t.Any]:
+        docs = self.get_many([doc_hash])
+        if doc_hash not in docs:
+            raise KeyError(doc_hash)
+        return docs[doc_hash]
+
+    def __contains__(self, doc_hash: object) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM ingest_docs WHERE hash = ?",
+                (doc_hash,),
+            ).fetchone()
+            is not None
+        )
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM ingest_docs").fetchone()[0]
+
+    def get_many(self, doc_hashes: t.Iterable[str]) -> t.Dict[str, t.Dict[str, t.Any]]:
+        """Docs of those of `doc_hashes` that are registered, looked up in batches."""
+        doc_hashes = list(doc_hashes)
+        docs: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for i in range(0, len(doc_hashes), MAX_QUERY_PARAMS):
+            batch = doc_hashes[i : i + MAX_QUERY_PARAMS]
+            rows = self.connection.execute(
+                "SELECT d.hash, COALESCE(d.doc, s.doc) FROM ingest_docs d "
+                "LEFT JOIN ingest_docs s ON d.source_hash = s.hash "
+                f"WHERE d.hash IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            docs.update((doc_hash, json.loads(doc)) for doc_hash, doc in rows if doc is not None)
+        return docs
@@ -0,0 +1,76 @@
+"""Cache of the embeddings of texts, shared by the workers of the embedding node and across runs.
+
+Documents repeat many of their texts (disclaimers, headers and footers, boilerplate), which then
+only get embedded once per encoder. Embeddings are stored as float64 so the cached vectors are
+exactly the ones the encoder returned.
+"""
+
+import functools
+import hashlib
+import json
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+from unstructured.embed.interfaces import BaseEmbeddingEncoder
+from unstructured.sqlite import MAX_QUERY_PARAMS, SQLiteStore
+
+
+def get_encoder_hash(encoder: BaseEmbeddingEncoder) -> str:
+    """Hash of the encoder class and of the config its embeddings depend on, e.g. the model,
+    leaving out the API key."""
+    config = encoder.config.to_dict()
+    config.pop("api_key", None)
+    return hashlib.sha256(
+        f"{encoder.__class__.__name__}{json.dumps(config, sort_keys=True)}".encode(),
+    ).hexdigest()
+
+
+def get_embedding_key(encoder_hash: str, text: str) -> str:
+    return hashlib.sha256(f"{encoder_hash}{text}".encode()).hexdigest()
+
+
+class EmbeddingCache(SQLiteStore):
+    """Dict-like mapping of embedding keys, from `get_embedding_key()`, to embeddings."""
+
+    def __init__(self, path: t.Union[str, Path]):
+        super().__init__(path)
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB)",
+            )
+
+    def get_many(self, keys: t.Iterable[str]) -> t.Dict[str, t.List[float]]:
+        """Embeddings of those of `keys` that are cached, looked up in batches."""
+        keys = list(keys)
+        embeddings: t.Dict[str, t.List[float]] = {}
+        for i in range(0, len(keys), MAX_QUERY_PARAMS):
+            batch = keys[i : i + MAX_QUERY_PARAMS]
+            rows = self.connection.execute(
+                "SELECT key, embedding FROM embeddings "
+                f"WHERE key IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            embeddings.update(
+                (key, np.frombuffer(embedding, dtype=np.float64).tolist())
+                for key, embedding in rows
+            )
+        return embeddings
+
+    def update(self, embeddings: t.Mapping[str, t.List[float]]):
+        """Caches all of `embeddings` in a single transaction."""
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                [
+                    (key, np.asarray(embedding, dtype=np.float64).tobytes())
+                    for key, embedding in embeddings.items()
+                ],
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def get_embedding_cache(path: str) -> EmbeddingCache:
+    """The cache at `path`, opened once per process."""
+    return EmbeddingCache(path=path)
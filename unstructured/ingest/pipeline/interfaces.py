@@ -5,7 +5,6 @@ import multiprocessing as mp
 import typing as t
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from multiprocessing.managers import DictProxy
 from pathlib import Path
 
 import backoff
@@ -22,6 +21,8 @@ from unstructured.ingest.interfaces import (
     RetryStrategyConfig,
 )
 from unstructured.ingest.logger import ingest_log_streaming_init, logger
+from unstructured.ingest.pipeline.doc_registry import IngestDocRegistry
+from unstructured.ingest.pipeline.manifest import IngestManifest
 
 
 @dataclass
@@ -31,18 +32,28 @@ class PipelineContext(ProcessorConfig):
     """
 
     def __post_init__(self):
-        self._ingest_docs_map: t.Optional[DictProxy] = None
+        self._ingest_docs_map: t.Optional[IngestDocRegistry] = None
+        self._manifest: t.Optional[IngestManifest] = None
 
     @property
-    def ingest_docs_map(self) -> DictProxy:
+    def ingest_docs_map(self) -> IngestDocRegistry:
         if self._ingest_docs_map is None:
             raise ValueError("ingest_docs_map never initialized")
         return self._ingest_docs_map
 
     @ingest_docs_map.setter
-    def ingest_docs_map(self, value: DictProxy):
+    def ingest_docs_map(self, value: IngestDocRegistry):
         self._ingest_docs_map = value
 
+    @property
+    def manifest(self) -> t.Optional[IngestManifest]:
+        """Manifest of the docs ingested by earlier runs, only set for incremental runs."""
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, value: t.Optional[IngestManifest]):
+        self._manifest = value
+
 
 @dataclass
 class PipelineNode(DataClassJsonMixin, ABC):
@@ -73,8 +84,7 @@ class PipelineNode(DataClassJsonMixin, ABC):
         else:
             with mp.Pool(
                 processes=self.pipeline_context.num_processes,
-                initializer=ingest_log_streaming_init,
-                initargs=(logging.DEBUG if self.pipeline_context.verbose else logging.INFO,),
+                initializer=self.initialize_process,
             ) as pool:
                 self.result = pool.map(self.run, iterable)
         # Remove None which may be caused by failed docs that didn't raise an error
@@ -95,6 +105,10 @@ class PipelineNode(DataClassJsonMixin, ABC):
             path.mkdir(parents=True, exist_ok=True)
         ingest_log_streaming_init(logging.DEBUG if self.pipeline_context.verbose else logging.INFO)
 
+    def initialize_process(self):
+        """Runs in each worker process of the node before it's given any doc."""
+        ingest_log_streaming_init(logging.DEBUG if self.pipeline_context.verbose else logging.INFO)
+
     def get_path(self) -> t.Optional[Path]:
         return None
 
@@ -173,8 +187,27 @@ class PartitionNode(PipelineNode):
         )
         super().initialize()
 
+    def initialize_process(self):
+        super().initialize_process()
+        # -- load the NLTK models once per worker rather than while partitioning its first doc --
+        from unstructured.nlp.tokenize import load_nltk_resources
+
+        try:
+            load_nltk_resources()
+        except Exception as e:
+            logger.warning(
+                f"failed to preload NLTK resources, they will be loaded on first use: {e}"
+            )
+
     def create_hash(self) -> str:
         hash_dict = self.partition_config.to_dict()
+        # -- caching partition results doesn't change them --
+        for cache_field in (
+            "partition_cache_path",
+            "partition_cache_backend",
+            "partition_cache_max_size",
+        ):
+            hash_dict.pop(cache_field, None)
         hash_dict["partition_kwargs"] = self.partition_kwargs
         return hashlib.sha256(json.dumps(hash_dict, sort_keys=True).encode()).hexdigest()[:32]
 
@@ -193,6 +226,10 @@ class ReformatNode(PipelineNode, ABC):
     content from partition before writing it
     """
 
+    def create_hash(self) -> str:
+        """Hash of the configuration the outputs of the node depend on."""
+        return hashlib.sha256(self.__class__.__name__.encode()).hexdigest()[:32]
+
     @abstractmethod
     def run(self, elements_json: str) -> t.Optional[str]:
         pass
@@ -0,0 +1,115 @@
+"""Manifest of the docs ingested from a source, for incremental runs of the pipeline.
+
+For each doc a run got all the way through the pipeline, the manifest records the version and
+modification date the source reported for it, along with a hash of the configuration of the
+pipeline that processed it. The next run over the same `work_dir` compares each doc against the
+manifest to only process the docs that are new or changed since, and the docs of the manifest that
+are no longer listed by the source are the ones that were deleted from it.
+"""
+
+import json
+import typing as t
+from pathlib import Path
+
+from unstructured.sqlite import MAX_QUERY_PARAMS, SQLiteStore
+
+
+class DocChange:
+    NEW = "new"
+    CHANGED = "changed"
+    UNCHANGED = "unchanged"
+
+
+class IngestManifest(SQLiteStore):
+    """The docs ingested from the source identified by `source_id`, stored in a SQLite database.
+
+    Docs are only `UNCHANGED` if they were processed by a pipeline with the same `pipeline_hash`
+    and the source gives them a version or modification date, which didn't change since.
+    """
+
+    def __init__(self, path: t.Union[str, Path], source_id: str, pipeline_hash: str):
+        super().__init__(path)
+        self.source_id = source_id
+        self.pipeline_hash = pipeline_hash
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS manifest_docs "
+                "(source_id TEXT, unique_id TEXT, version TEXT, date_modified TEXT, "
+                "pipeline_hash TEXT, output_hash TEXT, doc TEXT, "
+                "PRIMARY KEY (source_id, unique_id))",
+            )
+
+    def get_change(
+        self,
+        unique_id: str,
+        version: t.Optional[str],
+        date_modified: t.Optional[str],
+    ) -> str:
+        """Whether the doc is new, changed or unchanged since it was last recorded."""
+        row = self.connection.execute(
+            "SELECT version, date_modified, pipeline_hash FROM manifest_docs "
+            "WHERE source_id = ? AND unique_id = ?",
+            (self.source_id, unique_id),
+        ).fetchone()
+        if row is None:
+            return DocChange.NEW
+        if (version is None and date_modified is None) or row != (
+            version,
+            date_modified,
+            self.pipeline_hash,
+        ):
+            return DocChange.CHANGED
+        return DocChange.UNCHANGED
+
+    def record(self, docs: t.Mapping[str, t.Dict[str, t.Any]]):
+        """Records the ingest doc dicts of `docs`, keyed by the hash of their final output, as
+        processed by this pipeline."""
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO manifest_docs (source_id, unique_id, version, "
+                "date_modified, pipeline_hash, output_hash, doc) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        self.source_id,
+                        doc["unique_id"],
+                        doc.get("version"),
+                        doc.get("date_modified"),
+                        self.pipeline_hash,
+                        output_hash,
+                        json.dumps(doc),
+                    )
+                    for output_hash, doc in docs.items()
+                ],
+            )
+
+    def get_removed(self, unique_ids: t.Iterable[str]) -> t.Dict[str, t.Dict[str, t.Any]]:
+        """Ingest doc dicts of the recorded docs whose id isn't one of `unique_ids`, keyed by id."""
+        with self._transaction() as connection:
+            # -- the listed ids go through a temporary table rather than being held in memory --
+            connection.execute("CREATE TEMP TABLE IF NOT EXISTS listed_ids (unique_id TEXT)")
+            connection.execute("DELETE FROM listed_ids")
+            connection.executemany(
+                "INSERT INTO listed_ids (unique_id) VALUES (?)",
+                ((unique_id,) for unique_id in unique_ids),
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS temp.listed_ids_index ON listed_ids (unique_id)",
+            )
+            rows = connection.execute(
+                "SELECT unique_id, doc FROM manifest_docs WHERE source_id = ? AND NOT EXISTS "
+                "(SELECT 1 FROM listed_ids l WHERE l.unique_id = manifest_docs.unique_id)",
+                (self.source_id,),
+            ).fetchall()
+            connection.execute("DELETE FROM listed_ids")
+        return {unique_id: json.loads(doc) for unique_id, doc in rows}
+
+    def remove(self, unique_ids: t.Iterable[str]):
+        unique_ids = list(unique_ids)
+        with self._transaction() as connection:
+            for i in range(0, len(unique_ids), MAX_QUERY_PARAMS):
+                batch = unique_ids[i : i + MAX_QUERY_PARAMS]
+                connection.execute(
+                    "DELETE FROM manifest_docs WHERE source_id = ? "
+                    f"AND unique_id IN ({', '.join('?' * len(batch))})",
+                    [self.source_id, *batch],
+                )
@@ -1,5 +1,4 @@
 import hashlib
-import json
 import typing as t
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,7 +8,12 @@ from unstructured.ingest.connector.registry import create_ingest_doc_from_dict
 from unstructured.ingest.error import PartitionError
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import PartitionNode
+from unstructured.ingest.pipeline.serialization import (
+    get_intermediate_filename,
+    write_element_dicts,
+)
 from unstructured.ingest.pipeline.utils import get_ingest_doc_hash
+from unstructured.partition.utils.cache import get_partition_cache
 
 
 @dataclass
@@ -19,11 +23,20 @@ class Partitioner(PartitionNode):
         try:
             doc = create_ingest_doc_from_dict(ingest_doc_dict)
             doc_filename_hash = get_ingest_doc_hash(ingest_doc_dict)
+            if self.pipeline_context.incremental:
+                # -- so the outputs of another version of the doc are never picked up --
+                doc_filename_hash += (
+                    f"{ingest_doc_dict.get('version')}{ingest_doc_dict.get('date_modified')}"
+                )
             hashed_filename = hashlib.sha256(
                 f"{self.create_hash()}{doc_filename_hash}".encode(),
             ).hexdigest()[:32]
             self.pipeline_context.ingest_docs_map[hashed_filename] = ingest_doc_dict
-            doc_filename = f"{hashed_filename}.json"
+            doc_filename = get_intermediate_filename(
+                hashed_filename,
+                self.pipeline_context.intermediate_format,
+                self.pipeline_context.intermediate_compression,
+            )
             json_path = (Path(self.get_path()) / doc_filename).resolve()
             if (
                 not self.pipeline_context.reprocess
@@ -45,13 +58,21 @@ class Partitioner(PartitionNode):
                 )
             if self.partition_config.additional_partition_args:
                 partition_kwargs.update(self.partition_config.additional_partition_args)
+            if (
+                self.partition_config.partition_cache_path
+                and not self.partition_config.partition_by_api
+            ):
+                partition_kwargs["partition_cache"] = get_partition_cache(
+                    path=self.partition_config.partition_cache_path,
+                    backend=self.partition_config.partition_cache_backend,
+                    max_size=self.partition_config.partition_cache_max_size,
+                )
             elements = doc.process_file(
                 partition_config=self.partition_config,
                 **partition_kwargs,
             )
-            with open(json_path, "w", encoding="utf8") as output_f:
-                logger.info(f"writing partitioned content to {json_path}")
-                json.dump(elements, output_f, ensure_ascii=False, indent=2, sort_keys=True)
+            logger.info(f"writing partitioned content to {json_path}")
+            write_element_dicts(json_path, elements, sort_keys=True)
             return str(json_path)
         except Exception as e:
             if self.pipeline_context.raise_on_error:
@@ -1,7 +1,8 @@
+import hashlib
 import logging
-import multiprocessing as mp
 import typing as t
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from dataclasses_json import DataClassJsonMixin
 
@@ -9,6 +10,7 @@ from unstructured.ingest.connector.registry import create_ingest_doc_from_dict
 from unstructured.ingest.interfaces import BaseIngestDocBatch, BaseSingleIngestDoc
 from unstructured.ingest.logger import ingest_log_streaming_init, logger
 from unstructured.ingest.pipeline.copy import Copier
+from unstructured.ingest.pipeline.doc_registry import IngestDocRegistry
 from unstructured.ingest.pipeline.interfaces import (
     DocFactoryNode,
     PartitionNode,
@@ -17,7 +19,10 @@ from unstructured.ingest.pipeline.interfaces import (
     SourceNode,
     WriteNode,
 )
+from unstructured.ingest.pipeline.manifest import IngestManifest
 from unstructured.ingest.pipeline.permissions import PermissionsDataCleaner
+from unstructured.ingest.pipeline.serialization import get_intermediate_name
+from unstructured.ingest.pipeline.streaming import StreamingStage, run_streaming
 from unstructured.ingest.pipeline.utils import get_ingest_doc_hash
 
 
@@ -63,10 +68,14 @@ class Pipeline(DataClassJsonMixin):
             f"with config: {self.pipeline_context.to_json()}",
         )
         self.initialize()
-        manager = mp.Manager()
-        self.pipeline_context.ingest_docs_map = manager.dict()
+        self.pipeline_context.ingest_docs_map = IngestDocRegistry(
+            path=Path(self.pipeline_context.work_dir) / "ingest_docs.db",
+        )
+        if self.pipeline_context.incremental:
+            self.pipeline_context.manifest = self.get_manifest()
         dict_docs = self.doc_factory_node()
-        dict_docs = [manager.dict(d) for d in dict_docs]
+        if self.pipeline_context.manifest and self.pipeline_context.delete_removed_docs:
+            self.delete_removed_docs(dict_docs=dict_docs)
         if not dict_docs:
             logger.info("no docs found to process")
             return
@@ -74,8 +83,12 @@ class Pipeline(DataClassJsonMixin):
             f"processing {len(dict_docs)} docs via "
             f"{self.pipeline_context.num_processes} processes",
         )
-        for doc in dict_docs:
-            self.pipeline_context.ingest_docs_map[get_ingest_doc_hash(doc)] = doc
+        self.pipeline_context.ingest_docs_map.update(
+            {get_ingest_doc_hash(doc): doc for doc in dict_docs},
+        )
+        if self.pipeline_context.streaming:
+            self.run_streaming(dict_docs=dict_docs)
+            return
         fetched_filenames = self.source_node(iterable=dict_docs)
         if self.source_node.read_config.download_only:
             logger.info("stopping pipeline after downloading files")
@@ -85,7 +98,7 @@ class Pipeline(DataClassJsonMixin):
             return
         # To support batches ingest docs, expand those into the populated single ingest
         # docs after downloading content
-        dict_docs = self.expand_batch_docs(dict_docs=dict_docs)
+        dict_docs = self.expand_batch_docs(dict_docs=self.get_downloaded_docs(dict_docs))
         if self.partition_node is None:
             raise ValueError("partition node not set")
         partitioned_jsons = self.partition_node(iterable=dict_docs)
@@ -112,5 +125,140 @@ class Pipeline(DataClassJsonMixin):
             )
             self.write_node(iterable=partitioned_jsons)
 
+        self.record_processed_docs(json_paths=partitioned_jsons)
+
+        if self.permissions_node:
+            self.permissions_node.cleanup_permissions()
+
+    def run_streaming(self, dict_docs: t.List[dict]):
+        """Runs the per-doc nodes as overlapping stages, so each doc moves on to the next node
+        as soon as it's ready instead of waiting for all the other docs."""
+        stages = [
+            StreamingStage(
+                node=self.source_node,
+                # To support batches ingest docs, expand those into the populated single ingest
+                # docs after downloading content
+                get_next_inputs=self._expand_downloaded_doc,
+            ),
+        ]
+        if not self.source_node.read_config.download_only:
+            if self.partition_node is None:
+                raise ValueError("partition node not set")
+            stages.append(StreamingStage(node=self.partition_node))
+            stages.extend(StreamingStage(node=node) for node in self.reformat_nodes)
+            # Copy the final destination to the desired location, keeping the path of the
+            # json in the work dir for the write node
+            stages.append(
+                StreamingStage(
+                    node=Copier(pipeline_context=self.pipeline_context),
+                    get_next_inputs=self._keep_json_path,
+                ),
+            )
+        for stage in stages:
+            stage.node.initialize()
+        queue_size = self.pipeline_context.queue_size or 2 * self.pipeline_context.num_processes
+        logger.info(
+            f"streaming docs through {', '.join(stage.name for stage in stages)} "
+            f"with at most {queue_size} docs queued for each",
+        )
+        partitioned_jsons = run_streaming(
+            stages=stages,
+            inputs=dict_docs,
+            num_processes=self.pipeline_context.num_processes,
+            queue_size=queue_size,
+        )
+        if self.source_node.read_config.download_only:
+            logger.info("stopping pipeline after downloading files")
+            return
+        if not partitioned_jsons:
+            logger.info("No files to process after partitioning")
+            return
+
+        # NOTE: destination connectors write all docs in a single call, which for some of them
+        # (e.g. overwriting a delta table) can't be split up, so writing still waits for all docs
+        if self.write_node:
+            logger.info(
+                f"uploading elements from {len(partitioned_jsons)} "
+                "document(s) to the destination"
+            )
+            self.write_node.initialize()
+            self.write_node.run(partitioned_jsons)
+
+        self.record_processed_docs(json_paths=partitioned_jsons)
+
         if self.permissions_node:
             self.permissions_node.cleanup_permissions()
+
+    def get_manifest(self) -> IngestManifest:
+        """Manifest of the docs ingested from the source by earlier runs of this pipeline."""
+        source_connector = self.doc_factory_node.source_doc_connector
+        source_id = hashlib.sha256(
+            (
+                source_connector.__class__.__name__
+                + source_connector.connector_config.to_json(redact_sensitive=True, sort_keys=True)
+            ).encode(),
+        ).hexdigest()[:32]
+        # -- docs processed with another configuration of any of the nodes are processed again --
+        node_hashes = [self.partition_node.create_hash()] if self.partition_node else []
+        node_hashes.extend(node.create_hash() for node in self.reformat_nodes)
+        if self.write_node:
+            dest_connector = self.write_node.dest_doc_connector
+            node_hashes.append(
+                dest_connector.__class__.__name__
+                + dest_connector.connector_config.to_json(redact_sensitive=True, sort_keys=True),
+            )
+        pipeline_hash = hashlib.sha256("".join(node_hashes).encode()).hexdigest()[:32]
+        return IngestManifest(
+            path=Path(self.pipeline_context.work_dir) / "ingest_manifest.db",
+            source_id=source_id,
+            pipeline_hash=pipeline_hash,
+        )
+
+    def record_processed_docs(self, json_paths: t.List[str]):
+        """Records the docs of the final outputs in the manifest of incremental runs."""
+        if self.pipeline_context.manifest is None:
+            return
+        output_hashes = [get_intermediate_name(json_path) for json_path in json_paths]
+        self.pipeline_context.manifest.record(
+            self.pipeline_context.ingest_docs_map.get_many(output_hashes),
+        )
+
+    def delete_removed_docs(self, dict_docs: t.List[dict]):
+        """Removes the outputs of the docs ingested by earlier runs that the source no longer
+        lists, from the output dir and the destination."""
+        manifest = self.pipeline_context.manifest
+        if manifest is None:
+            return
+        if any(isinstance(create_ingest_doc_from_dict(d), BaseIngestDocBatch) for d in dict_docs):
+            # -- the docs of a batch aren't known until it's downloaded --
+            logger.warning("the source lists batches of docs, docs removed from it can't be found")
+            return
+        removed_docs = manifest.get_removed(doc["unique_id"] for doc in dict_docs)
+        if not removed_docs:
+            return
+        logger.info(f"deleting the outputs of {len(removed_docs)} docs removed from the source")
+        ingest_docs = [create_ingest_doc_from_dict(doc) for doc in removed_docs.values()]
+        for ingest_doc in ingest_docs:
+            Path(ingest_doc._output_filename).unlink(missing_ok=True)
+        if self.write_node:
+            self.write_node.initialize()
+            try:
+                self.write_node.dest_doc_connector.delete(docs=ingest_docs)
+            except NotImplementedError as e:
+                logger.warning(f"docs removed from the source are left in the destination: {e}")
+        manifest.remove(removed_docs.keys())
+
+    def get_downloaded_docs(self, dict_docs: t.List[dict]) -> t.List[dict]:
+        """The docs as updated by the source node, which registers them once downloaded."""
+        doc_hashes = [get_ingest_doc_hash(doc) for doc in dict_docs]
+        downloaded_docs = self.pipeline_context.ingest_docs_map.get_many(doc_hashes)
+        return [downloaded_docs.get(h, doc) for h, doc in zip(doc_hashes, dict_docs)]
+
+    def _expand_downloaded_doc(self, dict_doc: dict, fetched: t.Any) -> t.List[dict]:
+        if not fetched:
+            return []
+        return self.expand_batch_docs(dict_docs=self.get_downloaded_docs([dict_doc]))
+
+    @staticmethod
+    def _keep_json_path(json_path: str, _: t.Any) -> t.List[str]:
+        return [json_path]
@@ -1,6 +1,5 @@
 import hashlib
 import json
-import os.path
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -10,7 +9,13 @@ from unstructured.ingest.interfaces import (
 )
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import ReformatNode
-from unstructured.staging.base import elements_from_json, elements_to_dicts
+from unstructured.ingest.pipeline.serialization import (
+    get_intermediate_filename,
+    get_intermediate_name,
+    read_element_dicts,
+    write_element_dicts,
+)
+from unstructured.staging.base import elements_from_dicts, elements_to_dicts
 
 
 @dataclass
@@ -29,17 +34,17 @@ class Chunker(ReformatNode):
 
     def run(self, elements_json: str) -> Optional[str]:
         try:
-            elements_json_filename = os.path.basename(elements_json)
-            filename_ext = os.path.basename(elements_json_filename)
-            filename = os.path.splitext(filename_ext)[0]
+            filename = get_intermediate_name(elements_json)
             hashed_filename = hashlib.sha256(
                 f"{self.create_hash()}{filename}".encode(),
             ).hexdigest()[:32]
-            json_filename = f"{hashed_filename}.json"
-            json_path = (Path(self.get_path()) / json_filename).resolve()
-            self.pipeline_context.ingest_docs_map[hashed_filename] = (
-                self.pipeline_context.ingest_docs_map[filename]
+            json_filename = get_intermediate_filename(
+                hashed_filename,
+                self.pipeline_context.intermediate_format,
+                self.pipeline_context.intermediate_compression,
             )
+            json_path = (Path(self.get_path()) / json_filename).resolve()
+            self.pipeline_context.ingest_docs_map.link(hashed_filename, filename)
             if (
                 not self.pipeline_context.reprocess
                 and json_path.is_file()
@@ -47,12 +52,11 @@ class Chunker(ReformatNode):
             ):
                 logger.debug(f"File exists: {json_path}, skipping chunking")
                 return str(json_path)
-            elements = elements_from_json(filename=elements_json)
+            elements = elements_from_dicts(read_element_dicts(elements_json), copy_dicts=False)
             chunked_elements = self.chunking_config.chunk(elements=elements)
             element_dicts = elements_to_dicts(chunked_elements)
-            with open(json_path, "w", encoding="utf8") as output_f:
-                logger.info(f"writing chunking content to {json_path}")
-                json.dump(element_dicts, output_f, ensure_ascii=False, indent=2)
+            logger.info(f"writing chunking content to {json_path}")
+            write_element_dicts(json_path, element_dicts)
             return str(json_path)
         except Exception as e:
             if self.pipeline_context.raise_on_error:
@@ -1,16 +1,44 @@
 import hashlib
 import json
-import os.path
+import math
+import multiprocessing as mp
+import typing as t
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from unstructured.documents.elements import Element
+from unstructured.embed.interfaces import BaseEmbeddingEncoder
 from unstructured.ingest.interfaces import (
     EmbeddingConfig,
 )
 from unstructured.ingest.logger import logger
+from unstructured.ingest.pipeline.embedding_cache import (
+    get_embedding_cache,
+    get_embedding_key,
+    get_encoder_hash,
+)
 from unstructured.ingest.pipeline.interfaces import ReformatNode
-from unstructured.staging.base import elements_from_json, elements_to_dicts
+from unstructured.ingest.pipeline.serialization import (
+    get_intermediate_filename,
+    get_intermediate_name,
+    read_element_dicts,
+    write_element_dicts,
+)
+from unstructured.staging.base import elements_from_dicts, elements_to_dicts
+
+# NOTE: the most docs handed to a worker at once, whose texts are embedded in the same requests
+MAX_DOCS_PER_GROUP = 32
+
+# -- the encoder of each embedding config, created once per process so its client is reused --
+_embedders: t.Dict[str, BaseEmbeddingEncoder] = {}
+
+
+@dataclass
+class _PendingDoc:
+    elements_json: str
+    json_path: Path
+    elements: t.List[Element]
 
 
 @dataclass
@@ -25,41 +53,148 @@ class Embedder(ReformatNode):
 
     def create_hash(self) -> str:
         hash_dict = self.embedder_config.to_dict()
+        # -- how texts are batched and cached doesn't change their embeddings --
+        hash_dict.pop("batch_size", None)
+        hash_dict.pop("cache_path", None)
         return hashlib.sha256(json.dumps(hash_dict, sort_keys=True).encode()).hexdigest()[:32]
 
+    def get_embedder(self) -> BaseEmbeddingEncoder:
+        embedder_hash = self.create_hash()
+        if embedder_hash not in _embedders:
+            _embedders[embedder_hash] = self.embedder_config.get_embedder()
+        return _embedders[embedder_hash]
+
+    def __call__(self, iterable: t.Optional[t.Iterable[str]] = None) -> t.List[str]:
+        elements_jsons = list(iterable) if iterable else []
+        if elements_jsons:
+            logger.info(f"Calling {self.__class__.__name__} with {len(elements_jsons)} docs")
+        self.initialize()
+        # -- docs are handed to the workers in groups rather than one at a time, so the texts of
+        # -- small docs share requests --
+        num_processes = self.pipeline_context.num_processes
+        group_size = max(1, min(MAX_DOCS_PER_GROUP, math.ceil(len(elements_jsons) / num_processes)))
+        groups = [
+            elements_jsons[i : i + group_size] for i in range(0, len(elements_jsons), group_size)
+        ]
+        if num_processes == 1:
+            results = [self.run_group(group) for group in groups]
+        else:
+            with mp.Pool(processes=num_processes, initializer=self.initialize_process) as pool:
+                results = pool.map(self.run_group, groups)
+        # Remove None which may be caused by failed docs that didn't raise an error
+        self.result = [r for group_results in results for r in group_results if r is not None]
+        return self.result
+
     def run(self, elements_json: str) -> Optional[str]:
+        return self.run_group([elements_json])[0]
+
+    def run_group(self, elements_jsons: t.List[str]) -> t.List[Optional[str]]:
+        """Embeds the elements of several docs together, returning the path of the output of each
+        doc, or None for the docs that failed."""
+        results: t.List[Optional[str]] = [None] * len(elements_jsons)
+        pending: t.List[t.Tuple[int, _PendingDoc]] = []
+        for i, elements_json in enumerate(elements_jsons):
+            try:
+                json_path = self.get_output_path(elements_json)
+                if (
+                    not self.pipeline_context.reprocess
+                    and json_path.is_file()
+                    and json_path.stat().st_size
+                ):
+                    logger.debug(f"File exists: {json_path}, skipping embedding")
+                    results[i] = str(json_path)
+                    continue
+                elements = elements_from_dicts(
+                    read_element_dicts(elements_json),
+                    copy_dicts=False,
+                )
+                pending.append((i, _PendingDoc(elements_json, json_path, elements)))
+            except Exception as e:
+                self._handle_error(elements_json, e)
+
         try:
-            elements_json_filename = os.path.basename(elements_json)
-            filename_ext = os.path.basename(elements_json_filename)
-            filename = os.path.splitext(filename_ext)[0]
-            hashed_filename = hashlib.sha256(
-                f"{self.create_hash()}{filename}".encode(),
-            ).hexdigest()[:32]
-            json_filename = f"{hashed_filename}.json"
-            json_path = (Path(self.get_path()) / json_filename).resolve()
-            self.pipeline_context.ingest_docs_map[hashed_filename] = (
-                self.pipeline_context.ingest_docs_map[filename]
+            self.embed_elements([element for _, doc in pending for element in doc.elements])
+        except Exception as e:
+            if len(pending) == 1 or self.pipeline_context.raise_on_error:
+                self._handle_error(pending[0][1].elements_json, e)
+                pending = []
+            else:
+                # -- embedded one doc at a time so only the docs that fail are dropped --
+                logger.warning(
+                    f"failed to embed the content of {len(pending)} files together, "
+                    f"embedding them one at a time: {e}",
+                )
+                pending = [(i, doc) for i, doc in pending if self._embed_doc(doc)]
+
+        for i, doc in pending:
+            try:
+                logger.info(f"writing embeddings content to {doc.json_path}")
+                write_element_dicts(doc.json_path, elements_to_dicts(doc.elements))
+                results[i] = str(doc.json_path)
+            except Exception as e:
+                self._handle_error(doc.elements_json, e)
+        return results
+
+    def embed_elements(self, elements: t.List[Element]):
+        """Sets the embeddings of `elements`, embedding each distinct text only once and only
+        if it isn't cached, in batches of texts."""
+        if not elements:
+            return
+        embedder = self.get_embedder()
+        cache = (
+            get_embedding_cache(self.embedder_config.cache_path)
+            if self.embedder_config.cache_path
+            else None
+        )
+        encoder_hash = get_encoder_hash(embedder)
+        keys = [get_embedding_key(encoder_hash, str(element)) for element in elements]
+        embeddings = cache.get_many(set(keys)) if cache else {}
+        # -- a single element for each of the texts left to embed --
+        missing: t.Dict[str, Element] = {}
+        for key, element in zip(keys, elements):
+            if key not in embeddings and key not in missing:
+                missing[key] = element
+        missing_keys = list(missing)
+        batch_size = self.embedder_config.batch_size or embedder.embed_batch_size
+        for i in range(0, len(missing_keys), batch_size):
+            batch_keys = missing_keys[i : i + batch_size]
+            embedded_elements = embedder.embed_documents(
+                elements=[missing[key] for key in batch_keys],
             )
-            if (
-                not self.pipeline_context.reprocess
-                and json_path.is_file()
-                and json_path.stat().st_size
-            ):
-                logger.debug(f"File exists: {json_path}, skipping embedding")
-                return str(json_path)
-            elements = elements_from_json(filename=elements_json)
-            embedder = self.embedder_config.get_embedder()
-            embedded_elements = embedder.embed_documents(elements=elements)
-            element_dicts = elements_to_dicts(embedded_elements)
-            with open(json_path, "w", encoding="utf8") as output_f:
-                logger.info(f"writing embeddings content to {json_path}")
-                json.dump(element_dicts, output_f, ensure_ascii=False, indent=2)
-            return str(json_path)
+            batch_embeddings = {
+                key: element.embeddings for key, element in zip(batch_keys, embedded_elements)
+            }
+            if cache:
+                cache.update(batch_embeddings)
+            embeddings.update(batch_embeddings)
+        for key, element in zip(keys, elements):
+            element.embeddings = embeddings[key]
+
+    def get_output_path(self, elements_json: str) -> Path:
+        filename = get_intermediate_name(elements_json)
+        hashed_filename = hashlib.sha256(
+            f"{self.create_hash()}{filename}".encode(),
+        ).hexdigest()[:32]
+        json_filename = get_intermediate_filename(
+            hashed_filename,
+            self.pipeline_context.intermediate_format,
+            self.pipeline_context.intermediate_compression,
+        )
+        self.pipeline_context.ingest_docs_map.link(hashed_filename, filename)
+        return (Path(self.get_path()) / json_filename).resolve()
+
+    def _embed_doc(self, doc: _PendingDoc) -> bool:
+        try:
+            self.embed_elements(doc.elements)
+            return True
         except Exception as e:
-            if self.pipeline_context.raise_on_error:
-                raise
-            logger.error(f"failed to embed content from file {elements_json}, {e}", exc_info=True)
-            return None
+            self._handle_error(doc.elements_json, e)
+            return False
+
+    def _handle_error(self, elements_json: str, e: Exception):
+        if self.pipeline_context.raise_on_error:
+            raise e
+        logger.error(f"failed to embed content from file {elements_json}, {e}", exc_info=True)
 
     def get_path(self) -> Path:
         return (Path(self.pipeline_context.work_dir) / "embedded").resolve()
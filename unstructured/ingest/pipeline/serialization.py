@@ -0,0 +1,143 @@
+"""Serialization of the element-dicts each pipeline node writes to the `work_dir`.
+
+Intermediate files are only read back by later nodes of the same pipeline, so they don't have to
+be JSON. MessagePack (optionally zstd-compressed) is much more compact, notably for embeddings,
+and faster to write and parse. The format of a file is recorded in its extension, so a node can
+read the output of the previous one without being told which format it was written in. Final
+outputs copied to the `output_dir` are always JSON.
+"""
+
+import json
+import os
+import typing as t
+
+from unstructured.utils import requires_dependencies
+
+
+class IntermediateFormat:
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+class IntermediateCompression:
+    ZSTD = "zstd"
+
+
+INTERMEDIATE_FORMATS = (IntermediateFormat.JSON, IntermediateFormat.MSGPACK)
+INTERMEDIATE_COMPRESSIONS = (IntermediateCompression.ZSTD,)
+
+_FORMAT_EXTENSIONS = {
+    IntermediateFormat.JSON: ".json",
+    IntermediateFormat.MSGPACK: ".msgpack",
+}
+_COMPRESSION_EXTENSIONS = {IntermediateCompression.ZSTD: ".zst"}
+
+
+def get_intermediate_filename(
+    name: str,
+    intermediate_format: str = IntermediateFormat.JSON,
+    intermediate_compression: t.Optional[str] = None,
+) -> str:
+    """Filename, with the extensions for the format and compression, of an intermediate file."""
+    if intermediate_format not in _FORMAT_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported intermediate format {intermediate_format}, "
+            f"must be one of {', '.join(INTERMEDIATE_FORMATS)}",
+        )
+    filename = f"{name}{_FORMAT_EXTENSIONS[intermediate_format]}"
+    if intermediate_compression:
+        if intermediate_compression not in _COMPRESSION_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported intermediate compression {intermediate_compression}, "
+                f"must be one of {', '.join(INTERMEDIATE_COMPRESSIONS)}",
+            )
+        filename += _COMPRESSION_EXTENSIONS[intermediate_compression]
+    return filename
+
+
+def get_intermediate_name(path: str) -> str:
+    """Filename without any of the format and compression extensions of an intermediate file."""
+    return os.path.basename(path).split(".", 1)[0]
+
+
+def is_plain_json(path: str) -> bool:
+    return os.path.basename(path).endswith(_FORMAT_EXTENSIONS[IntermediateFormat.JSON])
+
+
+def _parse_extensions(path: str) -> t.Tuple[str, t.Optional[str]]:
+    extensions = os.path.basename(path).split(".")[1:]
+    compression = None
+    if extensions and f".{extensions[-1]}" in _COMPRESSION_EXTENSIONS.values():
+        compression = IntermediateCompression.ZSTD
+        extensions = extensions[:-1]
+    for intermediate_format, extension in _FORMAT_EXTENSIONS.items():
+        if extensions and f".{extensions[-1]}" == extension:
+            return intermediate_format, compression
+    raise ValueError(f"Unable to determine the intermediate format of {path}")
+
+
+def _sort_keys(obj: t.Any) -> t.Any:
+    if isinstance(obj, dict):
+        return {k: _sort_keys(obj[k]) for k in sorted(obj)}
+    if isinstance(obj, (list, tuple)):
+        return [_sort_keys(v) for v in obj]
+    return obj
+
+
+def write_element_dicts(
+    path: t.Union[str, os.PathLike],
+    element_dicts: t.List[t.Dict[str, t.Any]],
+    sort_keys: bool = False,
+) -> None:
+    """Writes element-dicts to `path` in the format and compression given by its extensions."""
+    intermediate_format, compression = _parse_extensions(str(path))
+    if intermediate_format == IntermediateFormat.MSGPACK:
+        data = _msgpack_dumps(_sort_keys(element_dicts) if sort_keys else element_dicts)
+    else:
+        data = json.dumps(element_dicts, ensure_ascii=False, indent=2, sort_keys=sort_keys).encode(
+            "utf8"
+        )
+    if compression == IntermediateCompression.ZSTD:
+        data = _zstd_compress(data)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def read_element_dicts(path: t.Union[str, os.PathLike]) -> t.List[t.Dict[str, t.Any]]:
+    """Reads the element-dicts of an intermediate file written by `write_element_dicts()`."""
+    intermediate_format, compression = _parse_extensions(str(path))
+    with open(path, "rb") as f:
+        data = f.read()
+    if compression == IntermediateCompression.ZSTD:
+        data = _zstd_decompress(data)
+    if intermediate_format == IntermediateFormat.MSGPACK:
+        return _msgpack_loads(data)
+    return json.loads(data.decode("utf8"))
+
+
+@requires_dependencies(["msgpack"], extras="msgpack")
+def _msgpack_dumps(obj: t.Any) -> bytes:
+    import msgpack
+
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+@requires_dependencies(["msgpack"], extras="msgpack")
+def _msgpack_loads(data: bytes) -> t.Any:
+    import msgpack
+
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+@requires_dependencies(["zstandard"], extras="zstd")
+def _zstd_compress(data: bytes) -> bytes:
+    import zstandard
+
+    return zstandard.ZstdCompressor().compress(data)
+
+
+@requires_dependencies(["zstandard"], extras="zstd")
+def _zstd_decompress(data: bytes) -> bytes:
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompress(data)
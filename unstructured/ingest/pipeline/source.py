@@ -1,6 +1,6 @@
 import os
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from unstructured.ingest.connector.registry import create_ingest_doc_from_dict
 from unstructured.ingest.interfaces import (
@@ -11,6 +11,8 @@ from unstructured.ingest.interfaces import (
 )
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import SourceNode
+from unstructured.ingest.pipeline.manifest import DocChange
+from unstructured.ingest.pipeline.utils import get_ingest_doc_hash
 
 # module-level variable to store session handle
 session_handle: t.Optional[BaseSessionHandle] = None
@@ -18,9 +20,25 @@ session_handle: t.Optional[BaseSessionHandle] = None
 
 @dataclass
 class Reader(SourceNode):
+    def get_change(self, doc: BaseSingleIngestDoc) -> str:
+        """Whether the doc is new or changed since it was last ingested, from its source metadata
+        alone. Docs are always new outside of incremental runs."""
+        manifest = self.pipeline_context.manifest
+        if manifest is None:
+            return DocChange.NEW
+        change = manifest.get_change(
+            unique_id=str(doc.unique_id),
+            version=doc.version,
+            date_modified=doc.date_modified,
+        )
+        if change == DocChange.UNCHANGED and self.pipeline_context.reprocess:
+            # -- processed from the local copy if there's one, as outside of incremental runs --
+            return DocChange.NEW
+        return change
+
     def get_single(self, doc: BaseSingleIngestDoc, ingest_doc_dict: dict) -> str:
         if (
-            not self.read_config.re_download
+            not doc.read_config.re_download
             and doc.filename.is_file()
             and doc.filename.stat().st_size
         ):
@@ -50,6 +68,7 @@ class Reader(SourceNode):
     def run(self, ingest_doc_dict: dict) -> t.Optional[t.Union[str, t.List[str]]]:
         try:
             global session_handle
+            doc_hash = get_ingest_doc_hash(ingest_doc_dict)
             doc = create_ingest_doc_from_dict(ingest_doc_dict)
             if isinstance(doc, IngestDocSessionHandleMixin):
                 if session_handle is None:
@@ -59,14 +78,25 @@ class Reader(SourceNode):
                 else:
                     doc._session_handle = session_handle
             if isinstance(doc, BaseSingleIngestDoc):
-                return self.get_single(doc=doc, ingest_doc_dict=ingest_doc_dict)
+                change = self.get_change(doc=doc)
+                if change == DocChange.UNCHANGED:
+                    logger.info(f"{doc.unique_id} is unchanged since the last run, skipping")
+                    return None
+                if change == DocChange.CHANGED:
+                    # -- a local copy would be of an earlier version of the doc --
+                    doc.read_config = replace(doc.read_config, re_download=True)
+                fetched = self.get_single(doc=doc, ingest_doc_dict=ingest_doc_dict)
             elif isinstance(doc, BaseIngestDocBatch):
-                return self.get_batch(doc_batch=doc, ingest_doc_dict=ingest_doc_dict)
+                fetched = self.get_batch(doc_batch=doc, ingest_doc_dict=ingest_doc_dict)
             else:
                 raise ValueError(
                     f"type of doc ({type(doc)}) is not a recognized type: "
                     f"BaseSingleIngestDoc or BaseSingleIngestDoc"
                 )
+            # Register the doc as updated by the download (source metadata, docs of a batch)
+            # for the pipeline to pick it up in the main process
+            self.pipeline_context.ingest_docs_map[doc_hash] = ingest_doc_dict
+            return fetched
         except Exception as e:
             if self.pipeline_context.raise_on_error:
                 raise
@@ -0,0 +1,108 @@
+"""Streaming execution of the per-document steps of the ingest pipeline.
+
+Instead of running each step over all documents before starting the next one, every step gets a
+long-lived pool of workers and a document moves on to the next step as soon as it's done with the
+previous one. Steps are connected by bounded queues: a step stops taking on documents while the
+queue of the step after it is full, so a slow step (e.g. partitioning) throttles the steps before
+it (e.g. downloading) instead of letting their output pile up.
+"""
+
+import typing as t
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+from unstructured.ingest.logger import logger
+from unstructured.ingest.pipeline.interfaces import PipelineNode
+
+
+def _result_as_next_inputs(item: t.Any, result: t.Any) -> t.List[t.Any]:
+    # -- failed docs that didn't raise an error return None and are dropped --
+    return [] if result is None else [result]
+
+
+@dataclass
+class StreamingStage:
+    """A pipeline node run on each document, and how its results feed the next stage.
+
+    `get_next_inputs` is called in the main process with the input and the result of `node.run`
+    for a single document, and returns the inputs of the next stage (or the outputs of the
+    pipeline for the last stage).
+    """
+
+    node: PipelineNode
+    get_next_inputs: t.Callable[[t.Any, t.Any], t.List[t.Any]] = _result_as_next_inputs
+
+    @property
+    def name(self) -> str:
+        return self.node.__class__.__name__
+
+
+def run_streaming(
+    stages: t.List[StreamingStage],
+    inputs: t.Iterable[t.Any],
+    num_processes: int,
+    queue_size: int,
+) -> t.List[t.Any]:
+    """Runs `inputs` through `stages`, overlapping the stages, and returns the outputs of the last.
+
+    Each stage runs on its own pool of `num_processes` workers for the whole run, initialized with
+    the `initialize_process()` of its node. At most `queue_size` inputs wait for a stage, counting
+    the ones still being processed by the stage before it.
+    """
+    if not stages:
+        return list(inputs)
+    queue_size = max(queue_size, 1)
+    inputs_iter = iter(inputs)
+    inputs_exhausted = False
+    # -- queues[i] holds the inputs waiting for stage i; the first one is filled from `inputs` --
+    queues: t.List[t.Deque[t.Any]] = [deque() for _ in stages]
+    running = [0] * len(stages)
+    futures: t.Dict[Future, t.Tuple[int, t.Any]] = {}
+    outputs: t.List[t.Any] = []
+
+    executors = [
+        ProcessPoolExecutor(max_workers=num_processes, initializer=stage.node.initialize_process)
+        for stage in stages
+    ]
+    try:
+        while True:
+            # -- fill the later stages first so documents in progress get done before new ones
+            # -- are started --
+            for i in reversed(range(len(stages))):
+                while running[i] < num_processes and (
+                    i == len(stages) - 1 or len(queues[i + 1]) + running[i] < queue_size
+                ):
+                    if not queues[i] and i == 0 and not inputs_exhausted:
+                        try:
+                            queues[0].append(next(inputs_iter))
+                        except StopIteration:
+                            inputs_exhausted = True
+                    if not queues[i]:
+                        break
+                    item = queues[i].popleft()
+                    futures[executors[i].submit(stages[i].node.run, item)] = (i, item)
+                    running[i] += 1
+
+            if not futures:
+                break
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, item = futures.pop(future)
+                running[i] -= 1
+                next_inputs = stages[i].get_next_inputs(item, future.result())
+                if i == len(stages) - 1:
+                    outputs.extend(next_inputs)
+                else:
+                    queues[i + 1].extend(next_inputs)
+            logger.debug(
+                "streaming stages (queued/running): "
+                + ", ".join(
+                    f"{stage.name} {len(queues[i])}/{running[i]}" for i, stage in enumerate(stages)
+                ),
+            )
+    finally:
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+    return outputs
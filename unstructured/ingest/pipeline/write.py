@@ -1,18 +1,17 @@
-import os.path
 import typing as t
 from dataclasses import dataclass
 
 from unstructured.ingest.connector.registry import create_ingest_doc_from_dict
 from unstructured.ingest.pipeline.interfaces import WriteNode
+from unstructured.ingest.pipeline.serialization import get_intermediate_name
 
 
 @dataclass
 class Writer(WriteNode):
     def run(self, json_paths: t.List[str]):
-        ingest_docs = []
-        for json_path in json_paths:
-            filename = os.path.basename(json_path)
-            doc_hash = os.path.splitext(filename)[0]
-            ingest_doc_dict = self.pipeline_context.ingest_docs_map[doc_hash]
-            ingest_docs.append(create_ingest_doc_from_dict(ingest_doc_dict))
+        doc_hashes = [get_intermediate_name(json_path) for json_path in json_paths]
+        ingest_doc_dicts = self.pipeline_context.ingest_docs_map.get_many(doc_hashes)
+        ingest_docs = [
+            create_ingest_doc_from_dict(ingest_doc_dicts[doc_hash]) for doc_hash in doc_hashes
+        ]
         self.dest_doc_connector.write(docs=ingest_docs)
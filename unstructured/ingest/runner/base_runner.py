@@ -61,7 +61,9 @@ class Runner(EnhancedDataClassJsonMixin, ABC):
     def get_dest_doc_connector(self) -> t.Optional[BaseDestinationConnector]:
         writer_kwargs = self.writer_kwargs if self.writer_kwargs else {}
         if self.writer:
-            return self.writer.get_connector(**writer_kwargs)
+            dest_doc_connector = self.writer.get_connector(**writer_kwargs)
+            dest_doc_connector.configured_write_batch_size = self.processor_config.write_batch_size
+            return dest_doc_connector
         return None
 
     def get_permissions_config(self) -> t.Optional[PermissionsConfig]:
@@ -5,13 +5,12 @@ from unstructured.ingest.interfaces import BaseDestinationConnector
 from unstructured.ingest.runner.writers.base_writer import Writer
 
 if t.TYPE_CHECKING:
-    from unstructured.ingest.connector.sql import SimpleSqlConfig
-    from unstructured.ingest.interfaces import WriteConfig
+    from unstructured.ingest.connector.sql import SimpleSqlConfig, SqlWriteConfig
 
 
 @dataclass
 class SqlWriter(Writer):
-    write_config: "WriteConfig"
+    write_config: "SqlWriteConfig"
     connector_config: "SimpleSqlConfig"
 
     def get_connector_cls(self) -> t.Type[BaseDestinationConnector]:
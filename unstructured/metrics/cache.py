@@ -0,0 +1,72 @@
+"""Cache of the scores of the documents evaluated by `unstructured.metrics.evaluate`.
+
+Scores are keyed by the contents of the output and gold-standard documents and by the options of
+the metric they were computed with, so running an evaluation again only scores the documents that
+changed since, and running it again to change how the scores are grouped or aggregated is almost
+free.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+# NOTE: keeps the number of parameters of a query under SQLite's default limit
+MAX_QUERY_PARAMS = 500
+
+CACHE_FILENAME = "scores.db"
+
+
+def get_score_key(
+    metric: str,
+    options: Mapping[str, Any],
+    output_path: str,
+    source_path: str,
+) -> Optional[str]:
+    """Key of the scores of `metric` for a pair of documents, or None when either of them can't
+    be read."""
+    key = hashlib.sha256(f"{metric}{json.dumps(options, sort_keys=True)}".encode())
+    try:
+        for path in (output_path, source_path):
+            with open(path, "rb") as f:
+                key.update(hashlib.sha256(f.read()).digest())
+    except OSError:
+        return None
+    return key.hexdigest()
+
+
+class ScoreCache:
+    """Scores of documents keyed by `get_score_key()`, in a SQLite database under `cache_dir`."""
+
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CACHE_FILENAME)
+        self.connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, scores TEXT)",
+        )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[Any]]:
+        """Scores of those of `keys` that are cached, looked up in batches."""
+        keys = list(keys)
+        scores: Dict[str, List[Any]] = {}
+        for i in range(0, len(keys), MAX_QUERY_PARAMS):
+            batch = keys[i : i + MAX_QUERY_PARAMS]
+            rows = self.connection.execute(
+                f"SELECT key, scores FROM scores WHERE key IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            scores.update((key, json.loads(value)) for key, value in rows)
+        return scores
+
+    def put(self, key: str, scores: List[Any]):
+        # -- each put is committed on its own so an interrupted run keeps what it scored --
+        self.connection.execute(
+            "INSERT OR REPLACE INTO scores (key, scores) VALUES (?, ?)",
+            (key, json.dumps(scores)),
+        )
+
+    def close(self):
+        self.connection.close()
@@ -1,14 +1,17 @@
 #! /usr/bin/env python3
 
+import functools
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from tqdm import tqdm
 
+from unstructured.metrics.cache import ScoreCache, get_score_key
 from unstructured.metrics.element_type import (
     calculate_element_type_percent_match,
     get_element_type_frequency,
@@ -63,6 +66,8 @@ def measure_text_extraction_accuracy(
     weights: Tuple[int, int, int] = (1, 1, 1),
     visualize: bool = False,
     output_type: str = "json",
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
 ) -> None:
     """
     Loops through the list of structured output from all of `output_dir` or selected files from
@@ -71,6 +76,10 @@ def measure_text_extraction_accuracy(
 
     Calculates text accuracy and percent missing. After looped through the whole list, write to tsv.
     Also calculates the aggregated accuracy and percent missing.
+
+    Documents are scored across `workers` processes. When `cache_dir` is set, the scores of each
+    document are cached there and reused as long as the document, its gold-standard and the
+    options of the metric don't change.
     """
     if not output_list:
         output_list = _listdir_recursive(output_dir)
@@ -91,12 +100,12 @@ def measure_text_extraction_accuracy(
                 Please note that some files will be skipped."
         )
 
-    rows = []
+    source_set = set(source_list)
     ext_index = -(len(output_type) + 1)
 
     # assumption: output file name convention is name-of-file.doc.json
-    # NOTE(klaijan) - disable=True means to not show, disable=False means to show the progress bar
-    for doc in tqdm(output_list, leave=False, disable=not visualize):  # type: ignore
+    documents, tasks = [], []
+    for doc in output_list:  # type: ignore
         # filename = (doc.split("/")[-1]).split(f".{output_type}")[0]
         filename = os.path.basename(doc)[:ext_index]
         doctype = filename.rsplit(".", 1)[-1]
@@ -105,20 +114,24 @@ def measure_text_extraction_accuracy(
 
         # not all odetta cct files follow the same naming convention;
         # some exclude the original filetype from the name
-        if fn_txt not in source_list:
+        if fn_txt not in source_set:
             fn = filename.rsplit(".", 1)[0]
             fn_txt = fn + ".txt"
 
-        if fn_txt in source_list:  # type: ignore
-            try:
-                output_cct = _prepare_output_cct(os.path.join(output_dir, doc), output_type)
-                source_cct = _read_text_file(os.path.join(source_dir, fn_txt))
-            except Exception:
-                # if any of the output/source file is unable to open, skip the loop
-                continue
-            accuracy = round(calculate_accuracy(output_cct, source_cct, weights), 3)
-            percent_missing = round(calculate_percent_missing_text(output_cct, source_cct), 3)
-            rows.append([filename, doctype, connector, accuracy, percent_missing])
+        if fn_txt in source_set:
+            documents.append([filename, doctype, connector])
+            tasks.append((os.path.join(output_dir, doc), os.path.join(source_dir, fn_txt)))
+
+    scores = _score_documents(
+        _score_text_extraction,
+        tasks,
+        {"output_type": output_type, "weights": weights},
+        workers=workers,
+        cache_dir=cache_dir,
+        visualize=visualize,
+    )
+    # -- documents where any of the output/source file is unable to open are skipped --
+    rows = [document + score for document, score in zip(documents, scores) if score is not None]
 
     headers = ["filename", "doctype", "connector", "cct-accuracy", "cct-%missing"]
     df = pd.DataFrame(rows, columns=headers)
@@ -148,6 +161,8 @@ def measure_element_type_accuracy(
     export_dir: str = "metrics",
     group_by: Optional[str] = None,
     visualize: bool = False,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
 ):
     """
     Loops through the list of structured output from all of `output_dir` or selected files from
@@ -156,26 +171,38 @@ def measure_element_type_accuracy(
 
     Calculates element type frequency accuracy and percent missing. After looped through the
     whole list, write to tsv. Also calculates the aggregated accuracy.
+
+    Documents are scored across `workers` processes. When `cache_dir` is set, the scores of each
+    document are cached there and reused as long as the document, its gold-standard and the
+    options of the metric don't change.
     """
     if not output_list:
         output_list = _listdir_recursive(output_dir)
     if not source_list:
         source_list = _listdir_recursive(source_dir)
 
-    rows = []
+    source_set = set(source_list)
 
-    # NOTE(klaijan) - disable=True means to not show, disable=False means to show the progress bar
-    for doc in tqdm(output_list, leave=False, disable=not visualize):  # type: ignore
+    documents, tasks = [], []
+    for doc in output_list:  # type: ignore
         filename = (doc.split("/")[-1]).split(".json")[0]
         doctype = filename.rsplit(".", 1)[-1]
         fn_json = filename + ".json"
         connector = doc.split("/")[0] if len(doc.split("/")) > 1 else None
 
-        if fn_json in source_list:  # type: ignore
-            output = get_element_type_frequency(_read_text_file(os.path.join(output_dir, doc)))
-            source = get_element_type_frequency(_read_text_file(os.path.join(source_dir, fn_json)))
-            accuracy = round(calculate_element_type_percent_match(output, source), 3)
-            rows.append([filename, doctype, connector, accuracy])
+        if fn_json in source_set:
+            documents.append([filename, doctype, connector])
+            tasks.append((os.path.join(output_dir, doc), os.path.join(source_dir, fn_json)))
+
+    scores = _score_documents(
+        _score_element_type,
+        tasks,
+        {},
+        workers=workers,
+        cache_dir=cache_dir,
+        visualize=visualize,
+    )
+    rows = [document + score for document, score in zip(documents, scores) if score is not None]
 
     headers = ["filename", "doctype", "connector", "element-type-accuracy"]
     df = pd.DataFrame(rows, columns=headers)
@@ -290,6 +317,8 @@ def measure_table_structure_accuracy(
     export_dir: str = "metrics",
     visualize: bool = False,
     cutoff: Optional[float] = None,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
 ):
     """
     Loops through the list of structured output from all of `output_dir` or selected files from
@@ -305,21 +334,27 @@ def measure_table_structure_accuracy(
         - element's row content accuracy
 
     After looped through the whole list, write to tsv. Also calculates the aggregated accuracy.
+
+    Documents are scored across `workers` processes. When `cache_dir` is set, the scores of each
+    document are cached there and reused as long as the document, its gold-standard and the
+    options of the metric don't change.
     """
     if not output_list:
         output_list = _listdir_recursive(output_dir)
     if not source_list:
         source_list = _listdir_recursive(source_dir)
 
-    rows = []
-    for doc in tqdm(output_list, leave=False, disable=not visualize):  # type: ignore
+    source_set = set(source_list)
+
+    documents, tasks = [], []
+    for doc in output_list:  # type: ignore
         doc_path = Path(doc)
         out_filename = doc_path.stem
         doctype = Path(out_filename).suffix
         src_gt_filename = out_filename + ".json"
         connector = doc_path.parts[-2] if len(doc_path.parts) > 1 else None
 
-        if src_gt_filename in source_list:  # type: ignore
+        if src_gt_filename in source_set:
             prediction_file = Path(output_dir) / doc
             if not prediction_file.exists():
                 logger.warning(f"Prediction file {prediction_file} does not exist, skipping")
@@ -330,20 +365,18 @@ def measure_table_structure_accuracy(
                 logger.warning(f"Ground truth file {ground_truth_file} does not exist, skipping")
                 continue
 
-            processor = TableEvalProcessor.from_json_files(
-                prediction_file=prediction_file,
-                ground_truth_file=ground_truth_file,
-                cutoff=cutoff,
-            )
-            report = processor.process_file()
-            rows.append(
-                [
-                    out_filename,
-                    doctype,
-                    connector,
-                ]
-                + [getattr(report, metric) for metric in table_eval_metrics]
-            )
+            documents.append([out_filename, doctype, connector])
+            tasks.append((str(prediction_file), str(ground_truth_file)))
+
+    scores = _score_documents(
+        _score_table_structure,
+        tasks,
+        {"cutoff": cutoff},
+        workers=workers,
+        cache_dir=cache_dir,
+        visualize=visualize,
+    )
+    rows = [document + score for document, score in zip(documents, scores) if score is not None]
 
     headers = [
         "filename",
@@ -443,3 +476,91 @@ def filter_metrics(
         raise ValueError("Please provide `export_filename`.")
     else:
         raise ValueError("Return type must be either `dataframe` or `file`.")
+
+
+def _score_documents(
+    score: Callable[..., Optional[List[Any]]],
+    tasks: List[Tuple[str, str]],
+    options: Dict[str, Any],
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    visualize: bool = False,
+) -> List[Optional[List[Any]]]:
+    """Scores of each pair of output and gold-standard files of `tasks`, computed by calling
+    `score` with the two paths and `options`, and None for the pairs that couldn't be scored.
+
+    Pairs are scored across `workers` processes. When `cache_dir` is set, the scores cached there
+    are reused and each new score is cached as soon as it's computed, so an interrupted run picks up
+    where it stopped.
+    """
+    scores: List[Optional[List[Any]]] = [None] * len(tasks)
+    cache = ScoreCache(cache_dir) if cache_dir else None
+    keys: List[Optional[str]] = [None] * len(tasks)
+    if cache is not None:
+        keys = [get_score_key(score.__name__, options, *task) for task in tasks]
+        cached = cache.get_many(key for key in keys if key is not None)
+        for i, key in enumerate(keys):
+            if key in cached:
+                scores[i] = cached[key]
+    pending = [i for i, task_scores in enumerate(scores) if task_scores is None]
+
+    # NOTE(klaijan) - disable=True means to not show, disable=False means to show the progress bar
+    progress = tqdm(total=len(pending), leave=False, disable=not visualize)
+
+    def record(i: int, task_scores: Optional[List[Any]]):
+        scores[i] = task_scores
+        key = keys[i]
+        if cache is not None and key is not None and task_scores is not None:
+            cache.put(key, task_scores)
+        progress.update()
+
+    score_task = functools.partial(score, **options)
+    try:
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+                futures = {executor.submit(score_task, *tasks[i]): i for i in pending}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+        else:
+            for i in pending:
+                record(i, score_task(*tasks[i]))
+    finally:
+        progress.close()
+        if cache is not None:
+            cache.close()
+    return scores
+
+
+def _score_text_extraction(
+    output_path: str,
+    source_path: str,
+    output_type: str,
+    weights: Tuple[int, int, int],
+) -> Optional[List[Any]]:
+    try:
+        output_cct = _prepare_output_cct(output_path, output_type)
+        source_cct = _read_text_file(source_path)
+    except Exception:
+        # if any of the output/source file is unable to open, skip the document
+        return None
+    accuracy = round(calculate_accuracy(output_cct, source_cct, weights), 3)
+    percent_missing = round(calculate_percent_missing_text(output_cct, source_cct), 3)
+    return [accuracy, percent_missing]
+
+
+def _score_element_type(output_path: str, source_path: str) -> Optional[List[Any]]:
+    output = get_element_type_frequency(_read_text_file(output_path))
+    source = get_element_type_frequency(_read_text_file(source_path))
+    return [round(calculate_element_type_percent_match(output, source), 3)]
+
+
+def _score_table_structure(
+    output_path: str, source_path: str, cutoff: Optional[float]
+) -> Optional[List[Any]]:
+    processor = TableEvalProcessor.from_json_files(
+        prediction_file=Path(output_path),
+        ground_truth_file=Path(source_path),
+        cutoff=cutoff,
+    )
+    report = processor.process_file()
+    return [getattr(report, metric) for metric in table_eval_metrics]
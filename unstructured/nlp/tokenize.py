@@ -8,12 +8,13 @@ else:
     from typing import Final
 
 import nltk
-from nltk import pos_tag as _pos_tag
-from nltk import sent_tokenize as _sent_tokenize
-from nltk import word_tokenize as _word_tokenize
+from nltk.tag import PerceptronTagger
+from nltk.tokenize import NLTKWordTokenizer, PunktSentenceTokenizer
 
 CACHE_MAX_SIZE: Final[int] = 128
 
+_word_tokenizer = NLTKWordTokenizer()
+
 
 def _download_nltk_package_if_not_present(package_name: str, package_category: str):
     """If the required nlt package is not present, download it."""
@@ -23,28 +24,68 @@ def _download_nltk_package_if_not_present(package_name: str, package_category: s
         nltk.download(package_name)
 
 
+# NOTE: the NLTK models are looked up on the data path and loaded once per process rather than on
+# every call, the NLTK functions wrapped below otherwise reload the tagger model from disk for each
+# text they tag.
+@lru_cache(maxsize=None)
+def _get_sentence_tokenizer() -> PunktSentenceTokenizer:
+    _download_nltk_package_if_not_present(package_category="tokenizers", package_name="punkt")
+    return nltk.data.load("tokenizers/punkt/english.pickle")
+
+
+@lru_cache(maxsize=None)
+def _get_pos_tagger() -> PerceptronTagger:
+    _download_nltk_package_if_not_present(
+        package_category="taggers",
+        package_name="averaged_perceptron_tagger",
+    )
+    return PerceptronTagger()
+
+
+def load_nltk_resources():
+    """Loads the NLTK models used by this module, downloading them if needed.
+
+    They are otherwise loaded on first use, call this to load them ahead of time, e.g. in the
+    initializer of a pool of worker processes.
+    """
+    _get_sentence_tokenizer()
+    _get_pos_tagger()
+
+
+def _sent_tokenize(text: str) -> List[str]:
+    return _get_sentence_tokenizer().tokenize(text)
+
+
+def _word_tokenize(text: str) -> List[str]:
+    return [
+        token for sentence in _sent_tokenize(text) for token in _word_tokenizer.tokenize(sentence)
+    ]
+
+
+def _pos_tag(tokens: List[str]) -> List[Tuple[str, str]]:
+    return _get_pos_tagger().tag(tokens)
+
+
+def _pos_tag_sents(sentences: List[List[str]]) -> List[List[Tuple[str, str]]]:
+    tagger = _get_pos_tagger()
+    return [tagger.tag(tokens) for tokens in sentences]
+
+
 @lru_cache(maxsize=CACHE_MAX_SIZE)
 def sent_tokenize(text: str) -> List[str]:
     """A wrapper around the NLTK sentence tokenizer with LRU caching enabled."""
-    _download_nltk_package_if_not_present(package_category="tokenizers", package_name="punkt")
     return _sent_tokenize(text)
 
 
 @lru_cache(maxsize=CACHE_MAX_SIZE)
 def word_tokenize(text: str) -> List[str]:
     """A wrapper around the NLTK word tokenizer with LRU caching enabled."""
-    _download_nltk_package_if_not_present(package_category="tokenizers", package_name="punkt")
     return _word_tokenize(text)
 
 
 @lru_cache(maxsize=CACHE_MAX_SIZE)
 def pos_tag(text: str) -> List[Tuple[str, str]]:
     """A wrapper around the NLTK POS tagger with LRU caching enabled."""
-    _download_nltk_package_if_not_present(package_category="tokenizers", package_name="punkt")
-    _download_nltk_package_if_not_present(
-        package_category="taggers",
-        package_name="averaged_perceptron_tagger",
-    )
     # NOTE(robinson) - Splitting into sentences before tokenizing. The helps with
     # situations like "ITEM 1A. PROPERTIES" where "PROPERTIES" can be mistaken
     # for a verb because it looks like it's in verb form an "ITEM 1A." looks like the subject.
@@ -54,3 +95,11 @@ def pos_tag(text: str) -> List[Tuple[str, str]]:
         tokens = _word_tokenize(sentence)
         parts_of_speech.extend(_pos_tag(tokens))
     return parts_of_speech
+
+
+def pos_tag_sentences(sentences: List[List[str]]) -> List[List[Tuple[str, str]]]:
+    """A wrapper around the NLTK POS tagger for a batch of tokenized sentences, which tags them all
+    with the same tagger."""
+    if not sentences:
+        return []
+    return _pos_tag_sents(sentences)
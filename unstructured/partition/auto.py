@@ -1,4 +1,6 @@
+import importlib
 import io
+import sys
 from typing import IO, Callable, Dict, List, Optional, Tuple
 
 import requests
@@ -13,94 +15,62 @@ from unstructured.file_utils.filetype import (
 )
 from unstructured.logger import logger
 from unstructured.partition.common import exactly_one
-from unstructured.partition.email import partition_email
-from unstructured.partition.html import partition_html
-from unstructured.partition.json import partition_json
 from unstructured.partition.lang import (
     check_language_args,
 )
-from unstructured.partition.text import partition_text
+from unstructured.partition.utils.cache import PartitionCache, cache_partition
 from unstructured.partition.utils.constants import PartitionStrategy
-from unstructured.partition.xml import partition_xml
 from unstructured.utils import dependency_exists
 
+# NOTE: partitioners are imported on first use rather than with this module, so that importing
+# `partition` doesn't pull in the dependencies (pdfminer, pandas, nltk, ...) of every file type.
+# Each entry is the module of `partition_<doc_type>` and the extra dependencies it needs.
+PARTITIONER_MODULES: Dict[str, Tuple[str, List[str]]] = {
+    "csv": ("unstructured.partition.csv", ["pandas"]),
+    "doc": ("unstructured.partition.doc", ["docx"]),
+    "docx": ("unstructured.partition.docx", ["docx"]),
+    "email": ("unstructured.partition.email", []),
+    "epub": ("unstructured.partition.epub", ["pypandoc"]),
+    "html": ("unstructured.partition.html", []),
+    "image": ("unstructured.partition.image", ["unstructured_inference"]),
+    "json": ("unstructured.partition.json", []),
+    "md": ("unstructured.partition.md", ["markdown"]),
+    "msg": ("unstructured.partition.msg", ["msg_parser"]),
+    "odt": ("unstructured.partition.odt", ["docx", "pypandoc"]),
+    "org": ("unstructured.partition.org", ["pypandoc"]),
+    "pdf": ("unstructured.partition.pdf", ["pdf2image", "pdfminer", "PIL"]),
+    "ppt": ("unstructured.partition.ppt", ["pptx"]),
+    "pptx": ("unstructured.partition.pptx", ["pptx"]),
+    "rst": ("unstructured.partition.rst", ["pypandoc"]),
+    "rtf": ("unstructured.partition.rtf", ["pypandoc"]),
+    "text": ("unstructured.partition.text", []),
+    "tsv": ("unstructured.partition.tsv", ["pandas"]),
+    "xlsx": ("unstructured.partition.xlsx", ["pandas", "openpyxl"]),
+    "xml": ("unstructured.partition.xml", []),
+}
+
+# -- partitioners of the doc types with extra dependencies, added as they're first used --
 PARTITION_WITH_EXTRAS_MAP: Dict[str, Callable] = {}
 
-if dependency_exists("pandas"):
-    from unstructured.partition.csv import partition_csv
-    from unstructured.partition.tsv import partition_tsv
 
-    PARTITION_WITH_EXTRAS_MAP["csv"] = partition_csv
-    PARTITION_WITH_EXTRAS_MAP["tsv"] = partition_tsv
+def _import_partitioner(doc_type: str) -> Callable:
+    module_name, _ = PARTITIONER_MODULES[doc_type]
+    return getattr(importlib.import_module(module_name), f"partition_{doc_type}")
 
 
-if dependency_exists("docx"):
-    from unstructured.partition.doc import partition_doc
-    from unstructured.partition.docx import partition_docx
+def __getattr__(name: str):
+    """Imports `partition_<doc_type>` functions on first access, e.g. `auto.partition_html`."""
+    doc_type = name[len("partition_") :] if name.startswith("partition_") else None
+    if doc_type not in PARTITIONER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    partition_func = _import_partitioner(doc_type)
+    globals()[name] = partition_func
+    return partition_func
 
-    PARTITION_WITH_EXTRAS_MAP["doc"] = partition_doc
-    PARTITION_WITH_EXTRAS_MAP["docx"] = partition_docx
 
-
-if dependency_exists("docx") and dependency_exists("pypandoc"):
-    from unstructured.partition.odt import partition_odt
-
-    PARTITION_WITH_EXTRAS_MAP["odt"] = partition_odt
-
-
-if dependency_exists("pypandoc"):
-    from unstructured.partition.epub import partition_epub
-
-    PARTITION_WITH_EXTRAS_MAP["epub"] = partition_epub
-
-
-if dependency_exists("pypandoc"):
-    from unstructured.partition.org import partition_org
-    from unstructured.partition.rst import partition_rst
-    from unstructured.partition.rtf import partition_rtf
-
-    PARTITION_WITH_EXTRAS_MAP["org"] = partition_org
-    PARTITION_WITH_EXTRAS_MAP["rst"] = partition_rst
-    PARTITION_WITH_EXTRAS_MAP["rtf"] = partition_rtf
-
-
-if dependency_exists("markdown"):
-    from unstructured.partition.md import partition_md
-
-    PARTITION_WITH_EXTRAS_MAP["md"] = partition_md
-
-
-if dependency_exists("msg_parser"):
-    from unstructured.partition.msg import partition_msg
-
-    PARTITION_WITH_EXTRAS_MAP["msg"] = partition_msg
-
-
-pdf_imports = ["pdf2image", "pdfminer", "PIL"]
-if all(dependency_exists(dep) for dep in pdf_imports):
-    from unstructured.partition.pdf import partition_pdf
-
-    PARTITION_WITH_EXTRAS_MAP["pdf"] = partition_pdf
-
-
-if dependency_exists("unstructured_inference"):
-    from unstructured.partition.image import partition_image
-
-    PARTITION_WITH_EXTRAS_MAP["image"] = partition_image
-
-
-if dependency_exists("pptx"):
-    from unstructured.partition.ppt import partition_ppt
-    from unstructured.partition.pptx import partition_pptx
-
-    PARTITION_WITH_EXTRAS_MAP["ppt"] = partition_ppt
-    PARTITION_WITH_EXTRAS_MAP["pptx"] = partition_pptx
-
-
-if dependency_exists("pandas") and dependency_exists("openpyxl"):
-    from unstructured.partition.xlsx import partition_xlsx
-
-    PARTITION_WITH_EXTRAS_MAP["xlsx"] = partition_xlsx
+def _get_partition_func(doc_type: str) -> Callable:
+    """The `partition_<doc_type>` function of a doc type without extra dependencies."""
+    return getattr(sys.modules[__name__], f"partition_{doc_type}")
 
 
 IMAGE_FILETYPES = [
@@ -118,6 +88,10 @@ def _get_partition_with_extras(
 ):
     if partition_with_extras_map is None:
         partition_with_extras_map = PARTITION_WITH_EXTRAS_MAP
+        if doc_type not in partition_with_extras_map and all(
+            dependency_exists(dep) for dep in PARTITIONER_MODULES[doc_type][1]
+        ):
+            partition_with_extras_map[doc_type] = _get_partition_func(doc_type)
     _partition_func = partition_with_extras_map.get(doc_type)
     if _partition_func is None:
         raise ImportError(
@@ -128,6 +102,7 @@ def _get_partition_with_extras(
     return _partition_func
 
 
+@cache_partition
 def partition(
     filename: Optional[str] = None,
     content_type: Optional[str] = None,
@@ -156,6 +131,7 @@ def partition(
     hi_res_model_name: Optional[str] = None,
     model_name: Optional[str] = None,  # to be deprecated
     date_from_file_object: bool = False,
+    partition_cache: Optional[PartitionCache] = None,
     **kwargs,
 ):
     """Partitions a document into its constituent elements. Will use libmagic to determine
@@ -241,6 +217,11 @@ def partition(
         Applies only when providing file via `file` parameter. If this option is True and inference
         from message header failed, attempt to infer last_modified metadata from bytes,
         otherwise set it to None.
+    partition_cache
+        A `PartitionCache` to look the elements up in before partitioning, and to store them in
+        after. Results are keyed by the bytes of the file and the partitioning options, so the
+        same bytes are only partitioned once whatever their filename. Calls with a `url`,
+        `unique_element_ids=True` or extracting images to a directory aren't cached.
     """
     exactly_one(file=file, filename=filename, url=url)
 
@@ -323,7 +304,8 @@ def partition(
             **kwargs,
         )
     elif filetype == FileType.EML:
-        elements = partition_email(
+        _partition_email = _get_partition_func("email")
+        elements = _partition_email(
             filename=filename,
             file=file,
             encoding=encoding,
@@ -341,7 +323,8 @@ def partition(
             **kwargs,
         )
     elif filetype == FileType.HTML:
-        elements = partition_html(
+        _partition_html = _get_partition_func("html")
+        elements = _partition_html(
             filename=filename,
             file=file,
             include_page_breaks=include_page_breaks,
@@ -351,7 +334,8 @@ def partition(
             **kwargs,
         )
     elif filetype == FileType.XML:
-        elements = partition_xml(
+        _partition_xml = _get_partition_func("xml")
+        elements = _partition_xml(
             filename=filename,
             file=file,
             encoding=encoding,
@@ -421,7 +405,8 @@ def partition(
             **kwargs,
         )
     elif filetype in IMAGE_FILETYPES:
-        elements = partition_image(
+        _partition_image = _get_partition_with_extras("image")
+        elements = _partition_image(
             filename=filename,  # type: ignore
             file=file,  # type: ignore
             url=None,
@@ -437,7 +422,8 @@ def partition(
             **kwargs,
         )
     elif filetype == FileType.TXT:
-        elements = partition_text(
+        _partition_text = _get_partition_func("text")
+        elements = _partition_text(
             filename=filename,
             file=file,
             encoding=encoding,
@@ -485,7 +471,8 @@ def partition(
                 "Detected a JSON file that does not conform to the Unstructured schema. "
                 "partition_json currently only processes serialized Unstructured output.",
             )
-        elements = partition_json(filename=filename, file=file, **kwargs)
+        _partition_json = _get_partition_func("json")
+        elements = _partition_json(filename=filename, file=file, **kwargs)
     elif (filetype == FileType.XLSX) or (filetype == FileType.XLS):
         _partition_xlsx = _get_partition_with_extras("xlsx")
         elements = _partition_xlsx(
@@ -6,7 +6,7 @@ import subprocess
 from datetime import datetime
 from io import BufferedReader, BytesIO, TextIOWrapper
 from tempfile import SpooledTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, BinaryIO, List, Optional
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional
 
 import emoji
 from tabulate import tabulate
@@ -27,15 +27,15 @@ from unstructured.documents.elements import (
 from unstructured.logger import logger
 from unstructured.nlp.patterns import ENUMERATED_BULLETS_RE, UNICODE_BULLETS_RE
 from unstructured.partition.utils.constants import SORT_MODE_DONT, SORT_MODE_XY_CUT
-from unstructured.utils import dependency_exists, first
+from unstructured.partition.utils.libreoffice import DEFAULT_FILTERS, get_soffice_pool
+from unstructured.utils import dependency_exists
 
-if dependency_exists("pptx") and dependency_exists("pptx.table"):
-    from pptx.table import Table as PptxTable
-
-if dependency_exists("numpy") and dependency_exists("cv2"):
+# NOTE: sorting only needs numpy; checking for cv2 here imported it with every partitioner
+if dependency_exists("numpy"):
     from unstructured.partition.utils.sorting import sort_page_elements
 
 if TYPE_CHECKING:
+    from pptx.table import Table as PptxTable
     from unstructured_inference.inference.layout import DocumentLayout, PageLayout
     from unstructured_inference.inference.layoutelement import LayoutElement
 
@@ -222,13 +222,18 @@ def layout_list_to_list_items(
 
 
 def set_element_hierarchy(
-    elements: List[Element], ruleset: dict[str, list[str]] = HIERARCHY_RULE_SET
+    elements: List[Element],
+    ruleset: dict[str, list[str]] = HIERARCHY_RULE_SET,
+    stack: Optional[List[Element]] = None,
 ) -> list[Element]:
     """Sets the parent_id for each element in the list of elements
     based on the element's category, depth and a ruleset
 
+    `stack` holds the chain of candidate parents. Passing the same list across calls lets a
+    document processed in batches (e.g. page by page) get the same hierarchy as one processed
+    all at once.
     """
-    stack: List[Element] = []
+    stack = [] if stack is None else stack
     for element in elements:
         if element.metadata.parent_id is not None:
             continue
@@ -366,6 +371,10 @@ def convert_office_doc(
 ):
     """Converts a .doc file to a .docx file using the libreoffice CLI.
 
+    When the `LIBREOFFICE_INSTANCES` environment variable is set, the file is converted by one of
+    the long-lived LibreOffice instances of the process instead of a new `soffice` process, see
+    `unstructured.partition.utils.libreoffice`.
+
     Parameters
     ----------
     input_filename: str
@@ -384,22 +393,49 @@ def convert_office_doc(
     https://git.libreoffice.org/core/+/refs/heads/master/filter/source/config/fragments/filters
 
     """
-    if target_filter is not None:
-        target_format = f"{target_format}:{target_filter}"
-    # NOTE(robinson) - In the future can also include win32com client as a fallback for windows
-    # users who do not have LibreOffice installed
-    # ref: https://stackoverflow.com/questions/38468442/
-    #       multiple-doc-to-docx-file-conversion-using-python
-    command = [
-        "soffice",
-        "--headless",
-        "--convert-to",
-        target_format,
-        "--outdir",
+    convert_office_docs(
+        [input_filename],
         output_directory,
-        input_filename,
-    ]
+        target_format=target_format,
+        target_filter=target_filter,
+    )
+
+
+def convert_office_docs(
+    input_filenames: List[str],
+    output_directory: str,
+    target_format: str = "docx",
+    target_filter: Optional[str] = None,
+):
+    """Converts several files like `convert_office_doc()`, in a single call.
+
+    The files are converted concurrently by the LibreOffice instances of the process when the
+    `LIBREOFFICE_INSTANCES` environment variable is set, and by a single `soffice` process
+    otherwise. Files that fail to convert are logged and left out of `output_directory`.
+    """
+    if not input_filenames:
+        return
     try:
+        pool = get_soffice_pool()
+        if pool is not None and (target_filter or target_format in DEFAULT_FILTERS):
+            pool.convert_many(input_filenames, output_directory, target_format, target_filter)
+            return
+
+        if target_filter is not None:
+            target_format = f"{target_format}:{target_filter}"
+        # NOTE(robinson) - In the future can also include win32com client as a fallback for windows
+        # users who do not have LibreOffice installed
+        # ref: https://stackoverflow.com/questions/38468442/
+        #       multiple-doc-to-docx-file-conversion-using-python
+        command = [
+            "soffice",
+            "--headless",
+            "--convert-to",
+            target_format,
+            "--outdir",
+            output_directory,
+            *input_filenames,
+        ]
         process = subprocess.Popen(
             command,
             stdout=subprocess.PIPE,
@@ -545,23 +581,36 @@ def document_to_element_list(
     detection_origin: Optional[str] = None,
     sort_mode: str = SORT_MODE_XY_CUT,
     languages: Optional[List[str]] = None,
+    starting_page_number: int = 1,
     **kwargs: Any,
 ) -> List[Element]:
-    """Converts a DocumentLayout object to a list of unstructured elements."""
+    """Converts a DocumentLayout object to a list of unstructured elements.
+
+    `starting_page_number` is the page number of the first page of `document`, for when the
+    document is converted one page (or one batch of pages) at a time.
+    """
     elements: List[Element] = []
 
     num_pages = len(document.pages)
     for i, page in enumerate(document.pages):
+        page_number = starting_page_number + i
         page_elements: List[Element] = []
 
         page_image_metadata = _get_page_image_metadata(page)
         image_format = page_image_metadata.get("format")
         image_width = page_image_metadata.get("width")
         image_height = page_image_metadata.get("height")
+        page_has_image_size = bool(image_width and image_height)
 
+        # -- the first element each layout element translates to, keyed by the identity of the
+        # -- layout element, so parents are resolved with one lookup instead of a scan
+        element_by_layout_element_id: Dict[int, Element] = {}
         translation_mapping: list[tuple["LayoutElement", Element]] = []
+        # -- whether the page has a Headline or Subheadline; only computed (once) when needed
+        page_has_headline: Optional[bool] = None
+        page_has_untyped_element = False
         for layout_element in page.elements:
-            if image_width and image_height and hasattr(layout_element.bbox, "coordinates"):
+            if page_has_image_size and hasattr(layout_element.bbox, "coordinates"):
                 coordinate_system = PixelSpace(width=image_width, height=image_height)
             else:
                 coordinate_system = None
@@ -576,9 +625,11 @@ def document_to_element_list(
                 for el in element:
                     if last_modification_date:
                         el.metadata.last_modified = last_modification_date
-                    el.metadata.page_number = i + 1
+                    el.metadata.page_number = page_number
                 page_elements.extend(element)
                 translation_mapping.extend([(layout_element, el) for el in element])
+                if element:
+                    element_by_layout_element_id.setdefault(id(layout_element), element[0])
                 continue
             else:
                 if last_modification_date:
@@ -586,16 +637,22 @@ def document_to_element_list(
                 element.metadata.text_as_html = (
                     layout_element.text_as_html if hasattr(layout_element, "text_as_html") else None
                 )
-                try:
-                    if (
-                        isinstance(element, Title) and element.metadata.category_depth is None
-                    ) and any(el.type in ["Headline", "Subheadline"] for el in page.elements):
+                if isinstance(element, Title) and element.metadata.category_depth is None:
+                    if page_has_headline is None and not page_has_untyped_element:
+                        try:
+                            page_has_headline = any(
+                                el.type in ["Headline", "Subheadline"] for el in page.elements
+                            )
+                        except AttributeError:
+                            page_has_untyped_element = True
+                    if page_has_untyped_element:
+                        logger.info("HTML element instance has no attribute type")
+                    elif page_has_headline:
                         element.metadata.category_depth = 0
-                except AttributeError:
-                    logger.info("HTML element instance has no attribute type")
 
                 page_elements.append(element)
                 translation_mapping.append((layout_element, element))
+                element_by_layout_element_id.setdefault(id(layout_element), element)
             coordinates = (
                 element.metadata.coordinates.points if element.metadata.coordinates else None
             )
@@ -606,7 +663,7 @@ def document_to_element_list(
 
             add_element_metadata(
                 element,
-                page_number=i + 1,
+                page_number=page_number,
                 filetype=image_format,
                 coordinates=coordinates,
                 coordinate_system=coordinate_system,
@@ -619,9 +676,9 @@ def document_to_element_list(
 
         for layout_element, element in translation_mapping:
             if hasattr(layout_element, "parent") and layout_element.parent is not None:
-                element_parent = first(
-                    (el for l_el, el in translation_mapping if l_el is layout_element.parent),
-                )
+                element_parent = element_by_layout_element_id.get(id(layout_element.parent))
+                if element_parent is None:
+                    raise ValueError("The parent of a layout element is not on the same page.")
                 element.metadata.parent_id = element_parent.id
         sorted_page_elements = page_elements
         if sortable and sort_mode != SORT_MODE_DONT:
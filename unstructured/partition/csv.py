@@ -1,6 +1,6 @@
 import csv
 from tempfile import SpooledTemporaryFile
-from typing import IO, BinaryIO, List, Optional, Union, cast
+from typing import IO, BinaryIO, Iterable, List, Optional, Union, cast
 
 import pandas as pd
 from lxml.html.soupparser import fromstring as soupparser_fromstring
@@ -36,9 +36,10 @@ def partition_csv(
     include_metadata: bool = True,
     infer_table_structure: bool = True,
     languages: Optional[List[str]] = ["auto"],
-    # NOTE (jennings) partition_csv generates a single TableElement
-    # so detect_language_per_element is not included as a param
+    # NOTE (jennings) partition_csv generates a single TableElement (or one per window of
+    # `rows_per_table` rows) so detect_language_per_element is not included as a param
     date_from_file_object: bool = False,
+    rows_per_table: Optional[int] = None,
     **kwargs,
 ) -> List[Element]:
     """Partitions Microsoft Excel Documents in .csv format into its document elements.
@@ -70,6 +71,12 @@ def partition_csv(
     date_from_file_object
         Applies only when providing file via `file` parameter. If this option is True, attempt
         infer last_modified metadata from bytes, otherwise set it to None.
+    rows_per_table
+        When set, the file is read in windows of this many rows, each emitted as its own `Table`
+        element with the header repeated when `include_header` is True, so that only one window is
+        parsed into a DataFrame and rendered at a time. The elements of all windows are still
+        returned together, so their text and HTML for the whole file are held in memory. Column
+        types are inferred for each window separately.
     """
     exactly_one(filename=filename, file=file)
 
@@ -77,7 +84,7 @@ def partition_csv(
 
     if filename:
         delimiter = get_delimiter(file_path=filename)
-        table = pd.read_csv(filename, header=header, sep=delimiter)
+        tables = _read_tables(filename, header, delimiter, rows_per_table)
         last_modification_date = get_last_modified_date(filename)
 
     elif file:
@@ -88,28 +95,39 @@ def partition_csv(
             cast(Union[BinaryIO, SpooledTemporaryFile], file),
         )
         delimiter = get_delimiter(file=f)
-        table = pd.read_csv(f, header=header, sep=delimiter)
-
-    html_text = table.to_html(index=False, header=include_header, na_rep="")
-    text = soupparser_fromstring(html_text).text_content()
-
-    if include_metadata:
-        metadata = ElementMetadata(
-            filename=metadata_filename or filename,
-            last_modified=metadata_last_modified or last_modification_date,
-            languages=languages,
-        )
-        if infer_table_structure:
-            metadata.text_as_html = html_text
-    else:
-        metadata = ElementMetadata()
-
-    elements = apply_lang_metadata(
-        [Table(text=text, metadata=metadata, detection_origin=DETECTION_ORIGIN)],
-        languages=languages,
-    )
-
-    return list(elements)
+        tables = _read_tables(f, header, delimiter, rows_per_table)
+
+    elements: List[Element] = []
+    for table in tables:
+        html_text = table.to_html(index=False, header=include_header, na_rep="")
+        text = soupparser_fromstring(html_text).text_content()
+
+        if include_metadata:
+            metadata = ElementMetadata(
+                filename=metadata_filename or filename,
+                last_modified=metadata_last_modified or last_modification_date,
+                languages=languages,
+            )
+            if infer_table_structure:
+                metadata.text_as_html = html_text
+        else:
+            metadata = ElementMetadata()
+
+        elements.append(Table(text=text, metadata=metadata, detection_origin=DETECTION_ORIGIN))
+
+    return list(apply_lang_metadata(elements, languages=languages))
+
+
+def _read_tables(
+    source: Union[str, IO[bytes]],
+    header: Optional[int],
+    delimiter: str,
+    rows_per_table: Optional[int],
+) -> Iterable[pd.DataFrame]:
+    """The whole table, or the windows of `rows_per_table` rows of it read one at a time."""
+    if rows_per_table is None:
+        return [pd.read_csv(source, header=header, sep=delimiter)]
+    return pd.read_csv(source, header=header, sep=delimiter, chunksize=rows_per_table)
 
 
 def get_delimiter(file_path=None, file=None):
@@ -1,9 +1,13 @@
 import copy
 import datetime
 import email
+import hashlib
+import inspect
+import io
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from email.message import Message
 from functools import partial
 from tempfile import NamedTemporaryFile, SpooledTemporaryFile, TemporaryDirectory
@@ -23,6 +27,7 @@ from unstructured.partition.common import (
     get_last_modified_date_from_file,
 )
 from unstructured.partition.lang import apply_lang_metadata
+from unstructured.partition.utils.config import env_config
 
 if sys.version_info < (3, 8):
     from typing_extensions import Final
@@ -201,26 +206,129 @@ def extract_attachment_info(
             attachment_info["payload"] = part.get_payload(decode=True)
             list_attachments.append(attachment_info)
 
-            for idx, attachment in enumerate(list_attachments):
-                if output_dir:
-                    if "filename" in attachment:
-                        filename = output_dir + "/" + attachment["filename"]
-                        with open(filename, "wb") as f:
-                            # Note(harrell) mypy wants to just us `w` when opening the file but this
-                            # causes an error since the payloads are bytes not str
-                            f.write(attachment["payload"])  # type: ignore
-                    else:
-                        with NamedTemporaryFile(
-                            mode="wb",
-                            dir=output_dir,
-                            delete=False,
-                        ) as f:
-                            list_attachments[idx]["filename"] = os.path.basename(f.name)
-                            f.write(attachment["payload"])  # type: ignore
+    for idx, attachment in enumerate(list_attachments):
+        if output_dir:
+            if "filename" in attachment:
+                filename = output_dir + "/" + attachment["filename"]
+                with open(filename, "wb") as f:
+                    # Note(harrell) mypy wants to just us `w` when opening the file but this
+                    # causes an error since the payloads are bytes not str
+                    f.write(attachment["payload"])  # type: ignore
+            else:
+                with NamedTemporaryFile(
+                    mode="wb",
+                    dir=output_dir,
+                    delete=False,
+                ) as f:
+                    list_attachments[idx]["filename"] = os.path.basename(f.name)
+                    f.write(attachment["payload"])  # type: ignore
 
     return list_attachments
 
 
+def _partition_attachment(
+    attachment_partitioner: Callable[..., List[Element]],
+    payload: bytes,
+    filename: Optional[str],
+    partition_kwargs: Dict[str, Any],
+) -> List[Element]:
+    if _accepts_file_kwarg(attachment_partitioner):
+        return attachment_partitioner(
+            file=io.BytesIO(payload),
+            metadata_filename=filename,
+            **partition_kwargs,
+        )
+    # -- partitioners that only take a `filename` get the payload written to a temporary file --
+    with TemporaryDirectory() as tmpdir:
+        attached_filename = os.path.join(tmpdir, os.path.basename(filename or "") or "attachment")
+        with open(attached_filename, "wb") as f:
+            f.write(payload)
+        return attachment_partitioner(filename=attached_filename, **partition_kwargs)
+
+
+def _accepts_file_kwarg(func: Callable[..., Any]) -> bool:
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return True
+    if "file" in parameters:
+        return True
+    # -- a function naming only `filename` but taking **kwargs still expects a filename --
+    if "filename" in parameters:
+        return False
+    return any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+
+
+def partition_attachments(
+    attachments: List[Dict[str, Any]],
+    attachment_partitioner: Optional[Callable[..., List[Element]]],
+    attached_to_filename: Optional[str],
+    attachment_workers: Optional[int] = None,
+    **partition_kwargs: Any,
+) -> List[Element]:
+    """Partitions the payloads of `attachments`, as returned by `extract_attachment_info()` or
+    `extract_msg_attachment_info()`, and returns their elements in the order of the attachments.
+
+    Payloads are passed to `attachment_partitioner` as `file` along with their `metadata_filename`,
+    without writing them to disk, unless it doesn't take a `file` argument in which case it gets
+    the `filename` of a temporary copy of the payload. Identical payloads, e.g. a logo in the
+    signature or a document forwarded back and forth, are partitioned once and their elements
+    copied for each attachment.
+    With `attachment_workers` greater than 1 (defaults to the `ATTACHMENT_WORKERS` environment
+    variable) distinct payloads are partitioned by a pool of that many processes, in which case
+    `attachment_partitioner` must be picklable.
+    """
+    attachment_workers = attachment_workers or env_config.ATTACHMENT_WORKERS
+    # -- the same bytes could be partitioned differently depending on their file extension --
+    attachment_keys: List[Optional[str]] = []
+    unique_attachments: Dict[str, Dict[str, Any]] = {}
+    for attachment in attachments:
+        payload = attachment.get("payload")
+        if payload is None:
+            attachment_keys.append(None)
+            continue
+        _, extension = os.path.splitext(attachment.get("filename") or "")
+        key = f"{hashlib.sha256(payload).hexdigest()}{extension.lower()}"
+        attachment_keys.append(key)
+        unique_attachments.setdefault(key, attachment)
+    if not unique_attachments:
+        return []
+    if attachment_partitioner is None:
+        raise ValueError("Specify the attachment_partitioner kwarg to process attachments.")
+
+    calls = [
+        (
+            attachment_partitioner,
+            attachment["payload"],
+            attachment.get("filename"),
+            partition_kwargs,
+        )
+        for attachment in unique_attachments.values()
+    ]
+    if attachment_workers <= 1 or len(calls) <= 1:
+        results = [_partition_attachment(*call) for call in calls]
+    else:
+        with ProcessPoolExecutor(max_workers=min(attachment_workers, len(calls))) as executor:
+            results = list(executor.map(_partition_attachment, *zip(*calls)))
+    elements_by_key = dict(zip(unique_attachments, results))
+
+    elements: List[Element] = []
+    used_keys = set()
+    for attachment, key in zip(attachments, attachment_keys):
+        if key is None:
+            continue
+        attached_elements = elements_by_key[key]
+        if key in used_keys:
+            attached_elements = copy.deepcopy(attached_elements)
+        used_keys.add(key)
+        for element in attached_elements:
+            element.metadata.filename = attachment.get("filename")
+            element.metadata.file_directory = None
+            element.metadata.attached_to_filename = attached_to_filename
+            elements.append(element)
+    return elements
+
+
 def has_embedded_image(element):
     PATTERN = re.compile("\[image: .+\]")  # noqa: W605 NOTE(harrell)
     return PATTERN.search(element.text)
@@ -311,7 +419,10 @@ def partition_email(
         If True, partition_email will process email attachments in addition to
         processing the content of the email itself.
     attachment_partitioner
-        The partitioning function to use to process attachments.
+        The partitioning function to use to process attachments, e.g. `partition`. Each attachment
+        is passed to it in memory as `file`, with its name as `metadata_filename`. A function that
+        doesn't take a `file` argument is called with the `filename` of a temporary copy of the
+        attachment instead. Required only when the message has attachments.
     min_partition
         The minimum number of characters to include in a partition. Only applies if
         processing the text/plain content.
@@ -499,26 +610,16 @@ def partition_email(
         element.metadata = copy.deepcopy(metadata)
 
     if process_attachments:
-        with TemporaryDirectory() as tmpdir:
-            extract_attachment_info(msg, tmpdir)
-            attached_files = os.listdir(tmpdir)
-            for attached_file in attached_files:
-                attached_filename = os.path.join(tmpdir, attached_file)
-                if attachment_partitioner is None:
-                    raise ValueError(
-                        "Specify the attachment_partitioner kwarg to process attachments.",
-                    )
-                attached_elements = attachment_partitioner(
-                    filename=attached_filename,
-                    metadata_last_modified=metadata_last_modified,
-                    max_partition=max_partition,
-                    min_partition=min_partition,
-                )
-                for element in attached_elements:
-                    element.metadata.filename = attached_file
-                    element.metadata.file_directory = None
-                    element.metadata.attached_to_filename = metadata_filename or filename
-                    all_elements.append(element)
+        all_elements.extend(
+            partition_attachments(
+                extract_attachment_info(msg),
+                attachment_partitioner,
+                attached_to_filename=metadata_filename or filename,
+                metadata_last_modified=metadata_last_modified,
+                max_partition=max_partition,
+                min_partition=min_partition,
+            ),
+        )
 
     elements = list(
         apply_lang_metadata(
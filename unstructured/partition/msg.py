@@ -1,4 +1,3 @@
-import os
 import tempfile
 from typing import IO, Callable, Dict, List, Optional
 
@@ -13,7 +12,7 @@ from unstructured.partition.common import (
     get_last_modified_date,
     get_last_modified_date_from_file,
 )
-from unstructured.partition.email import convert_to_iso_8601
+from unstructured.partition.email import convert_to_iso_8601, partition_attachments
 from unstructured.partition.html import partition_html
 from unstructured.partition.lang import apply_lang_metadata
 from unstructured.partition.text import partition_text
@@ -55,7 +54,10 @@ def partition_msg(
         If True, partition_email will process email attachments in addition to
         processing the content of the email itself.
     attachment_partitioner
-        The partitioning function to use to process attachments.
+        The partitioning function to use to process attachments, e.g. `partition`. Each attachment
+        is passed to it in memory as `file`, with its name as `metadata_filename`. A function that
+        doesn't take a `file` argument is called with the `filename` of a temporary copy of the
+        attachment instead. Required only when the message has attachments.
     metadata_last_modified
         The last modified date for the document.
     min_partition
@@ -130,26 +132,16 @@ def partition_msg(
         element.metadata = metadata
 
     if process_attachments:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            extract_msg_attachment_info(msg_obj=msg_obj, output_dir=tmpdir)
-            attached_files = os.listdir(tmpdir)
-            for attached_file in attached_files:
-                attached_filename = os.path.join(tmpdir, attached_file)
-                if attachment_partitioner is None:
-                    raise ValueError(
-                        "Specify the attachment_partitioner kwarg to process attachments.",
-                    )
-                attached_elements = attachment_partitioner(
-                    filename=attached_filename,
-                    metadata_last_modified=metadata_last_modified,
-                    max_partition=max_partition,
-                    min_partition=min_partition,
-                )
-                for element in attached_elements:
-                    element.metadata.filename = attached_file
-                    element.metadata.file_directory = None
-                    element.metadata.attached_to_filename = metadata_filename or filename
-                    elements.append(element)
+        elements.extend(
+            partition_attachments(
+                extract_msg_attachment_info(msg_obj=msg_obj),
+                attachment_partitioner,
+                attached_to_filename=metadata_filename or filename,
+                metadata_last_modified=metadata_last_modified,
+                max_partition=max_partition,
+                min_partition=min_partition,
+            ),
+        )
 
     elements = list(
         apply_lang_metadata(
@@ -12,6 +12,7 @@ from typing import (
     Any,
     BinaryIO,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -53,27 +54,33 @@ from unstructured.documents.elements import (
     ListItem,
     PageBreak,
     Text,
+    _add_regex_metadata,
     process_metadata,
 )
 from unstructured.file_utils.filetype import (
+    FILETYPE_TO_MIMETYPE,
     FileType,
     add_metadata_with_filetype,
 )
 from unstructured.logger import logger, trace_logger
 from unstructured.nlp.patterns import PARAGRAPH_PATTERN
 from unstructured.partition.common import (
+    add_element_metadata,
     convert_to_bytes,
     document_to_element_list,
     exactly_one,
     get_last_modified_date,
     get_last_modified_date_from_file,
     ocr_data_to_elements,
+    remove_element_metadata,
+    set_element_hierarchy,
     spooled_to_bytes_io_if_needed,
 )
 from unstructured.partition.lang import (
     check_language_args,
     prepare_languages_for_tesseract,
 )
+from unstructured.partition.pdf_image.page_image_cache import PageImageCache, PageImageStage
 from unstructured.partition.pdf_image.pdf_image_utils import (
     annotate_layout_elements,
     check_element_types_to_extract,
@@ -87,7 +94,7 @@ from unstructured.partition.pdf_image.pdfminer_utils import (
     rect_to_bbox,
 )
 from unstructured.partition.strategies import determine_pdf_or_image_strategy, validate_strategy
-from unstructured.partition.text import element_from_text
+from unstructured.partition.text import elements_from_texts
 from unstructured.partition.utils.constants import (
     SORT_MODE_BASIC,
     SORT_MODE_DONT,
@@ -104,7 +111,7 @@ from unstructured.patches.pdfminer import parse_keyword
 from unstructured.utils import requires_dependencies
 
 if TYPE_CHECKING:
-    pass
+    from unstructured_inference.inference.elements import TextRegion
 
 # NOTE(alan): Patching this to fix a bug in pdfminer.six. Submitted this PR into pdfminer.six to fix
 # the bug: https://github.com/pdfminer/pdfminer.six/pull/885
@@ -232,6 +239,119 @@ def partition_pdf(
     )
 
 
+def partition_pdf_iter(
+    filename: str = "",
+    file: Optional[Union[BinaryIO, SpooledTemporaryFile[bytes]]] = None,
+    include_page_breaks: bool = False,
+    infer_table_structure: bool = False,
+    ocr_languages: Optional[str] = None,  # changing to optional for deprecation
+    languages: Optional[List[str]] = None,
+    include_metadata: bool = True,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    hi_res_model_name: Optional[str] = None,
+    extract_images_in_pdf: bool = False,
+    extract_image_block_types: Optional[List[str]] = None,
+    extract_image_block_output_dir: Optional[str] = None,
+    extract_image_block_to_payload: bool = False,
+    date_from_file_object: bool = False,
+    **kwargs: Any,
+) -> Iterator[Element]:
+    """Partitions a pdf document with the `hi_res` strategy one page at a time.
+
+    Produces the same elements as `partition_pdf(strategy="hi_res")` but generates them page by
+    page: layout detection, the pdfminer merge, OCR and element conversion run for one page before
+    the next page is rendered. Peak memory therefore depends on the largest page rather than on
+    the page count, and the elements of the first pages are available before the last page has
+    been processed. Chunking is not applied; chunk the generated elements downstream if needed.
+
+    Parameters are the same as `partition_pdf`, less the ones that select a strategy or a
+    chunking strategy.
+    """
+
+    exactly_one(filename=filename, file=file)
+
+    languages = check_language_args(languages or [], ocr_languages) or ["eng"]
+
+    # init ability to process .heic files
+    register_heif_opener()
+
+    last_modification_date = get_the_last_modification_date_pdf_or_img(
+        file=file,
+        filename=filename,
+        date_from_file_object=date_from_file_object,
+    )
+
+    file = spooled_to_bytes_io_if_needed(file)
+    pdf_text_extractable = False
+    try:
+        with open_filename(filename, "rb") if file is None else contextlib.nullcontext(file) as fp:
+            pdf_text_extractable = _pdf_has_extractable_text(cast(BinaryIO, fp))
+    except Exception as e:
+        logger.error(e)
+        logger.warning("PDF text extraction failed, skip text extraction...")
+
+    if file is not None:
+        file.seek(0)
+
+    page_elements_iter = _iter_partition_pdf_or_image_local_by_page(
+        filename=filename,
+        file=file,
+        infer_table_structure=infer_table_structure,
+        include_page_breaks=include_page_breaks,
+        languages=languages,
+        metadata_last_modified=metadata_last_modified or last_modification_date,
+        hi_res_model_name=hi_res_model_name,
+        pdf_text_extractable=pdf_text_extractable,
+        extract_images_in_pdf=extract_images_in_pdf,
+        extract_image_block_types=extract_image_block_types,
+        extract_image_block_output_dir=extract_image_block_output_dir,
+        extract_image_block_to_payload=extract_image_block_to_payload,
+        **kwargs,
+    )
+
+    # -- apply, page by page, the post-processing `partition_pdf()` gets from its decorators --
+    regex_metadata: Dict[str, str] = kwargs.get("regex_metadata", {})
+    unique_element_ids: bool = kwargs.get("unique_element_ids", False)
+    set_hierarchy = not str(kwargs.get("model_name", "")).startswith("chipper")
+    hierarchy_stack: List[Element] = []
+    for page_elements in page_elements_iter:
+        elements = _process_uncategorized_text_elements(page_elements)
+
+        if include_metadata:
+            if set_hierarchy:
+                elements = set_element_hierarchy(elements, stack=hierarchy_stack)
+            for element in elements:
+                add_element_metadata(
+                    element,
+                    filename=metadata_filename or filename,
+                    filetype=FILETYPE_TO_MIMETYPE[FileType.PDF],
+                )
+        else:
+            elements = remove_element_metadata(elements)
+
+        if regex_metadata:
+            elements = _add_regex_metadata(elements, regex_metadata)
+        if unique_element_ids:
+            for element in elements:
+                element.id_to_uuid()
+
+        yield from elements
+
+
+def _pdf_has_extractable_text(fp: BinaryIO) -> bool:
+    """True when any page of the pdf has text pdfminer can extract.
+
+    Stops at the first page with text, so unlike partitioning with the `fast` strategy it does not
+    need to hold the text of the whole document.
+    """
+    for _, page_layout in open_pdfminer_pages_generator(fp):
+        for obj in page_layout:
+            if _extract_text(obj).strip():
+                return True
+    return False
+
+
 def partition_pdf_or_image(
     filename: str = "",
     file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
@@ -384,6 +504,7 @@ def _partition_pdf_or_image_local(
     include_page_breaks: bool = False,
     languages: Optional[List[str]] = None,
     ocr_mode: str = OCRMode.FULL_PAGE.value,
+    ocr_workers: Optional[int] = None,
     model_name: Optional[str] = None,  # to be deprecated in favor of `hi_res_model_name`
     hi_res_model_name: Optional[str] = None,
     pdf_image_dpi: Optional[int] = None,
@@ -398,11 +519,7 @@ def _partition_pdf_or_image_local(
     **kwargs,
 ) -> List[Element]:
     """Partition using package installed locally"""
-    from unstructured_inference.inference.layout import (
-        process_data_with_model,
-        process_file_with_model,
-    )
-
+    from unstructured.partition.pdf_image.inference_utils import process_page_images_with_model
     from unstructured.partition.pdf_image.ocr import (
         process_data_with_ocr,
         process_file_with_ocr,
@@ -417,28 +534,43 @@ def _partition_pdf_or_image_local(
 
     ocr_languages = prepare_languages_for_tesseract(languages)
 
-    hi_res_model_name = hi_res_model_name or model_name or default_hi_res_model()
-    if pdf_image_dpi is None:
-        pdf_image_dpi = 300 if hi_res_model_name.startswith("chipper") else 200
-    if (pdf_image_dpi < 300) and (hi_res_model_name.startswith("chipper")):
-        logger.warning(
-            "The Chipper model performs better when images are rendered with DPI >= 300 "
-            f"(currently {pdf_image_dpi}).",
-        )
+    hi_res_model_name, pdf_image_dpi = _get_hi_res_model_name_and_dpi(
+        hi_res_model_name=hi_res_model_name,
+        model_name=model_name,
+        pdf_image_dpi=pdf_image_dpi,
+    )
+    extract_image_block_types = _get_image_block_types_to_extract(
+        extract_images_in_pdf=extract_images_in_pdf,
+        extract_image_block_types=extract_image_block_types,
+    )
 
-    if file is None:
-        inferred_document_layout = process_file_with_model(
-            filename,
-            is_image=is_image,
+    # NOTE: every stage below reads page images from the same cache so each page is rasterized
+    # only once; a page is evicted once all the stages that need it are done with it
+    page_image_stages = [PageImageStage.LAYOUT]
+    if not hi_res_model_name.startswith("chipper"):
+        page_image_stages.append(PageImageStage.OCR)
+        if analysis and file is None:
+            page_image_stages.append(PageImageStage.ANNOTATION)
+    if extract_image_block_types:
+        page_image_stages.append(PageImageStage.IMAGE_BLOCK_EXTRACTION)
+
+    with PageImageCache(
+        filename=filename,
+        file=file,
+        is_image=is_image,
+        dpi=pdf_image_dpi,
+        stages=page_image_stages,
+    ) as page_image_cache:
+        inferred_document_layout = process_page_images_with_model(
+            page_image_cache,
             model_name=hi_res_model_name,
-            pdf_image_dpi=pdf_image_dpi,
         )
 
         if hi_res_model_name.startswith("chipper"):
             # NOTE(alan): We shouldn't do OCR with chipper
             # NOTE(antonio): We shouldn't do PDFMiner with chipper
             final_document_layout = inferred_document_layout
-        else:
+        elif file is None:
             extracted_layout = (
                 process_file_with_pdfminer(filename=filename, dpi=pdf_image_dpi)
                 if pdf_text_extractable
@@ -453,6 +585,7 @@ def _partition_pdf_or_image_local(
                     output_dir_path=analyzed_image_output_dir_path,
                     pdf_image_dpi=pdf_image_dpi,
                     is_image=is_image,
+                    page_image_cache=page_image_cache,
                 )
 
             # NOTE(christine): merged_document_layout = extracted_layout + inferred_layout
@@ -470,19 +603,9 @@ def _partition_pdf_or_image_local(
                 ocr_languages=ocr_languages,
                 ocr_mode=ocr_mode,
                 pdf_image_dpi=pdf_image_dpi,
+                page_image_cache=page_image_cache,
+                ocr_workers=ocr_workers,
             )
-    else:
-        inferred_document_layout = process_data_with_model(
-            file,
-            is_image=is_image,
-            model_name=hi_res_model_name,
-            pdf_image_dpi=pdf_image_dpi,
-        )
-
-        if hi_res_model_name.startswith("chipper"):
-            # NOTE(alan): We shouldn't do OCR with chipper
-            # NOTE(antonio): We shouldn't do PDFMiner with chipper
-            final_document_layout = inferred_document_layout
         else:
             if hasattr(file, "seek"):
                 file.seek(0)
@@ -510,61 +633,243 @@ def _partition_pdf_or_image_local(
                 ocr_languages=ocr_languages,
                 ocr_mode=ocr_mode,
                 pdf_image_dpi=pdf_image_dpi,
+                page_image_cache=page_image_cache,
+                ocr_workers=ocr_workers,
             )
 
-    # NOTE(alan): starting with v2, chipper sorts the elements itself.
-    if hi_res_model_name.startswith("chipper") and hi_res_model_name != "chipperv1":
-        kwargs["sort_mode"] = SORT_MODE_DONT
+        # NOTE(alan): starting with v2, chipper sorts the elements itself.
+        if hi_res_model_name.startswith("chipper") and hi_res_model_name != "chipperv1":
+            kwargs["sort_mode"] = SORT_MODE_DONT
 
-    final_document_layout = clean_pdfminer_inner_elements(final_document_layout)
+        final_document_layout = clean_pdfminer_inner_elements(final_document_layout)
 
-    for page in final_document_layout.pages:
-        for el in page.elements:
-            el.text = el.text or ""
+        for page in final_document_layout.pages:
+            for el in page.elements:
+                el.text = el.text or ""
+
+        elements = document_to_element_list(
+            final_document_layout,
+            sortable=True,
+            include_page_breaks=include_page_breaks,
+            last_modification_date=metadata_last_modified,
+            # NOTE(crag): do not attempt to derive ListItem's from a layout-recognized "List"
+            # block with NLP rules. Otherwise, the assumptions in
+            # unstructured.partition.common::layout_list_to_list_items often result in weird
+            # chunking.
+            infer_list_items=False,
+            languages=languages,
+            **kwargs,
+        )
 
-    elements = document_to_element_list(
-        final_document_layout,
-        sortable=True,
+        for el_type in extract_image_block_types:
+            save_elements(
+                elements=elements,
+                element_category_to_save=el_type,
+                filename=filename,
+                file=file,
+                is_image=is_image,
+                pdf_image_dpi=pdf_image_dpi,
+                extract_image_block_to_payload=extract_image_block_to_payload,
+                output_dir_path=extract_image_block_output_dir,
+                page_image_cache=page_image_cache,
+            )
+        page_image_cache.release_all(PageImageStage.IMAGE_BLOCK_EXTRACTION)
+
+    return _clean_hi_res_elements(
+        elements,
         include_page_breaks=include_page_breaks,
-        last_modification_date=metadata_last_modified,
-        # NOTE(crag): do not attempt to derive ListItem's from a layout-recognized "List"
-        # block with NLP rules. Otherwise, the assumptions in
-        # unstructured.partition.common::layout_list_to_list_items often result in weird chunking.
-        infer_list_items=False,
-        languages=languages,
-        **kwargs,
+        hi_res_model_name=hi_res_model_name,
     )
 
-    extract_image_block_types = check_element_types_to_extract(extract_image_block_types)
-    #  NOTE(christine): `extract_images_in_pdf` would deprecate
-    #  (but continue to support for a while)
-    if extract_images_in_pdf:
-        save_elements(
-            elements=elements,
-            element_category_to_save=ElementType.IMAGE,
-            filename=filename,
-            file=file,
-            is_image=is_image,
-            pdf_image_dpi=pdf_image_dpi,
-            extract_image_block_to_payload=extract_image_block_to_payload,
-            output_dir_path=extract_image_block_output_dir,
+
+@requires_dependencies("unstructured_inference")
+def _iter_partition_pdf_or_image_local_by_page(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO]] = None,
+    is_image: bool = False,
+    infer_table_structure: bool = False,
+    include_page_breaks: bool = False,
+    languages: Optional[List[str]] = None,
+    ocr_mode: str = OCRMode.FULL_PAGE.value,
+    model_name: Optional[str] = None,  # to be deprecated in favor of `hi_res_model_name`
+    hi_res_model_name: Optional[str] = None,
+    pdf_image_dpi: Optional[int] = None,
+    metadata_last_modified: Optional[str] = None,
+    pdf_text_extractable: bool = False,
+    extract_images_in_pdf: bool = False,
+    extract_image_block_types: Optional[List[str]] = None,
+    extract_image_block_output_dir: Optional[str] = None,
+    extract_image_block_to_payload: bool = False,
+    **kwargs,
+) -> Iterator[List[Element]]:
+    """Page-streaming counterpart of `_partition_pdf_or_image_local`.
+
+    Runs layout detection, the pdfminer merge, OCR and element conversion one page at a time and
+    generates the elements of each page as soon as that page is done, so only one page image,
+    inferred layout and OCR layout are held in memory at once. Produces the same elements as
+    `_partition_pdf_or_image_local`.
+    """
+    from unstructured_inference.inference.layout import DocumentLayout
+
+    from unstructured.partition.pdf_image.inference_utils import iter_page_layouts_with_model
+    from unstructured.partition.pdf_image.ocr import supplement_page_layout_with_ocr
+    from unstructured.partition.pdf_image.pdfminer_processing import (
+        iter_page_layouts_with_pdfminer,
+    )
+
+    if languages is None:
+        languages = ["eng"]
+
+    ocr_languages = prepare_languages_for_tesseract(languages)
+
+    hi_res_model_name, pdf_image_dpi = _get_hi_res_model_name_and_dpi(
+        hi_res_model_name=hi_res_model_name,
+        model_name=model_name,
+        pdf_image_dpi=pdf_image_dpi,
+    )
+    extract_image_block_types = _get_image_block_types_to_extract(
+        extract_images_in_pdf=extract_images_in_pdf,
+        extract_image_block_types=extract_image_block_types,
+    )
+    is_chipper = hi_res_model_name.startswith("chipper")
+
+    # NOTE(alan): starting with v2, chipper sorts the elements itself.
+    if is_chipper and hi_res_model_name != "chipperv1":
+        kwargs["sort_mode"] = SORT_MODE_DONT
+
+    page_image_stages = [PageImageStage.LAYOUT]
+    if not is_chipper:
+        page_image_stages.append(PageImageStage.OCR)
+    if extract_image_block_types:
+        page_image_stages.append(PageImageStage.IMAGE_BLOCK_EXTRACTION)
+
+    with contextlib.ExitStack() as exit_stack:
+        page_image_cache = exit_stack.enter_context(
+            PageImageCache(
+                filename=filename,
+                file=file,
+                is_image=is_image,
+                dpi=pdf_image_dpi,
+                stages=page_image_stages,
+            ),
         )
 
-    for el_type in extract_image_block_types:
-        if extract_images_in_pdf and el_type == ElementType.IMAGE:
-            continue
+        extracted_page_layouts: Iterator[List[TextRegion]] = iter([])
+        # NOTE(antonio): We shouldn't do PDFMiner with chipper
+        if pdf_text_extractable and not is_chipper:
+            pdf_fp = exit_stack.enter_context(open(page_image_cache.filename, "rb"))
+            extracted_page_layouts = iter_page_layouts_with_pdfminer(
+                file=pdf_fp,
+                dpi=pdf_image_dpi,
+            )
 
-        save_elements(
-            elements=elements,
-            element_category_to_save=el_type,
-            filename=filename,
-            file=file,
-            is_image=is_image,
-            pdf_image_dpi=pdf_image_dpi,
-            extract_image_block_to_payload=extract_image_block_to_payload,
-            output_dir_path=extract_image_block_output_dir,
+        number_of_pages = page_image_cache.number_of_pages
+        figure_numbers: Dict[str, int] = {el_type: 0 for el_type in extract_image_block_types}
+        inferred_page_layouts = iter_page_layouts_with_model(
+            page_image_cache,
+            model_name=hi_res_model_name,
         )
+        for page_number, inferred_page_layout in enumerate(inferred_page_layouts, start=1):
+            page_document_layout = DocumentLayout.from_pages([inferred_page_layout])
 
+            # NOTE(alan): We shouldn't do OCR with chipper
+            if not is_chipper:
+                extracted_regions = next(extracted_page_layouts, None)
+                if extracted_regions is not None:
+                    page_document_layout = merge_inferred_with_extracted_layout(
+                        inferred_document_layout=page_document_layout,
+                        extracted_layout=[extracted_regions],
+                    )
+
+                supplement_page_layout_with_ocr(
+                    page_layout=page_document_layout.pages[0],
+                    image=page_image_cache.get_image(page_number),
+                    infer_table_structure=infer_table_structure,
+                    ocr_languages=ocr_languages,
+                    ocr_mode=ocr_mode,
+                    extracted_regions=extracted_regions,
+                )
+                page_image_cache.release(page_number, PageImageStage.OCR)
+
+            page_document_layout = clean_pdfminer_inner_elements(page_document_layout)
+
+            for el in page_document_layout.pages[0].elements:
+                el.text = el.text or ""
+
+            elements = document_to_element_list(
+                page_document_layout,
+                sortable=True,
+                last_modification_date=metadata_last_modified,
+                # NOTE(crag): do not attempt to derive ListItem's from a layout-recognized "List"
+                # block with NLP rules. Otherwise, the assumptions in
+                # unstructured.partition.common::layout_list_to_list_items often result in weird
+                # chunking.
+                infer_list_items=False,
+                languages=languages,
+                starting_page_number=page_number,
+                **kwargs,
+            )
+            if include_page_breaks and page_number < number_of_pages:
+                elements.append(PageBreak(text=""))
+
+            for el_type in extract_image_block_types:
+                figure_numbers[el_type] = save_elements(
+                    elements=elements,
+                    element_category_to_save=el_type,
+                    filename=filename,
+                    file=file,
+                    is_image=is_image,
+                    pdf_image_dpi=pdf_image_dpi,
+                    extract_image_block_to_payload=extract_image_block_to_payload,
+                    output_dir_path=extract_image_block_output_dir,
+                    page_image_cache=page_image_cache,
+                    figure_number_offset=figure_numbers[el_type],
+                )
+            page_image_cache.release(page_number, PageImageStage.IMAGE_BLOCK_EXTRACTION)
+
+            yield _clean_hi_res_elements(
+                elements,
+                include_page_breaks=include_page_breaks,
+                hi_res_model_name=hi_res_model_name,
+            )
+
+
+def _get_hi_res_model_name_and_dpi(
+    hi_res_model_name: Optional[str],
+    model_name: Optional[str],
+    pdf_image_dpi: Optional[int],
+) -> Tuple[str, int]:
+    """Resolves the layout model to use and the DPI to render pages at for `hi_res`."""
+    hi_res_model_name = hi_res_model_name or model_name or default_hi_res_model()
+    if pdf_image_dpi is None:
+        pdf_image_dpi = 300 if hi_res_model_name.startswith("chipper") else 200
+    if (pdf_image_dpi < 300) and (hi_res_model_name.startswith("chipper")):
+        logger.warning(
+            "The Chipper model performs better when images are rendered with DPI >= 300 "
+            f"(currently {pdf_image_dpi}).",
+        )
+    return hi_res_model_name, pdf_image_dpi
+
+
+def _get_image_block_types_to_extract(
+    extract_images_in_pdf: bool,
+    extract_image_block_types: Optional[List[str]],
+) -> List[str]:
+    """Normalizes the element types to extract image blocks for."""
+    extract_image_block_types = check_element_types_to_extract(extract_image_block_types)
+    #  NOTE(christine): `extract_images_in_pdf` would deprecate
+    #  (but continue to support for a while)
+    if extract_images_in_pdf and ElementType.IMAGE not in extract_image_block_types:
+        extract_image_block_types = [ElementType.IMAGE] + extract_image_block_types
+    return extract_image_block_types
+
+
+def _clean_hi_res_elements(
+    elements: List[Element],
+    include_page_breaks: bool,
+    hi_res_model_name: str,
+) -> List[Element]:
+    """Normalizes whitespace in the text of `hi_res` elements and drops elements left empty."""
     out_elements = []
     for el in elements:
         if isinstance(el, PageBreak) and not include_page_breaks:
@@ -592,10 +897,17 @@ def _process_uncategorized_text_elements(elements: List[Element]):
     category `UncategorizedText` are replaced with corresponding
     elements created from their text content."""
 
+    uncategorized_elements = [
+        el
+        for el in elements
+        if hasattr(el, "category") and el.category == ElementType.UNCATEGORIZED_TEXT
+    ]
+    new_elements = iter(elements_from_texts([cast(Text, el).text for el in uncategorized_elements]))
+
     out_elements = []
     for el in elements:
         if hasattr(el, "category") and el.category == ElementType.UNCATEGORIZED_TEXT:
-            new_el = element_from_text(cast(Text, el).text)
+            new_el = next(new_elements)
             new_el.metadata = el.metadata
         else:
             new_el = el
@@ -700,7 +1012,9 @@ def _process_pdfminer_pages(
     for i, (page, page_layout) in enumerate(open_pdfminer_pages_generator(fp)):
         width, height = page_layout.width, page_layout.height
 
-        page_elements: List[Element] = []
+        page_texts: List[str] = []
+        page_points: List[Tuple[Tuple[float, float], ...]] = []
+        page_links: List[List[Link]] = []
         annotation_list = []
 
         coordinate_system = PixelSpace(
@@ -737,27 +1051,26 @@ def _process_pdfminer_pages(
                 _text, moved_indices = clean_extra_whitespace_with_index_run(_text)
                 if _text.strip():
                     points = ((x1, y1), (x1, y2), (x2, y2), (x2, y1))
-                    element = element_from_text(
-                        _text,
-                        coordinates=points,
-                        coordinate_system=coordinate_system,
-                    )
-                    coordinates_metadata = CoordinatesMetadata(
-                        points=points,
-                        system=coordinate_system,
-                    )
-                    links = _get_links_from_urls_metadata(urls_metadata, moved_indices)
-
-                    element.metadata = ElementMetadata(
-                        filename=filename,
-                        page_number=i + 1,
-                        coordinates=coordinates_metadata,
-                        last_modified=metadata_last_modified,
-                        links=links,
-                        languages=languages,
-                    )
-                    element.metadata.detection_origin = "pdfminer"
-                    page_elements.append(element)
+                    page_texts.append(_text)
+                    page_points.append(points)
+                    page_links.append(_get_links_from_urls_metadata(urls_metadata, moved_indices))
+
+        # -- the texts of the page are classified together, see `elements_from_texts()` --
+        page_elements = elements_from_texts(
+            page_texts,
+            coordinates=page_points,
+            coordinate_system=coordinate_system,
+        )
+        for element, points, links in zip(page_elements, page_points, page_links):
+            element.metadata = ElementMetadata(
+                filename=filename,
+                page_number=i + 1,
+                coordinates=CoordinatesMetadata(points=points, system=coordinate_system),
+                last_modified=metadata_last_modified,
+                links=links,
+                languages=languages,
+            )
+            element.metadata.detection_origin = "pdfminer"
 
         page_elements = _combine_list_elements(page_elements, coordinate_system)
 
@@ -892,38 +1205,40 @@ def _partition_pdf_or_image_with_ocr(
     languages: Optional[List[str]] = ["eng"],
     is_image: bool = False,
     metadata_last_modified: Optional[str] = None,
+    ocr_workers: Optional[int] = None,
     **kwargs,
 ):
     """Partitions an image or PDF using OCR. For PDFs, each page is converted
-    to an image prior to processing."""
+    to an image prior to processing. With `ocr_workers` greater than 1, pages are OCR'd in
+    parallel processes."""
+    from unstructured.partition.pdf_image.ocr import map_over_pages
 
-    elements = []
     if is_image:
-        images = []
-        image = PILImage.open(file) if file is not None else PILImage.open(filename)
-        images.append(image)
-
-        for i, image in enumerate(images):
-            page_elements = _partition_pdf_or_image_with_ocr_from_image(
-                image=image,
-                languages=languages,
-                page_number=i + 1,
-                include_page_breaks=include_page_breaks,
-                metadata_last_modified=metadata_last_modified,
-                **kwargs,
-            )
-            elements.extend(page_elements)
+        images: Iterable[PILImage.Image] = [
+            PILImage.open(file) if file is not None else PILImage.open(filename),
+        ]
     else:
-        for page_number, image in enumerate(convert_pdf_to_images(filename, file), start=1):
-            page_elements = _partition_pdf_or_image_with_ocr_from_image(
-                image=image,
-                languages=languages,
-                page_number=page_number,
-                include_page_breaks=include_page_breaks,
-                metadata_last_modified=metadata_last_modified,
-                **kwargs,
-            )
-            elements.extend(page_elements)
+        images = convert_pdf_to_images(filename, file)
+
+    pages_kwargs = (
+        {
+            "image": image,
+            "languages": languages,
+            "page_number": page_number,
+            "include_page_breaks": include_page_breaks,
+            "metadata_last_modified": metadata_last_modified,
+            **kwargs,
+        }
+        for page_number, image in enumerate(images, start=1)
+    )
+
+    elements = []
+    for page_elements in map_over_pages(
+        _partition_pdf_or_image_with_ocr_from_image,
+        pages_kwargs,
+        ocr_workers,
+    ):
+        elements.extend(page_elements)
 
     return elements
 
@@ -0,0 +1,95 @@
+"""Vectorized bounding-box queries for merging layout and OCR regions.
+
+`BBoxIndex` holds the coordinates of a set of regions in NumPy arrays sorted by `x1`, so a query
+only has to consider the slice of regions whose horizontal extent can overlap the query box
+(found by binary search) and evaluates that slice in a single vectorized pass. Results are exactly
+the ones the pairwise `Rectangle` methods of `unstructured_inference` produce.
+"""
+
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from unstructured_inference.inference.elements import Rectangle, TextRegion
+
+# NOTE: same value as `unstructured_inference.math.FLOAT_EPSILON`, used by `safe_division()`
+FLOAT_EPSILON = np.finfo(float).eps
+
+
+class BBoxIndex:
+    """Index over the bounding boxes of a fixed sequence of regions.
+
+    Query results are indices into that sequence, in ascending order.
+    """
+
+    def __init__(self, coords: np.ndarray):
+        """`coords` is an (n, 4) array of `x1, y1, x2, y2` rows."""
+        coords = np.asarray(coords, dtype=float).reshape(-1, 4)
+        self._order = np.argsort(coords[:, 0], kind="stable")
+        self._coords = coords[self._order]
+        self._x1 = self._coords[:, 0]
+        widths = self._coords[:, 2] - self._coords[:, 0]
+        heights = self._coords[:, 3] - self._coords[:, 1]
+        self._areas = widths * heights
+        # -- any box overlapping the query starts at most this far left of the query's x1 --
+        self._max_width = max(float(widths.max()), 0.0) if len(widths) else 0.0
+
+    @classmethod
+    def from_regions(cls, regions: Sequence["TextRegion"]) -> "BBoxIndex":
+        return cls(
+            np.array(
+                [[r.bbox.x1, r.bbox.y1, r.bbox.x2, r.bbox.y2] for r in regions],
+                dtype=float,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def almost_subregions_of(self, bbox: "Rectangle", subregion_threshold: float) -> np.ndarray:
+        """Indices of the indexed boxes for which `box.is_almost_subregion_of(bbox,
+        subregion_threshold)` is True."""
+        x1, y1, x2, y2 = (float(v) for v in (bbox.x1, bbox.y1, bbox.x2, bbox.y2))
+
+        if subregion_threshold >= 0:
+            # -- a non-negative threshold needs a positive intersection area, and so a horizontal
+            # -- overlap; only boxes starting in (x1 - max_width, x2) can have one. The lower bound
+            # -- is widened a little so float rounding of the widths can't exclude a candidate.
+            lower = x1 - self._max_width
+            lower -= 1e-9 * max(1.0, abs(lower), self._max_width)
+            start = np.searchsorted(self._x1, lower, side="left")
+            stop = np.searchsorted(self._x1, x2, side="left")
+        else:
+            start, stop = 0, len(self)
+
+        candidates = self._coords[start:stop]
+        inter_x1 = np.maximum(candidates[:, 0], x1)
+        inter_y1 = np.maximum(candidates[:, 1], y1)
+        inter_x2 = np.minimum(candidates[:, 2], x2)
+        inter_y2 = np.minimum(candidates[:, 3], y2)
+        intersects = (inter_x1 <= inter_x2) & (inter_y1 <= inter_y2)
+        intersection_areas = np.where(
+            intersects,
+            (inter_x2 - inter_x1) * (inter_y2 - inter_y1),
+            0.0,
+        )
+
+        areas = self._areas[start:stop]
+        is_subregion = (
+            subregion_threshold < intersection_areas / np.maximum(areas, FLOAT_EPSILON)
+        ) & (areas <= (x2 - x1) * (y2 - y1))
+
+        return np.sort(self._order[start:stop][is_subregion])
+
+    def any_almost_subregion_of(
+        self,
+        bboxes: Sequence["Rectangle"],
+        subregion_threshold: float,
+    ) -> np.ndarray:
+        """Boolean mask of the indexed boxes that are almost a subregion of at least one of
+        `bboxes`."""
+        mask = np.zeros(len(self), dtype=bool)
+        for bbox in bboxes:
+            mask[self.almost_subregions_of(bbox, subregion_threshold)] = True
+        return mask
@@ -1,17 +1,26 @@
-from typing import TYPE_CHECKING, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union, cast
 
 from unstructured_inference.constants import Source
 from unstructured_inference.inference.elements import TextRegion
+from unstructured_inference.inference.layout import DocumentLayout, PageLayout
 from unstructured_inference.inference.layoutelement import (
     LayoutElement,
     partition_groups_from_regions,
 )
+from unstructured_inference.models.base import get_model
+from unstructured_inference.models.unstructuredmodel import (
+    UnstructuredElementExtractionModel,
+    UnstructuredObjectDetectionModel,
+)
 
 from unstructured.documents.elements import ElementType
+from unstructured.partition.pdf_image.page_image_cache import PageImageStage
 
 if TYPE_CHECKING:
     from unstructured_inference.inference.elements import Rectangle
 
+    from unstructured.partition.pdf_image.page_image_cache import PageImageCache
+
 
 def build_text_region_from_coords(
     x1: Union[int, float],
@@ -112,3 +121,56 @@ def merge_text_regions(regions: List[TextRegion]) -> TextRegion:
     source = sources[0] if all(s == sources[0] for s in sources) else None
 
     return TextRegion.from_coords(min_x1, min_y1, max_x2, max_y2, merged_text, source)
+
+
+def process_page_images_with_model(
+    page_image_cache: "PageImageCache",
+    model_name: Optional[str],
+    **kwargs,
+) -> DocumentLayout:
+    """Processes the page images held by `page_image_cache` into a DocumentLayout by using a
+    model identified by model_name.
+
+    This mirrors `process_file_with_model` from unstructured-inference but reads each page from
+    the shared page image cache instead of rasterizing the document on its own.
+    """
+
+    return DocumentLayout.from_pages(
+        list(iter_page_layouts_with_model(page_image_cache, model_name, **kwargs)),
+    )
+
+
+def iter_page_layouts_with_model(
+    page_image_cache: "PageImageCache",
+    model_name: Optional[str],
+    **kwargs,
+) -> Iterator[PageLayout]:
+    """Generates the PageLayout of each page image held by `page_image_cache`, in page order, by
+    using a model identified by model_name. Pages are only inferred as the generator is consumed.
+    """
+
+    model = get_model(model_name, **kwargs)
+    if isinstance(model, UnstructuredObjectDetectionModel):
+        detection_model = model
+        element_extraction_model = None
+    elif isinstance(model, UnstructuredElementExtractionModel):
+        detection_model = None
+        element_extraction_model = model
+    else:
+        raise ValueError(f"Unsupported model type: {type(model)}")
+
+    is_image = page_image_cache.is_image
+    for page_number in range(1, page_image_cache.number_of_pages + 1):
+        image = page_image_cache.get_image(page_number)
+        # page numbering and image/document paths follow unstructured-inference,
+        # which numbers image frames from 0 and pdf pages from 1
+        page = PageLayout.from_image(
+            image,
+            image_path=page_image_cache.filename if is_image else None,
+            document_filename=None if is_image else page_image_cache.filename,
+            number=page_number - 1 if is_image else page_number,
+            detection_model=detection_model,
+            element_extraction_model=element_extraction_model,
+        )
+        page_image_cache.release(page_number, PageImageStage.LAYOUT)
+        yield page
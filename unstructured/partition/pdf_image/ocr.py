@@ -1,6 +1,22 @@
 import os
 import tempfile
-from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Union, cast
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pdf2image
 
@@ -11,6 +27,8 @@ from PIL import ImageSequence
 
 from unstructured.documents.elements import ElementType
 from unstructured.logger import logger
+from unstructured.partition.pdf_image.bbox_index import BBoxIndex
+from unstructured.partition.pdf_image.page_image_cache import PageImageStage
 from unstructured.partition.pdf_image.pdf_image_utils import pad_element_bboxes, valid_text
 from unstructured.partition.utils.config import env_config
 from unstructured.partition.utils.constants import (
@@ -32,6 +50,10 @@ if TYPE_CHECKING:
     from unstructured_inference.inference.layoutelement import LayoutElement
     from unstructured_inference.models.tables import UnstructuredTableTransformerModel
 
+    from unstructured.partition.pdf_image.page_image_cache import PageImageCache
+
+
+_T = TypeVar("_T")
 
 # Force tesseract to be single threaded,
 # otherwise we see major performance problems
@@ -48,6 +70,8 @@ def process_data_with_ocr(
     ocr_languages: str = "eng",
     ocr_mode: str = OCRMode.FULL_PAGE.value,
     pdf_image_dpi: int = 200,
+    page_image_cache: Optional["PageImageCache"] = None,
+    ocr_workers: Optional[int] = None,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given data and supplement the output DocumentLayout
@@ -73,9 +97,31 @@ def process_data_with_ocr(
 
     - pdf_image_dpi (int, optional): DPI (dots per inch) for processing PDF images. Defaults to 200.
 
+    - page_image_cache (PageImageCache, optional): A cache of the document page images shared with
+        the other hi_res stages. When provided, page images are read from the cache instead of
+        rasterizing the document again and `pdf_image_dpi` is ignored.
+
+    - ocr_workers (int, optional): The number of processes to OCR pages in parallel with. Defaults
+        to the `OCR_WORKERS` environment variable, or 1 (serial) when it is not set. The output is
+        the same whatever the number of workers.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
+    if page_image_cache is not None:
+        return process_file_with_ocr(
+            filename=page_image_cache.filename,
+            out_layout=out_layout,
+            extracted_layout=extracted_layout,
+            is_image=is_image,
+            infer_table_structure=infer_table_structure,
+            ocr_languages=ocr_languages,
+            ocr_mode=ocr_mode,
+            pdf_image_dpi=pdf_image_dpi,
+            page_image_cache=page_image_cache,
+            ocr_workers=ocr_workers,
+        )
+
     with tempfile.NamedTemporaryFile() as tmp_file:
         tmp_file.write(data.read() if hasattr(data, "read") else data)
         tmp_file.flush()
@@ -88,6 +134,7 @@ def process_data_with_ocr(
             ocr_languages=ocr_languages,
             ocr_mode=ocr_mode,
             pdf_image_dpi=pdf_image_dpi,
+            ocr_workers=ocr_workers,
         )
         return merged_layouts
 
@@ -102,6 +149,8 @@ def process_file_with_ocr(
     ocr_languages: str = "eng",
     ocr_mode: str = OCRMode.FULL_PAGE.value,
     pdf_image_dpi: int = 200,
+    page_image_cache: Optional["PageImageCache"] = None,
+    ocr_workers: Optional[int] = None,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given file and supplement the output DocumentLayout
@@ -126,31 +175,31 @@ def process_file_with_ocr(
 
     - pdf_image_dpi (int, optional): DPI (dots per inch) for processing PDF images. Defaults to 200.
 
+    - page_image_cache (PageImageCache, optional): A cache of the document page images shared with
+        the other hi_res stages. When provided, page images are read from the cache instead of
+        rasterizing the document again and `pdf_image_dpi` is ignored.
+
+    - ocr_workers (int, optional): The number of processes to OCR pages in parallel with. Defaults
+        to the `OCR_WORKERS` environment variable, or 1 (serial) when it is not set. The output is
+        the same whatever the number of workers.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
 
     from unstructured_inference.inference.layout import DocumentLayout
 
-    merged_page_layouts = []
-    try:
-        if is_image:
+    def iter_page_images() -> Iterator[PILImage.Image]:
+        if page_image_cache is not None:
+            for i in range(page_image_cache.number_of_pages):
+                yield page_image_cache.get_image(i + 1)
+        elif is_image:
             with PILImage.open(filename) as images:
                 image_format = images.format
-                for i, image in enumerate(ImageSequence.Iterator(images)):
+                for image in ImageSequence.Iterator(images):
                     image = image.convert("RGB")
                     image.format = image_format
-                    extracted_regions = extracted_layout[i] if i < len(extracted_layout) else None
-                    merged_page_layout = supplement_page_layout_with_ocr(
-                        page_layout=out_layout.pages[i],
-                        image=image,
-                        infer_table_structure=infer_table_structure,
-                        ocr_languages=ocr_languages,
-                        ocr_mode=ocr_mode,
-                        extracted_regions=extracted_regions,
-                    )
-                    merged_page_layouts.append(merged_page_layout)
-                return DocumentLayout.from_pages(merged_page_layouts)
+                    yield image
         else:
             with tempfile.TemporaryDirectory() as temp_dir:
                 _image_paths = pdf2image.convert_from_path(
@@ -160,19 +209,33 @@ def process_file_with_ocr(
                     paths_only=True,
                 )
                 image_paths = cast(List[str], _image_paths)
-                for i, image_path in enumerate(image_paths):
-                    extracted_regions = extracted_layout[i] if i < len(extracted_layout) else None
+                for image_path in image_paths:
                     with PILImage.open(image_path) as image:
-                        merged_page_layout = supplement_page_layout_with_ocr(
-                            page_layout=out_layout.pages[i],
-                            image=image,
-                            infer_table_structure=infer_table_structure,
-                            ocr_languages=ocr_languages,
-                            ocr_mode=ocr_mode,
-                            extracted_regions=extracted_regions,
-                        )
-                        merged_page_layouts.append(merged_page_layout)
-                return DocumentLayout.from_pages(merged_page_layouts)
+                        image.load()
+                        yield image
+
+    def iter_pages_kwargs() -> Iterator[Dict[str, Any]]:
+        for i, image in enumerate(iter_page_images()):
+            yield {
+                "elements": out_layout.pages[i].elements,
+                "image": image,
+                "infer_table_structure": infer_table_structure,
+                "ocr_languages": ocr_languages,
+                "ocr_mode": ocr_mode,
+                "extracted_regions": extracted_layout[i] if i < len(extracted_layout) else None,
+            }
+
+    merged_page_layouts = []
+    try:
+        for i, elements in enumerate(
+            map_over_pages(_supplement_page_elements_with_ocr, iter_pages_kwargs(), ocr_workers)
+        ):
+            page_layout = out_layout.pages[i]
+            page_layout.elements[:] = elements
+            merged_page_layouts.append(page_layout)
+            if page_image_cache is not None:
+                page_image_cache.release(i + 1, PageImageStage.OCR)
+        return DocumentLayout.from_pages(merged_page_layouts)
     except Exception as e:
         if os.path.isdir(filename) or os.path.isfile(filename):
             raise e
@@ -253,6 +316,77 @@ def supplement_page_layout_with_ocr(
     return page_layout
 
 
+def _supplement_page_elements_with_ocr(
+    elements: List["LayoutElement"],
+    image: PILImage.Image,
+    **kwargs: Any,
+) -> List["LayoutElement"]:
+    """Supplements the layout elements of a single page with OCR; the unit of work
+    `process_file_with_ocr` hands to `map_over_pages`, so it must be picklable."""
+    from unstructured_inference.inference.layout import PageLayout
+
+    page_layout = PageLayout(number=0, image=image)
+    page_layout.elements = elements
+    return supplement_page_layout_with_ocr(page_layout=page_layout, image=image, **kwargs).elements
+
+
+class OCRWorkerError(RuntimeError):
+    """Raised in place of an error raised by `map_over_pages` in a worker process."""
+
+
+def _call_with_image_formats(
+    func: Callable[..., _T],
+    image_formats: Dict[str, str],
+    kwargs: Dict[str, Any],
+) -> _T:
+    for key, image_format in image_formats.items():
+        kwargs[key].format = image_format
+    try:
+        return func(**kwargs)
+    except Exception as e:
+        # -- not every exception can be unpickled in the parent (e.g. `TesseractNotFoundError`),
+        # -- which would break the whole pool, so send back one that can with the same message
+        raise OCRWorkerError(f"{type(e).__name__}: {e}") from None
+
+
+def map_over_pages(
+    func: Callable[..., _T],
+    pages_kwargs: Iterable[Dict[str, Any]],
+    ocr_workers: Optional[int] = None,
+) -> Iterator[_T]:
+    """Generates `func(**page_kwargs)` for each page, in page order.
+
+    With `ocr_workers` greater than 1 (defaults to the `OCR_WORKERS` environment variable) pages
+    are fanned out to a pool of that many processes and the results are reassembled in page order,
+    so the output is the same as running the pages serially. `func` and its arguments must be
+    picklable. At most two pages per worker are in flight at a time to keep memory bounded. An
+    error raised in a worker is re-raised as an `OCRWorkerError` carrying its type and message.
+    """
+    ocr_workers = ocr_workers or env_config.OCR_WORKERS
+    if ocr_workers <= 1:
+        for page_kwargs in pages_kwargs:
+            yield func(**page_kwargs)
+        return
+
+    with ProcessPoolExecutor(max_workers=ocr_workers) as executor:
+        in_flight: Deque[Future[_T]] = deque()
+        for page_kwargs in pages_kwargs:
+            if len(in_flight) >= 2 * ocr_workers:
+                yield in_flight.popleft().result()
+            # NOTE: PIL drops `Image.format` when pickling and the OCR agents encode the image
+            # for the OCR engine according to it, so restore it in the worker
+            image_formats = {
+                key: value.format
+                for key, value in page_kwargs.items()
+                if isinstance(value, PILImage.Image) and value.format
+            }
+            in_flight.append(
+                executor.submit(_call_with_image_formats, func, image_formats, page_kwargs),
+            )
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
 def supplement_element_with_table_extraction(
     elements: List["LayoutElement"],
     image: PILImage,
@@ -345,15 +479,17 @@ def merge_out_layout_with_ocr_layout(
 
     out_regions_without_text = [region for region in out_layout if not valid_text(region.text)]
 
+    ocr_index = BBoxIndex.from_regions(ocr_layout)
     for out_region in out_regions_without_text:
         out_region.text = aggregate_ocr_text_by_block(
             ocr_layout,
             out_region,
             SUBREGION_THRESHOLD_FOR_OCR,
+            ocr_index=ocr_index,
         )
 
     final_layout = (
-        supplement_layout_with_ocr_elements(out_layout, ocr_layout)
+        supplement_layout_with_ocr_elements(out_layout, ocr_layout, ocr_index=ocr_index)
         if supplement_with_ocr_elements
         else out_layout
     )
@@ -365,19 +501,20 @@ def aggregate_ocr_text_by_block(
     ocr_layout: List["TextRegion"],
     region: "TextRegion",
     subregion_threshold: float,
+    ocr_index: Optional[BBoxIndex] = None,
 ) -> Optional[str]:
     """Extracts the text aggregated from the regions of the ocr layout that lie within the given
-    block."""
+    block. `ocr_index` is a `BBoxIndex` of `ocr_layout`; pass it when aggregating text for several
+    blocks to only build it once."""
 
-    extracted_texts = []
+    if ocr_index is None:
+        ocr_index = BBoxIndex.from_regions(ocr_layout)
 
-    for ocr_region in ocr_layout:
-        ocr_region_is_subregion_of_given_region = ocr_region.bbox.is_almost_subregion_of(
-            region.bbox,
-            subregion_threshold=subregion_threshold,
-        )
-        if ocr_region_is_subregion_of_given_region and ocr_region.text:
-            extracted_texts.append(ocr_region.text)
+    extracted_texts = []
+    for i in ocr_index.almost_subregions_of(region.bbox, subregion_threshold):
+        ocr_region_text = ocr_layout[i].text
+        if ocr_region_text:
+            extracted_texts.append(ocr_region_text)
 
     return " ".join(extracted_texts) if extracted_texts else ""
 
@@ -386,6 +523,7 @@ def aggregate_ocr_text_by_block(
 def supplement_layout_with_ocr_elements(
     layout: List["LayoutElement"],
     ocr_layout: List["TextRegion"],
+    ocr_index: Optional[BBoxIndex] = None,
 ) -> List["LayoutElement"]:
     """
     Supplement the existing layout with additional OCR-derived elements.
@@ -400,14 +538,16 @@ def supplement_layout_with_ocr_elements(
                                     an instance of `LayoutElement`.
     - ocr_layout (List[TextRegion]): A list of OCR-derived text regions, each of which is
                                      an instance of `TextRegion`.
+    - ocr_index (BBoxIndex, optional): A `BBoxIndex` of `ocr_layout`, built when not provided.
 
     Returns:
     - List[LayoutElement]: The final combined layout consisting of both the original layout
                            elements and the new OCR-derived elements.
 
     Note:
-    - The function relies on `is_almost_subregion_of()` method to determine if an OCR region
-      is a subregion of an existing layout element.
+    - The function relies on `BBoxIndex`, which gives the same results as the
+      `is_almost_subregion_of()` method, to determine if an OCR region is a subregion of an
+      existing layout element without comparing every pair of regions.
     - It also relies on `build_layout_elements_from_ocr_regions()` to convert OCR regions to
      layout elements.
     - The `SUBREGION_THRESHOLD_FOR_OCR` constant is used to specify the subregion matching
@@ -418,18 +558,18 @@ def supplement_layout_with_ocr_elements(
         build_layout_elements_from_ocr_regions,
     )
 
-    ocr_regions_to_remove = []
-    for ocr_region in ocr_layout:
-        for el in layout:
-            ocr_region_is_subregion_of_out_el = ocr_region.bbox.is_almost_subregion_of(
-                el.bbox,
-                SUBREGION_THRESHOLD_FOR_OCR,
-            )
-            if ocr_region_is_subregion_of_out_el:
-                ocr_regions_to_remove.append(ocr_region)
-                break
+    if ocr_index is None:
+        ocr_index = BBoxIndex.from_regions(ocr_layout)
 
-    ocr_regions_to_add = [region for region in ocr_layout if region not in ocr_regions_to_remove]
+    is_subregion_of_layout_el = ocr_index.any_almost_subregion_of(
+        [el.bbox for el in layout],
+        SUBREGION_THRESHOLD_FOR_OCR,
+    )
+    ocr_regions_to_add = [
+        region
+        for region, is_subregion in zip(ocr_layout, is_subregion_of_layout_el)
+        if not is_subregion
+    ]
     if ocr_regions_to_add:
         ocr_elements_to_add = build_layout_elements_from_ocr_regions(ocr_regions_to_add)
         final_layout = layout + ocr_elements_to_add
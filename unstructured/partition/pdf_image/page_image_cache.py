@@ -0,0 +1,148 @@
+import os
+import tempfile
+from collections import defaultdict
+from typing import BinaryIO, Dict, Iterable, Optional, Set, Union, cast
+
+import pdf2image
+from PIL import Image as PILImage
+
+from unstructured.logger import logger
+
+
+class PageImageStage:
+    """Names of the hi_res pipeline stages that read page images from a `PageImageCache`."""
+
+    LAYOUT = "layout"
+    OCR = "ocr"
+    ANNOTATION = "annotation"
+    IMAGE_BLOCK_EXTRACTION = "image_block_extraction"
+
+
+class PageImageCache:
+    """Per-document cache of page images shared by the stages of the hi_res pipeline.
+
+    Each page of a PDF is rasterized lazily, at most once, at `dpi` the first time any stage asks
+    for it. The raster is written to a temporary directory owned by the cache rather than held in
+    memory. Frames of an image document are read directly from the source file.
+
+    A page raster is evicted as soon as every stage listed in `stages` has released it, so a
+    document never has more than the pages currently in flight on disk. When `stages` is empty
+    pages are only evicted when the cache is closed.
+    """
+
+    def __init__(
+        self,
+        filename: str = "",
+        file: Optional[Union[bytes, BinaryIO]] = None,
+        is_image: bool = False,
+        dpi: int = 200,
+        stages: Iterable[str] = (),
+    ):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        if file is not None:
+            if hasattr(file, "seek"):
+                file.seek(0)
+            filename = os.path.join(self._temp_dir.name, "document")
+            with open(filename, "wb") as f:
+                f.write(cast(BinaryIO, file).read() if hasattr(file, "read") else cast(bytes, file))
+            if hasattr(file, "seek"):
+                cast(BinaryIO, file).seek(0)
+
+        self.filename = filename
+        self.is_image = is_image
+        self.dpi = dpi
+        self.stages: Set[str] = set(stages)
+        self._number_of_pages: Optional[int] = None
+        self._image_paths: Dict[int, str] = {}
+        self._released: Dict[int, Set[str]] = defaultdict(set)
+        self._finished_stages: Set[str] = set()
+
+    def __enter__(self) -> "PageImageCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Removes every page raster still held by the cache."""
+        self._image_paths.clear()
+        self._released.clear()
+        self._finished_stages.clear()
+        self._temp_dir.cleanup()
+
+    @property
+    def number_of_pages(self) -> int:
+        """The number of pages (or image frames) in the document."""
+        if self._number_of_pages is None:
+            try:
+                if self.is_image:
+                    with PILImage.open(self.filename) as image:
+                        self._number_of_pages = getattr(image, "n_frames", 1)
+                else:
+                    self._number_of_pages = int(pdf2image.pdfinfo_from_path(self.filename)["Pages"])
+            except Exception as e:
+                if os.path.isdir(self.filename) or os.path.isfile(self.filename):
+                    raise e
+                else:
+                    raise FileNotFoundError(f'File "{self.filename}" not found!') from e
+        return self._number_of_pages
+
+    @property
+    def cached_page_numbers(self) -> Set[int]:
+        """Page numbers of the rasters currently held on disk."""
+        return set(self._image_paths)
+
+    def get_image_path(self, page_number: int) -> str:
+        """Returns the path of the raster of the 1-indexed `page_number`, rendering it first if
+        needed. For image documents this is the path of the source file."""
+        if self.is_image:
+            return self.filename
+
+        if page_number not in self._image_paths:
+            if self._released.get(page_number):
+                logger.debug(f"Page {page_number} was requested after eviction, rendering again")
+            _image_paths = pdf2image.convert_from_path(
+                self.filename,
+                dpi=self.dpi,
+                first_page=page_number,
+                last_page=page_number,
+                output_folder=self._temp_dir.name,
+                paths_only=True,
+            )
+            self._image_paths[page_number] = cast(str, _image_paths[0])
+        return self._image_paths[page_number]
+
+    def get_image(self, page_number: int) -> PILImage.Image:
+        """Returns the fully loaded image of the 1-indexed `page_number`."""
+        image_path = self.get_image_path(page_number)
+        with PILImage.open(image_path) as image:
+            if not self.is_image:
+                image.load()
+                return image
+            image.seek(page_number - 1)
+            image_format = image.format
+            frame = image.convert("RGB")
+            frame.format = image_format
+            return frame
+
+    def release(self, page_number: int, stage: str) -> None:
+        """Marks `stage` as done with `page_number`, evicting the page raster once every
+        registered stage has released it."""
+        self._released[page_number].add(stage)
+        self._evict_if_released(page_number)
+
+    def release_all(self, stage: str) -> None:
+        """Marks `stage` as done with every page of the document, including pages it never
+        requested."""
+        self._finished_stages.add(stage)
+        for page_number in list(self._image_paths):
+            self._evict_if_released(page_number)
+
+    def _evict_if_released(self, page_number: int) -> None:
+        released = self._released[page_number] | self._finished_stages
+        if not self.stages or not self.stages.issubset(released):
+            return
+
+        image_path = self._image_paths.pop(page_number, None)
+        if image_path is not None and os.path.isfile(image_path):
+            os.remove(image_path)
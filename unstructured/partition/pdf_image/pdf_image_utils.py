@@ -14,6 +14,7 @@ from PIL import Image
 from unstructured.documents.elements import ElementType
 from unstructured.logger import logger
 from unstructured.partition.common import convert_to_bytes
+from unstructured.partition.pdf_image.page_image_cache import PageImageStage
 from unstructured.partition.utils.config import env_config
 
 if TYPE_CHECKING:
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
     from unstructured_inference.inference.layoutelement import LayoutElement
 
     from unstructured.documents.elements import Element
+    from unstructured.partition.pdf_image.page_image_cache import PageImageCache
 
 
 def write_image(image: Union[Image.Image, np.ndarray], output_image_path: str):
@@ -119,7 +121,9 @@ def save_elements(
     is_image: bool = False,
     extract_image_block_to_payload: bool = False,
     output_dir_path: Optional[str] = None,
-):
+    page_image_cache: Optional["PageImageCache"] = None,
+    figure_number_offset: int = 0,
+) -> int:
     """
     Saves specific elements from a PDF as images either to a directory or embeds them in the
     element's payload.
@@ -127,6 +131,12 @@ def save_elements(
     This function processes a list of elements partitioned from a PDF file. For each element of
     a specified category, it extracts and saves the image. The images can either be saved to
     a specified directory or embedded into the element's payload as a base64-encoded string.
+    When `page_image_cache` is provided, the page images are read from it instead of rendering
+    the document again.
+
+    Figures are numbered from `figure_number_offset + 1`, so a document saved in batches of
+    elements (e.g. page by page) gets the same file names as one saved all at once. Returns the
+    number of the last figure.
     """
 
     if not output_dir_path:
@@ -134,7 +144,8 @@ def save_elements(
     os.makedirs(output_dir_path, exist_ok=True)
 
     with tempfile.TemporaryDirectory() as temp_dir:
-        if is_image:
+        image_paths: List[str] = []
+        if page_image_cache is None and is_image:
             if file is None:
                 image_paths = [filename]
             else:
@@ -144,7 +155,7 @@ def save_elements(
                 temp_file.write(file.read() if hasattr(file, "read") else file)
                 temp_file.flush()
                 image_paths = [temp_file.name]
-        else:
+        elif page_image_cache is None:
             _image_paths = convert_pdf_to_image(
                 filename,
                 file,
@@ -154,7 +165,7 @@ def save_elements(
             )
             image_paths = cast(List[str], _image_paths)
 
-        figure_number = 0
+        figure_number = figure_number_offset
         for el in elements:
             if el.category != element_category_to_save:
                 continue
@@ -180,8 +191,11 @@ def save_elements(
                     output_dir_path,
                     f"{basename}-{page_number}-{figure_number}.jpg",
                 )
-                image_path = image_paths[page_number - 1]
-                image = Image.open(image_path)
+                if page_image_cache is not None:
+                    image = page_image_cache.get_image(page_number)
+                else:
+                    image_path = image_paths[page_number - 1]
+                    image = Image.open(image_path)
                 cropped_image = image.crop(padded_bbox)
                 if extract_image_block_to_payload:
                     buffered = BytesIO()
@@ -197,6 +211,8 @@ def save_elements(
             except (ValueError, IOError):
                 logger.warning("Image Extraction Error: Skipping the failed image", exc_info=True)
 
+    return figure_number
+
 
 def check_element_types_to_extract(
     extract_image_block_types: Optional[List[str]],
@@ -269,6 +285,7 @@ def annotate_layout_elements(
     output_dir_path: str,
     pdf_image_dpi: int,
     is_image: bool = False,
+    page_image_cache: Optional["PageImageCache"] = None,
 ) -> None:
     """
     Annotates layout elements on images extracted from a PDF or an image file.
@@ -276,7 +293,8 @@ def annotate_layout_elements(
     This function processes a given document (PDF or image) and annotates layout elements based
     on the inferred and extracted layout information.
     It handles both PDF documents and standalone image files. For PDFs, it converts each page
-    into an image, whereas for image files, it processes the single image.
+    into an image, whereas for image files, it processes the single image. When
+    `page_image_cache` is provided, the PDF page images are read from it instead.
     """
 
     from unstructured_inference.inference.layout import PageLayout
@@ -307,6 +325,30 @@ def annotate_layout_elements(
                     output_f_basename=output_f_basename,
                     page_number=1,
                 )
+        elif page_image_cache is not None:
+            for i in range(page_image_cache.number_of_pages):
+                page_number = i + 1
+                img = page_image_cache.get_image(page_number)
+
+                extracted_page_layout = None
+                if extracted_layout:
+                    extracted_page_layout = PageLayout(
+                        number=page_number,
+                        image=img,
+                    )
+                    extracted_page_layout.elements = extracted_layout[i]
+
+                inferred_page_layout = inferred_document_layout.pages[i]
+                inferred_page_layout.image = img
+
+                annotate_layout_elements_with_image(
+                    inferred_page_layout=inferred_document_layout.pages[i],
+                    extracted_page_layout=extracted_page_layout,
+                    output_dir_path=output_dir_path,
+                    output_f_basename=output_f_basename,
+                    page_number=page_number,
+                )
+                page_image_cache.release(page_number, PageImageStage.ANNOTATION)
         else:
             with tempfile.TemporaryDirectory() as temp_dir:
                 _image_paths = pdf2image.convert_from_path(
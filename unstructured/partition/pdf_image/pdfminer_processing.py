@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, BinaryIO, List, Optional, Union, cast
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, Optional, Union, cast
 
 from pdfminer.utils import open_filename
 
@@ -37,13 +37,23 @@ def process_data_with_pdfminer(
     """Loads the image and word objects from a pdf using pdfplumber and the image renderings of the
     pdf pages using pdf2image"""
 
+    return list(iter_page_layouts_with_pdfminer(file=file, dpi=dpi))
+
+
+@requires_dependencies("unstructured_inference")
+def iter_page_layouts_with_pdfminer(
+    file: Optional[Union[bytes, BinaryIO]] = None,
+    dpi: int = 200,
+) -> Iterator[List["TextRegion"]]:
+    """Generates the image and word objects of a pdf one page at a time, so only the page being
+    processed is held in memory. `file` must stay open until the generator is exhausted."""
+
     from unstructured_inference.inference.elements import (
         EmbeddedTextRegion,
         ImageTextRegion,
     )
     from unstructured_inference.inference.ordering import order_layout
 
-    layouts = []
     # Coefficient to rescale bounding box to be compatible with images
     coef = dpi / 72
     for page, page_layout in open_pdfminer_pages_generator(file):
@@ -83,9 +93,7 @@ def process_data_with_pdfminer(
         # apply the current default sorting to the layout elements extracted by pdfminer
         layout = sort_text_regions(layout)
 
-        layouts.append(layout)
-
-    return layouts
+        yield layout
 
 
 @requires_dependencies("unstructured_inference")
@@ -1,7 +1,10 @@
 import copy
+import os
 import re
 import textwrap
-from typing import IO, Any, Callable, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 
 from unstructured.chunking import add_chunking_strategy
 from unstructured.cleaners.core import (
@@ -33,14 +36,35 @@ from unstructured.partition.common import (
 )
 from unstructured.partition.lang import apply_lang_metadata
 from unstructured.partition.text_type import (
+    batch_text_features,
     is_bulleted_text,
     is_email_address,
     is_possible_narrative_text,
     is_possible_numbered_list,
     is_possible_title,
     is_us_city_state_zip,
+    narrative_text_needs_verb,
+    tag_verbs,
 )
 
+# -- environment variables changing the outcome of the checks of `text_type`, part of the keys of
+# -- the element class cache so a change in them is never hidden by the cache --
+CLASSIFICATION_ENV_VARS = (
+    "UNSTRUCTURED_LANGUAGE_CHECKS",
+    "UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD",
+    "UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD",
+    "UNSTRUCTURED_TITLE_MAX_WORD_LENGTH",
+    "UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD",
+)
+# NOTE: the number of texts whose element class is kept, documents often repeat the same texts
+# (headers, footers, boilerplate) and the classification of a text is expensive
+ELEMENT_CLASS_CACHE_MAX_SIZE = 1024
+
+_element_class_cache: "OrderedDict[Tuple[str, Tuple[Optional[str], ...]], Type[Text]]" = (
+    OrderedDict()
+)
+_element_class_cache_lock = threading.Lock()
+
 
 def partition_text(
     filename: Optional[str] = None,
@@ -192,13 +216,16 @@ def _partition_text(
     else:
         metadata = ElementMetadata()
 
+    ctexts: List[str] = []
     for ctext in file_content:
         ctext = ctext.strip()
 
         if ctext and not is_empty_bullet(ctext):
-            element = element_from_text(ctext)
-            element.metadata = copy.deepcopy(metadata)
-            elements.append(element)
+            ctexts.append(ctext)
+
+    for element in elements_from_texts(ctexts):
+        element.metadata = copy.deepcopy(metadata)
+        elements.append(element)
 
     elements = list(
         apply_lang_metadata(
@@ -251,62 +278,130 @@ def is_in_footer_position(
     return height_percentage > threshold
 
 
-def element_from_text(
-    text: str,
-    coordinates: Optional[Tuple[Tuple[float, float], ...]] = None,
-    coordinate_system: Optional[CoordinateSystem] = None,
-) -> Element:
-    if is_in_header_position(coordinates, coordinate_system):
-        return Header(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    elif is_in_footer_position(coordinates, coordinate_system):
-        return Footer(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    elif is_bulleted_text(text):
-        clean_text = clean_bullets(text)
-        return ListItem(
-            text=clean_text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
+def _element_class_from_patterns(text: str) -> Optional[Type[Text]]:
+    """Element class of `text` when it's determined by the pattern checks, which don't need NLP."""
+    if is_bulleted_text(text):
+        return ListItem
     elif is_email_address(text):
-        return EmailAddress(text=text)
+        return EmailAddress
     elif is_us_city_state_zip(text):
-        return Address(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
+        return Address
     elif is_possible_numbered_list(text):
-        return ListItem(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    elif is_possible_narrative_text(text):
-        return NarrativeText(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
-        )
-    elif is_possible_title(text):
-        return Title(
-            text=text,
-            coordinates=coordinates,
-            coordinate_system=coordinate_system,
+        return ListItem
+    return None
+
+
+def clear_element_class_cache() -> None:
+    """Forgets the element classes cached by `element_classes_from_texts()`, needed when the
+    classification checks themselves change, e.g. when they are patched."""
+    with _element_class_cache_lock:
+        _element_class_cache.clear()
+
+
+def element_classes_from_texts(texts: Sequence[str]) -> List[Type[Text]]:
+    """Element class of each of `texts`, as `element_from_text()` would create without position.
+
+    The texts are classified together: each distinct text is classified once, the NLP features
+    (sentences, tokens) of a text are shared by all the checks and the POS tagging needed by the
+    narrative text check is done in a single pass over all the texts. The classes of the most
+    recently classified texts are cached, see `clear_element_class_cache()`.
+    """
+    env = tuple(os.environ.get(name) for name in CLASSIFICATION_ENV_VARS)
+    classes: Dict[str, Type[Text]] = {}
+    with _element_class_cache_lock:
+        for text in texts:
+            key = (text, env)
+            if key in _element_class_cache:
+                _element_class_cache.move_to_end(key)
+                classes[text] = _element_class_cache[key]
+
+    unclassified_texts = [text for text in dict.fromkeys(texts) if text not in classes]
+    if not unclassified_texts:
+        return [classes[text] for text in texts]
+
+    with batch_text_features():
+        pattern_classes = {text: _element_class_from_patterns(text) for text in unclassified_texts}
+        tag_verbs(
+            [
+                text
+                for text, element_class in pattern_classes.items()
+                if element_class is None and narrative_text_needs_verb(text)
+            ],
         )
-    else:
-        return Text(
+        for text, element_class in pattern_classes.items():
+            if element_class is None:
+                if is_possible_narrative_text(text):
+                    element_class = NarrativeText
+                elif is_possible_title(text):
+                    element_class = Title
+                else:
+                    element_class = Text
+            classes[text] = element_class
+
+    with _element_class_cache_lock:
+        for text in unclassified_texts:
+            _element_class_cache[(text, env)] = classes[text]
+            _element_class_cache.move_to_end((text, env))
+        while len(_element_class_cache) > ELEMENT_CLASS_CACHE_MAX_SIZE:
+            _element_class_cache.popitem(last=False)
+
+    return [classes[text] for text in texts]
+
+
+def elements_from_texts(
+    texts: Sequence[str],
+    coordinates: Optional[Sequence[Optional[Tuple[Tuple[float, float], ...]]]] = None,
+    coordinate_system: Optional[CoordinateSystem] = None,
+) -> List[Element]:
+    """Same as calling `element_from_text()` on each of `texts` (with the matching `coordinates`)
+    but with the texts classified together, see `element_classes_from_texts()`."""
+    if coordinates is None:
+        coordinates = [None] * len(texts)
+
+    elements: List[Element] = []
+    texts_to_classify: List[str] = []
+    for text, text_coordinates in zip(texts, coordinates):
+        if is_in_header_position(text_coordinates, coordinate_system):
+            elements.append(
+                Header(
+                    text=text, coordinates=text_coordinates, coordinate_system=coordinate_system
+                ),
+            )
+        elif is_in_footer_position(text_coordinates, coordinate_system):
+            elements.append(
+                Footer(
+                    text=text, coordinates=text_coordinates, coordinate_system=coordinate_system
+                ),
+            )
+        else:
+            # -- placeholder replaced once the texts are classified --
+            elements.append(None)  # type: ignore
+            texts_to_classify.append(text)
+
+    element_classes = iter(element_classes_from_texts(texts_to_classify))
+    for i, (text, text_coordinates) in enumerate(zip(texts, coordinates)):
+        if elements[i] is not None:
+            continue
+        element_class = next(element_classes)
+        if element_class is EmailAddress:
+            elements[i] = EmailAddress(text=text)
+            continue
+        if element_class is ListItem and is_bulleted_text(text):
+            text = clean_bullets(text)
+        elements[i] = element_class(
             text=text,
-            coordinates=coordinates,
+            coordinates=text_coordinates,
             coordinate_system=coordinate_system,
         )
+    return elements
+
+
+def element_from_text(
+    text: str,
+    coordinates: Optional[Tuple[Tuple[float, float], ...]] = None,
+    coordinate_system: Optional[CoordinateSystem] = None,
+) -> Element:
+    return elements_from_texts([text], [coordinates], coordinate_system)[0]
 
 
 def _combine_paragraphs_less_than_min(
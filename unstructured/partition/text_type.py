@@ -3,7 +3,9 @@
 import os
 import re
 import sys
-from typing import List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 if sys.version_info < (3, 8):
     from typing_extensions import Final  # pragma: nocover
@@ -21,13 +23,90 @@ from unstructured.nlp.patterns import (
     US_CITY_STATE_ZIP_RE,
     US_PHONE_NUMBERS_RE,
 )
-from unstructured.nlp.tokenize import pos_tag, sent_tokenize, word_tokenize
+from unstructured.nlp.tokenize import pos_tag, pos_tag_sentences, sent_tokenize, word_tokenize
 
 POS_VERB_TAGS: Final[List[str]] = ["VB", "VBG", "VBD", "VBN", "VBP", "VBZ"]
 ENGLISH_WORD_SPLIT_RE = re.compile(r"[\s\-,.!?_\/]+")
 NON_LOWERCASE_ALPHA_RE = re.compile(r"[^a-z]")
 
 
+class _TextFeatures:
+    """NLP features of a text used by the checks below, each computed at most once."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._sentence_words: Optional[List[Tuple[str, int]]] = None
+        self._alpha_tokens: Optional[List[str]] = None
+        self.contains_verb: Optional[bool] = None
+
+    @property
+    def sentence_words(self) -> List[Tuple[str, int]]:
+        """Each sentence without punctuation and its number of word tokens."""
+        if self._sentence_words is None:
+            self._sentence_words = []
+            for sentence in sent_tokenize(self.text):
+                sentence = remove_punctuation(sentence)
+                words = [word for word in word_tokenize(sentence) if word != "."]
+                self._sentence_words.append((sentence, len(words)))
+        return self._sentence_words
+
+    @property
+    def alpha_tokens(self) -> List[str]:
+        if self._alpha_tokens is None:
+            self._alpha_tokens = [tk for tk in word_tokenize(self.text) if tk.isalpha()]
+        return self._alpha_tokens
+
+
+# -- features of the texts of the current batch, see `batch_text_features()` --
+_batch_features: ContextVar[Optional[Dict[str, _TextFeatures]]] = ContextVar(
+    "_batch_features",
+    default=None,
+)
+
+
+def _get_text_features(text: str) -> _TextFeatures:
+    batch_features = _batch_features.get()
+    if batch_features is None:
+        return _TextFeatures(text)
+    if text not in batch_features:
+        batch_features[text] = _TextFeatures(text)
+    return batch_features[text]
+
+
+@contextmanager
+def batch_text_features() -> Iterator[None]:
+    """Shares the NLP features (sentences, tokens, verbs) of each text across all the checks of
+    this module run within the context, rather than recomputing them for each check."""
+    token = _batch_features.set({})
+    try:
+        yield
+    finally:
+        _batch_features.reset(token)
+
+
+def tag_verbs(texts: Iterable[str]):
+    """Runs the POS tagging of `contains_verb()` for all of `texts` in a single pass.
+
+    Only useful within `batch_text_features()`, where `contains_verb()` then reuses the results.
+    """
+    features = [_get_text_features(text) for text in texts]
+    features = [f for f in features if f.contains_verb is None]
+    sentence_tokens: List[List[str]] = []
+    sentence_ranges: List[Tuple[int, int]] = []
+    for f in features:
+        text = f.text.lower() if f.text.isupper() else f.text
+        start = len(sentence_tokens)
+        sentence_tokens.extend(word_tokenize(sentence) for sentence in sent_tokenize(text))
+        sentence_ranges.append((start, len(sentence_tokens)))
+    sentence_pos_tags = pos_tag_sentences(sentence_tokens)
+    for f, (start, stop) in zip(features, sentence_ranges):
+        f.contains_verb = any(
+            tag in POS_VERB_TAGS
+            for pos_tags in sentence_pos_tags[start:stop]
+            for _, tag in pos_tags
+        )
+
+
 def is_possible_narrative_text(
     text: str,
     cap_threshold: float = 0.5,
@@ -55,6 +134,40 @@ def is_possible_narrative_text(
         If True, conducts checks that are specific to the chosen language. Turn on for more
         accurate partitioning and off for faster processing.
     """
+    is_narrative = _check_narrative_text(
+        text, cap_threshold, non_alpha_threshold, languages, language_checks
+    )
+    if is_narrative is None:
+        is_narrative = contains_verb(text)
+        if not is_narrative:
+            trace_logger.detail(f"Not narrative. Text does not contain a verb:\n\n{text}")  # type: ignore # noqa: E501
+    return is_narrative
+
+
+def narrative_text_needs_verb(
+    text: str,
+    cap_threshold: float = 0.5,
+    non_alpha_threshold: float = 0.5,
+    languages: List[str] = ["eng"],
+    language_checks: bool = False,
+) -> bool:
+    """True when `is_possible_narrative_text()` with the same arguments comes down to whether
+    `text` contains a verb, so its POS tags can be computed ahead of time with `tag_verbs()`."""
+    return (
+        _check_narrative_text(text, cap_threshold, non_alpha_threshold, languages, language_checks)
+        is None
+    )
+
+
+def _check_narrative_text(
+    text: str,
+    cap_threshold: float,
+    non_alpha_threshold: float,
+    languages: List[str],
+    language_checks: bool,
+) -> Optional[bool]:
+    """All the checks of `is_possible_narrative_text()` but the verb check, which is needed
+    when this returns None."""
     _language_checks = os.environ.get("UNSTRUCTURED_LANGUAGE_CHECKS")
     if _language_checks is not None:
         language_checks = _language_checks.lower() == "true"
@@ -85,9 +198,8 @@ def is_possible_narrative_text(
     if under_non_alpha_ratio(text, threshold=non_alpha_threshold):
         return False
 
-    if "eng" in languages and (sentence_count(text, 3) < 2) and (not contains_verb(text)):
-        trace_logger.detail(f"Not narrative. Text does not contain a verb:\n\n{text}")  # type: ignore # noqa: E501
-        return False
+    if "eng" in languages and sentence_count(text, 3) < 2:
+        return None
 
     return True
 
@@ -184,11 +296,14 @@ def contains_us_phone_number(text: str) -> bool:
 def contains_verb(text: str) -> bool:
     """Use a POS tagger to check if a segment contains verbs. If the section does not have verbs,
     that indicates that it is not narrative text."""
-    if text.isupper():
-        text = text.lower()
+    features = _get_text_features(text)
+    if features.contains_verb is None:
+        if text.isupper():
+            text = text.lower()
 
-    pos_tags = pos_tag(text)
-    return any(tag in POS_VERB_TAGS for _, tag in pos_tags)
+        pos_tags = pos_tag(text)
+        features.contains_verb = any(tag in POS_VERB_TAGS for _, tag in pos_tags)
+    return features.contains_verb
 
 
 def contains_english_word(text: str) -> bool:
@@ -220,12 +335,9 @@ def sentence_count(text: str, min_length: Optional[int] = None) -> int:
     min_length
         The min number of words a section needs to be for it to be considered a sentence.
     """
-    sentences = sent_tokenize(text)
     count = 0
-    for sentence in sentences:
-        sentence = remove_punctuation(sentence)
-        words = [word for word in word_tokenize(sentence) if word != "."]
-        if min_length and len(words) < min_length:
+    for sentence, n_words in _get_text_features(text).sentence_words:
+        if min_length and n_words < min_length:
             trace_logger.detail(  # type: ignore
                 f"Sentence does not exceed {min_length} word tokens, it will not count toward "
                 "sentence count.\n"
@@ -283,7 +395,7 @@ def exceeds_cap_ratio(text: str, threshold: float = 0.5) -> bool:
     # ex. world_tokenize("ITEM 1. Financial Statements (Unaudited)")
     #     = ['ITEM', '1', '.', 'Financial', 'Statements', '(', 'Unaudited', ')'],
     # however, "ITEM 1. Financial Statements (Unaudited)" is Title, not NarrativeText
-    tokens = [tk for tk in word_tokenize(text) if tk.isalpha()]
+    tokens = _get_text_features(text).alpha_tokens
 
     # NOTE(jay-ylee) - If word_tokenize(text) is empty, return must be True to
     # avoid being misclassified as Narrative Text.
@@ -1,5 +1,5 @@
 from tempfile import SpooledTemporaryFile
-from typing import IO, BinaryIO, List, Optional, Union, cast
+from typing import IO, BinaryIO, Iterable, List, Optional, Union, cast
 
 import pandas as pd
 from lxml.html.soupparser import fromstring as soupparser_fromstring
@@ -32,9 +32,10 @@ def partition_tsv(
     include_header: bool = False,
     include_metadata: bool = True,
     languages: Optional[List[str]] = ["auto"],
-    # NOTE (jennings) partition_tsv generates a single TableElement
-    # so detect_language_per_element is not included as a param
+    # NOTE (jennings) partition_tsv generates a single TableElement (or one per window of
+    # `rows_per_table` rows) so detect_language_per_element is not included as a param
     date_from_file_object: bool = False,
+    rows_per_table: Optional[int] = None,
     **kwargs,
 ) -> List[Element]:
     """Partitions TSV files into document elements.
@@ -58,6 +59,12 @@ def partition_tsv(
     date_from_file_object
         Applies only when providing file via `file` parameter. If this option is True, attempt
         infer last_modified metadata from bytes, otherwise set it to None.
+    rows_per_table
+        When set, the file is read in windows of this many rows, each emitted as its own `Table`
+        element with the header repeated when `include_header` is True, so that only one window is
+        parsed into a DataFrame and rendered at a time. The elements of all windows are still
+        returned together, so their text and HTML for the whole file are held in memory. Column
+        types are inferred for each window separately.
     """
     exactly_one(filename=filename, file=file)
 
@@ -65,33 +72,44 @@ def partition_tsv(
     header = 0 if include_header else None
 
     if filename:
-        table = pd.read_csv(filename, sep="\t", header=header)
+        tables = _read_tables(filename, header, rows_per_table)
         last_modification_date = get_last_modified_date(filename)
     elif file:
         f = spooled_to_bytes_io_if_needed(
             cast(Union[BinaryIO, SpooledTemporaryFile], file),
         )
-        table = pd.read_csv(f, sep="\t", header=header)
+        tables = _read_tables(f, header, rows_per_table)
         last_modification_date = (
             get_last_modified_date_from_file(file) if date_from_file_object else None
         )
 
-    html_text = table.to_html(index=False, header=include_header, na_rep="")
-    text = soupparser_fromstring(html_text).text_content()
+    elements: List[Element] = []
+    for table in tables:
+        html_text = table.to_html(index=False, header=include_header, na_rep="")
+        text = soupparser_fromstring(html_text).text_content()
+
+        if include_metadata:
+            metadata = ElementMetadata(
+                text_as_html=html_text,
+                filename=metadata_filename or filename,
+                last_modified=metadata_last_modified or last_modification_date,
+                languages=languages,
+            )
+            metadata.detection_origin = DETECTION_ORIGIN
+        else:
+            metadata = ElementMetadata()
+
+        elements.append(Table(text=text, metadata=metadata))
+
+    return list(apply_lang_metadata(elements, languages=languages))
 
-    if include_metadata:
-        metadata = ElementMetadata(
-            text_as_html=html_text,
-            filename=metadata_filename or filename,
-            last_modified=metadata_last_modified or last_modification_date,
-            languages=languages,
-        )
-        metadata.detection_origin = DETECTION_ORIGIN
-    else:
-        metadata = ElementMetadata()
 
-    elements = apply_lang_metadata(
-        [Table(text=text, metadata=metadata)],
-        languages=languages,
-    )
-    return list(elements)
+def _read_tables(
+    source: Union[str, IO[bytes]],
+    header: Optional[int],
+    rows_per_table: Optional[int],
+) -> Iterable[pd.DataFrame]:
+    """The whole table, or the windows of `rows_per_table` rows of it read one at a time."""
+    if rows_per_table is None:
+        return [pd.read_csv(source, sep="\t", header=header)]
+    return pd.read_csv(source, sep="\t", header=header, chunksize=rows_per_table)
@@ -0,0 +1,336 @@
+"""Cache of the elements `partition()` returns, keyed by the content of the partitioned file.
+
+The same bytes often get partitioned several times, e.g. an attachment sent in many emails or a
+document re-ingested after a configuration change that doesn't affect partitioning. The key of a
+cached result is a hash of the bytes of the file, of the partitioning options, of the environment
+config and of the version of the library, so anything that could change the elements gives a
+different key. What depends on where the bytes came from rather than on the bytes themselves (the
+filename, directory, last-modified date and data-source metadata, and the path attachments are
+attached to) is not part of the key, and is set on the cached elements from the arguments of the
+call that hits the cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from typing import IO, Any, Callable, Dict, Optional
+
+from unstructured.logger import logger
+from unstructured.sqlite import SQLiteStore
+
+DEFAULT_MAX_SIZE = 1024**3
+
+
+class PartitionCacheBackend:
+    DISK = "disk"
+    SQLITE = "sqlite"
+
+
+PARTITION_CACHE_BACKENDS = (PartitionCacheBackend.DISK, PartitionCacheBackend.SQLITE)
+
+# -- arguments of `partition()` that say where the bytes came from rather than what they are --
+_SOURCE_ARGS = (
+    "filename",
+    "file",
+    "file_filename",
+    "metadata_filename",
+    "metadata_last_modified",
+    "date_from_file_object",
+    "data_source_metadata",
+    "url",
+    "headers",
+    "ssl_verify",
+    "request_timeout",
+    "partition_cache",
+)
+_SOURCE_METADATA_FIELDS = ("filename", "file_directory", "last_modified", "attached_to_filename")
+
+
+class PartitionCache(ABC):
+    """Storage of serialized partition results, keyed by the hash of what they were computed from.
+
+    Once the results take more than `max_size` bytes, the least recently used ones are evicted.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """The result stored for `key`, if any, which then becomes the most recently used."""
+
+    @abstractmethod
+    def put(self, key: str, value: bytes) -> None:
+        """Stores the result for `key`, evicting the least recently used results if needed."""
+
+
+class DiskPartitionCache(PartitionCache):
+    """Results stored as files in `directory`, the time a file was last modified being the last
+    time its result was used."""
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        super().__init__(max_size=max_size)
+        self.directory = directory
+        # -- size of the files in the cache, known to this process; other processes adding files
+        # -- only make it an underestimate, which is corrected when evicting --
+        self._size: Optional[int] = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # -- written under a temporary name so a result is never read before it's complete --
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(tmp_path, path)
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._list_files())
+        else:
+            self._size += len(value)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _list_files(self):
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield entry.path, stat.st_mtime, stat.st_size
+
+    def _evict(self):
+        files = sorted(self._list_files(), key=lambda file: file[1])
+        size = sum(file_size for _, _, file_size in files)
+        for path, _, file_size in files:
+            if size <= self.max_size:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            size -= file_size
+        self._size = size
+
+
+class SQLitePartitionCache(PartitionCache, SQLiteStore):
+    """Results stored in the SQLite database at `path`, along with the time each was last used."""
+
+    def __init__(self, path: str, max_size: int = DEFAULT_MAX_SIZE):
+        PartitionCache.__init__(self, max_size=max_size)
+        SQLiteStore.__init__(self, path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS partition_cache "
+            "(key TEXT PRIMARY KEY, value BLOB, size INTEGER, last_used REAL)",
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS partition_cache_last_used ON partition_cache (last_used)",
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self.connection.execute(
+            "SELECT value FROM partition_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        self.connection.execute(
+            "UPDATE partition_cache SET last_used = ? WHERE key = ?",
+            (time.time(), key),
+        )
+        return row[0]
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO partition_cache (key, value, size, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            (size,) = connection.execute("SELECT SUM(size) FROM partition_cache").fetchone()
+            if size > self.max_size:
+                evicted = []
+                for evicted_key, evicted_size in connection.execute(
+                    "SELECT key, size FROM partition_cache ORDER BY last_used",
+                ):
+                    if size <= self.max_size:
+                        break
+                    evicted.append((evicted_key,))
+                    size -= evicted_size
+                connection.executemany("DELETE FROM partition_cache WHERE key = ?", evicted)
+
+
+@functools.lru_cache(maxsize=None)
+def get_partition_cache(
+    path: str,
+    backend: str = PartitionCacheBackend.DISK,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> PartitionCache:
+    """The cache of this process at `path`, a directory for the disk backend and a database file
+    for the SQLite one."""
+    if backend == PartitionCacheBackend.DISK:
+        return DiskPartitionCache(directory=path, max_size=max_size)
+    if backend == PartitionCacheBackend.SQLITE:
+        return SQLitePartitionCache(path=path, max_size=max_size)
+    raise ValueError(
+        f"Unsupported partition cache backend {backend}, "
+        f"must be one of {', '.join(PARTITION_CACHE_BACKENDS)}",
+    )
+
+
+def _get_options_hash(call_args: Dict[str, Any]) -> Optional[str]:
+    """Hash of everything besides the bytes of the file the result of the call depends on, or
+    None when the call can't be cached."""
+    from unstructured.__version__ import __version__
+    from unstructured.partition.text import CLASSIFICATION_ENV_VARS
+    from unstructured.partition.utils.config import ENVConfig, env_config
+
+    kwargs = call_args.pop("kwargs", {})
+    options = {k: v for k, v in {**call_args, **kwargs}.items() if k not in _SOURCE_ARGS}
+    # -- the file type can be detected from the extension of the filename --
+    path = call_args.get("metadata_filename") or call_args.get("file_filename")
+    path = path or call_args.get("filename") or getattr(call_args.get("file"), "name", None)
+    options["extension"] = os.path.splitext(str(path or ""))[1].lower()
+    options["version"] = __version__
+    options["env"] = {
+        name: getattr(env_config, name)
+        for name, value in vars(ENVConfig).items()
+        if isinstance(value, property)
+    }
+    options["env"].update({name: os.environ.get(name) for name in CLASSIFICATION_ENV_VARS})
+    try:
+        options_json = json.dumps(options, sort_keys=True)
+    except TypeError as e:
+        logger.debug(f"not caching partition results, an option can't be serialized: {e}")
+        return None
+    return hashlib.sha256(options_json.encode()).hexdigest()
+
+
+def _is_cacheable(call_args: Dict[str, Any]) -> bool:
+    if call_args.get("url") is not None:
+        return False
+    # -- the ids must be different on every call --
+    if call_args.get("unique_element_ids") or call_args.get("kwargs", {}).get("unique_element_ids"):
+        return False
+    # -- the images are written to a directory as a side effect of partitioning --
+    extracts_images = call_args.get("extract_images_in_pdf") or call_args.get(
+        "extract_image_block_types",
+    )
+    return not (extracts_images and not call_args.get("extract_image_block_to_payload"))
+
+
+def _read_content(filename: Optional[str], file: Optional[IO[bytes]]) -> bytes:
+    if filename is not None:
+        with open(filename, "rb") as f:
+            return f.read()
+    assert file is not None
+    file.seek(0)
+    content = file.read()
+    file.seek(0)
+    return content if isinstance(content, bytes) else content.encode()
+
+
+def _get_source_metadata(call_args: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Element metadata a partitioner derives from where the bytes came from."""
+    from unstructured.partition.common import (
+        get_last_modified_date,
+        get_last_modified_date_from_file,
+    )
+
+    filename = call_args.get("filename")
+    file = call_args.get("file")
+    path = call_args.get("metadata_filename") or call_args.get("file_filename") or filename
+    last_modified = call_args.get("metadata_last_modified") or call_args.get("kwargs", {}).get(
+        "metadata_last_modified",
+    )
+    if last_modified is None:
+        if filename is not None:
+            last_modified = get_last_modified_date(filename)
+        elif call_args.get("date_from_file_object"):
+            last_modified = get_last_modified_date_from_file(file)
+    directory, name = os.path.split(str(path or ""))
+    return {
+        "filename": name or None,
+        "file_directory": directory or None,
+        "last_modified": last_modified,
+        # -- the elements of attachments point at the message they are attached to by its path --
+        "attached_to_filename": str(path) if path else None,
+    }
+
+
+def cache_partition(func: Callable[..., list]) -> Callable[..., list]:
+    """Decorator looking up the results of a partitioning function in its `partition_cache`
+    argument, if one is given, before calling it, and storing them after."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> list:
+        partition_cache: Optional[PartitionCache] = kwargs.pop("partition_cache", None)
+        if partition_cache is None:
+            return func(*args, **kwargs)
+
+        sig = inspect.signature(func)
+        call_args: Dict[str, Any] = dict(zip(sig.parameters, args))
+        extra_kwargs = {k: v for k, v in kwargs.items() if k not in sig.parameters}
+        call_args.update({k: v for k, v in kwargs.items() if k in sig.parameters})
+        call_args["kwargs"] = extra_kwargs
+        for param in sig.parameters.values():
+            if param.name not in call_args and param.default is not param.empty:
+                call_args[param.name] = param.default
+
+        options_hash = _get_options_hash(dict(call_args)) if _is_cacheable(call_args) else None
+        if options_hash is None:
+            return func(*args, **kwargs)
+
+        from unstructured.staging.base import elements_from_dicts, elements_to_dicts
+
+        hasher = hashlib.sha256(_read_content(call_args.get("filename"), call_args.get("file")))
+        hasher.update(options_hash.encode())
+        key = hasher.hexdigest()
+        source_metadata = _get_source_metadata(call_args)
+
+        if (cached := partition_cache.get(key)) is not None:
+            logger.debug(f"using cached partition results {key}")
+            cached_result = json.loads(cached)
+            elements = elements_from_dicts(cached_result["elements"], copy_dicts=False)
+            cached_source_metadata = cached_result["source_metadata"]
+            for element in elements:
+                # -- only what came from the source of the cached bytes is replaced, e.g. not the
+                # -- filenames of attachments or dates found in the content --
+                for name in _SOURCE_METADATA_FIELDS:
+                    value = getattr(element.metadata, name, None)
+                    if value is not None and value == cached_source_metadata.get(name):
+                        setattr(element.metadata, name, source_metadata[name])
+                element.metadata.data_source = call_args.get("data_source_metadata")
+            return elements
+
+        elements = func(*args, **kwargs)
+        partition_cache.put(
+            key,
+            json.dumps(
+                {"elements": elements_to_dicts(elements), "source_metadata": source_metadata},
+            ).encode(),
+        )
+        return elements
+
+    return wrapper
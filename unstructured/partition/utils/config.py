@@ -80,6 +80,20 @@ class ENVConfig:
         """
         return self._get_string("OCR_AGENT", OCR_AGENT_TESSERACT)
 
+    @property
+    def OCR_WORKERS(self) -> int:
+        """number of processes to OCR the pages of a document in parallel with; 1 OCRs pages
+        serially
+        """
+        return self._get_int("OCR_WORKERS", 1)
+
+    @property
+    def ATTACHMENT_WORKERS(self) -> int:
+        """number of processes to partition the attachments of an email in parallel with; 1
+        partitions attachments serially
+        """
+        return self._get_int("ATTACHMENT_WORKERS", 1)
+
     @property
     def EXTRACT_IMAGE_BLOCK_CROP_HORIZONTAL_PAD(self) -> int:
         """extra image block content to add around an identified element(`Image`, `Table`) region
@@ -94,5 +108,17 @@ class ENVConfig:
         """
         return self._get_int("EXTRACT_IMAGE_BLOCK_CROP_VERTICAL_PAD", 0)
 
+    @property
+    def LIBREOFFICE_INSTANCES(self) -> int:
+        """number of long-lived LibreOffice instances each process converts .doc and .ppt files
+        with; 0 runs `soffice` for each conversion
+        """
+        return self._get_int("LIBREOFFICE_INSTANCES", 0)
+
+    @property
+    def LIBREOFFICE_CONVERSION_TIMEOUT(self) -> float:
+        """seconds a LibreOffice instance gets to convert a file before it is restarted"""
+        return self._get_float("LIBREOFFICE_CONVERSION_TIMEOUT", 300)
+
 
 env_config = ENVConfig()
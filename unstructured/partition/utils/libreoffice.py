@@ -0,0 +1,301 @@
+"""Long-lived headless LibreOffice instances to convert documents with.
+
+Starting `soffice` takes seconds, more than converting most documents, and workers starting it at
+the same time slow each other down. Instead of running `soffice --convert-to` for each document, a
+pool of headless instances is started once per process, each with a user profile of its own so they
+don't lock each other out, and documents are converted by them through UNO over a named pipe.
+Instances that exit or hang are restarted.
+
+The pool is used when the `LIBREOFFICE_INSTANCES` environment variable is set, and requires the
+`uno` module LibreOffice ships for Python (e.g. the `python3-uno` package on Debian) to be
+importable.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from unstructured.logger import logger
+from unstructured.partition.utils.config import env_config
+from unstructured.utils import dependency_exists
+
+# -- the export filters `soffice --convert-to` picks for the formats documents are converted to --
+DEFAULT_FILTERS = {
+    "doc": "MS Word 97",
+    "docx": "MS Word 2007 XML",
+    "ppt": "MS PowerPoint 97",
+    "pptx": "Impress MS PowerPoint 2007 XML",
+}
+
+# NOTE: seconds for a new instance to accept connections, and between checks that it does
+STARTUP_TIMEOUT = 60
+STARTUP_POLL_INTERVAL = 0.25
+
+
+class OfficeConversionError(RuntimeError):
+    """A LibreOffice instance failed to convert a document."""
+
+
+class SofficeInstance:
+    """A headless `soffice` process accepting UNO connections on a named pipe."""
+
+    def __init__(self):
+        self.profile_dir = tempfile.mkdtemp(prefix="unstructured-soffice-")
+        self.pipe_name = f"unstructured-{uuid.uuid4().hex}"
+        self.process: Optional[subprocess.Popen] = None
+        self._desktop: Any = None
+        # -- UNO calls run on a thread of their own so that calls that hang can be timed out --
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def start(self, timeout: float = STARTUP_TIMEOUT):
+        try:
+            self.process = self._launch()
+        except FileNotFoundError:
+            self.stop()
+            raise
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self._desktop = self._connect()
+                return
+            except Exception as e:
+                if self.process.poll() is not None:
+                    self.stop()
+                    raise OfficeConversionError(
+                        f"soffice exited with code {self.process.returncode} on startup",
+                    ) from e
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise OfficeConversionError(
+                        f"soffice didn't accept connections within {timeout}s",
+                    ) from e
+                time.sleep(STARTUP_POLL_INTERVAL)
+
+    def _launch(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext",
+                f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _connect(self) -> Any:
+        import uno
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver",
+            local_context,
+        )
+        context = resolver.resolve(
+            f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext",
+        )
+        return context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop",
+            context,
+        )
+
+    def is_healthy(self, timeout: float) -> bool:
+        """Whether the process is running and answers a UNO call within `timeout` seconds."""
+        if self.process is None or self.process.poll() is not None:
+            return False
+        try:
+            self._executor.submit(self._desktop.getComponents).result(timeout=timeout)
+        except Exception:
+            return False
+        return True
+
+    def convert(
+        self,
+        input_filename: str,
+        output_directory: str,
+        target_format: str,
+        filter_name: str,
+        timeout: float,
+    ) -> str:
+        """Converts `input_filename` into `output_directory`, named like `soffice --convert-to`
+        names its output, and returns the path of the converted file."""
+        base_filename, _ = os.path.splitext(os.path.basename(input_filename))
+        output_filename = os.path.join(output_directory, f"{base_filename}.{target_format}")
+        future = self._executor.submit(self._convert, input_filename, output_filename, filter_name)
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise OfficeConversionError(f"converting {input_filename} took more than {timeout}s")
+        return output_filename
+
+    def _convert(self, input_filename: str, output_filename: str, filter_name: str):
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def properties(**kwargs: Any):
+            return tuple(PropertyValue(Name=name, Value=value) for name, value in kwargs.items())
+
+        document = self._desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(input_filename)),
+            "_blank",
+            0,
+            properties(Hidden=True, ReadOnly=True),
+        )
+        if document is None:
+            raise OfficeConversionError(f"soffice could not open {input_filename}")
+        try:
+            document.storeToURL(
+                uno.systemPathToFileUrl(os.path.abspath(output_filename)),
+                properties(FilterName=filter_name, Overwrite=True),
+            )
+        finally:
+            document.close(True)
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        # -- a call left hanging returns with an error once the process is gone --
+        self._executor.shutdown(wait=False)
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class SofficePool:
+    """`size` LibreOffice instances converting documents concurrently, each started on first use.
+
+    Before each conversion the instance is checked to still be running and responsive, and it is
+    replaced by a new one otherwise. An instance that fails a conversion, e.g. when it takes more
+    than `timeout` seconds, is stopped and replaced as well since the document may have left it in
+    a bad state.
+    """
+
+    def __init__(self, size: int, timeout: float):
+        self.size = size
+        self.timeout = timeout
+        # -- idle instances, with None for the ones not started yet --
+        self._idle: queue.Queue[Optional[SofficeInstance]] = queue.Queue()
+        for _ in range(size):
+            self._idle.put(None)
+
+    def _start_instance(self) -> SofficeInstance:
+        instance = SofficeInstance()
+        instance.start()
+        return instance
+
+    def convert(
+        self,
+        input_filename: str,
+        output_directory: str,
+        target_format: str = "docx",
+        target_filter: Optional[str] = None,
+    ) -> str:
+        """Converts `input_filename` with the next idle instance and returns the converted file."""
+        filter_name = target_filter or DEFAULT_FILTERS.get(target_format)
+        if filter_name is None:
+            raise ValueError(f"A target_filter is required to convert to {target_format}.")
+        instance = self._idle.get()
+        try:
+            if instance is not None and not instance.is_healthy(self.timeout):
+                logger.warning("restarting a LibreOffice instance that stopped responding")
+                instance.stop()
+                instance = None
+            if instance is None:
+                instance = self._start_instance()
+            try:
+                return instance.convert(
+                    input_filename,
+                    output_directory,
+                    target_format,
+                    filter_name,
+                    self.timeout,
+                )
+            except Exception:
+                instance.stop()
+                instance = None
+                raise
+        finally:
+            self._idle.put(instance)
+
+    def convert_many(
+        self,
+        input_filenames: Sequence[str],
+        output_directory: str,
+        target_format: str = "docx",
+        target_filter: Optional[str] = None,
+    ) -> List[Optional[str]]:
+        """Converts `input_filenames` across the instances of the pool, returning the converted
+        file of each, or None for the files that failed to convert."""
+
+        def convert(input_filename: str) -> Optional[str]:
+            try:
+                return self.convert(input_filename, output_directory, target_format, target_filter)
+            except FileNotFoundError:
+                raise
+            except Exception as e:
+                logger.error(f"failed to convert {input_filename} with LibreOffice: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(convert, input_filenames))
+
+    def close(self):
+        for _ in range(self.size):
+            instance = self._idle.get()
+            if instance is not None:
+                instance.stop()
+            self._idle.put(None)
+
+
+@functools.lru_cache(maxsize=None)
+def _uno_is_available() -> bool:
+    if dependency_exists("uno"):
+        return True
+    logger.warning(
+        "LIBREOFFICE_INSTANCES is set but the uno module of LibreOffice can't be imported, "
+        "running soffice for each conversion instead",
+    )
+    return False
+
+
+# -- the pool of this process, not shared with processes forked from it --
+_pool: Optional[SofficePool] = None
+_pool_pid: Optional[int] = None
+
+
+def get_soffice_pool() -> Optional[SofficePool]:
+    """The LibreOffice instances of this process, or None when `LIBREOFFICE_INSTANCES` isn't set or
+    the `uno` module isn't available."""
+    global _pool, _pool_pid
+
+    size = env_config.LIBREOFFICE_INSTANCES
+    if size < 1:
+        return None
+    if not _uno_is_available():
+        return None
+    if _pool is None or _pool_pid != os.getpid() or _pool.size != size:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+        _pool = SofficePool(size=size, timeout=env_config.LIBREOFFICE_CONVERSION_TIMEOUT)
+        _pool_pid = os.getpid()
+        atexit.register(_pool.close)
+    return _pool
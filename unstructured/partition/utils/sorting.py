@@ -57,6 +57,27 @@ def shrink_bbox(bbox: Tuple[int, int, int, int], shrink_factor) -> Tuple[int, in
     return int(left), int(top), int(new_right), int(new_bottom)
 
 
+def shrink_bboxes(bboxes: np.ndarray, shrink_factor: float) -> np.ndarray:
+    """
+    Shrink each of a set of bounding boxes like `shrink_bbox()` does, all at once.
+
+    Parameters:
+        bboxes (np.ndarray): (N, 4) array of bounding boxes represented by
+        (left, top, right, bottom).
+        shrink_factor (float): The factor by which to shrink the bounding boxes (0.0 to 1.0).
+
+    Returns:
+        np.ndarray: (N, 4) int array of the shrunken bounding boxes.
+    """
+
+    left, top, right, bottom = bboxes.T
+    width = right - left
+    height = bottom - top
+    new_right = right - (width - width * shrink_factor)
+    new_bottom = bottom - (height - height * shrink_factor)
+    return np.stack([left, top, new_right, new_bottom], axis=1).astype(int)
+
+
 def coord_has_valid_points(coordinates: CoordinatesMetadata) -> bool:
     """
     Verifies all 4 points in a coordinate exist and are positive.
@@ -153,20 +174,10 @@ def sort_page_elements(
     if sort_mode == SORT_MODE_XY_CUT:
         if not _coords_ok(strict_points=True):
             return page_elements
-        shrunken_bboxes = []
-        for coords in coordinates_list:
-            bbox = coordinates_to_bbox(coords)
-            shrunken_bbox = shrink_bbox(bbox, shrink_factor)
-            shrunken_bboxes.append(shrunken_bbox)
-
-        res: List[int] = []
-        xy_cut_sorting_func = (
-            recursive_xy_cut_swapped if xy_cut_primary_direction == "x" else recursive_xy_cut
-        )
-        xy_cut_sorting_func(
-            np.asarray(shrunken_bboxes).astype(int),
-            np.arange(len(shrunken_bboxes)),
-            res,
+        res = sort_bboxes_by_xy_cut(
+            bboxes=[coordinates_to_bbox(coords) for coords in coordinates_list],
+            shrink_factor=shrink_factor,
+            xy_cut_primary_direction=xy_cut_primary_direction,
         )
         sorted_page_elements = [page_elements[i] for i in res]
     elif sort_mode == SORT_MODE_BASIC:
@@ -193,20 +204,13 @@ def sort_bboxes_by_xy_cut(
 ):
     """Sort bounding boxes using XY-cut algorithm."""
 
-    shrunken_bboxes = []
-    for bbox in bboxes:
-        shrunken_bbox = shrink_bbox(bbox, shrink_factor)
-        shrunken_bboxes.append(shrunken_bbox)
+    shrunken_bboxes = shrink_bboxes(np.asarray(bboxes).reshape(-1, 4), shrink_factor)
 
     res: List[int] = []
     xy_cut_sorting_func = (
         recursive_xy_cut_swapped if xy_cut_primary_direction == "x" else recursive_xy_cut
     )
-    xy_cut_sorting_func(
-        np.asarray(shrunken_bboxes).astype(int),
-        np.arange(len(shrunken_bboxes)),
-        res,
-    )
+    xy_cut_sorting_func(shrunken_bboxes, np.arange(len(shrunken_bboxes)), res)
     return res
 
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -30,9 +30,18 @@ def projection_by_bboxes(boxes: np.ndarray, axis: int) -> np.ndarray:
     assert axis in [0, 1]
     length = np.max(boxes[:, axis::2])
     res = np.zeros(length, dtype=int)
-    # TODO: how to remove for loop?
-    for start, end in boxes[:, axis::2]:
-        res[start:end] += 1
+    # -- each box adds 1 over `res[start:end]`, negative values counting from the end like they do
+    # -- in a slice, so the histogram is the cumulative sum of +1 at starts and -1 at ends --
+    starts, ends = (
+        np.where(values < 0, np.maximum(values + length, 0), np.minimum(values, length))
+        for values in (boxes[:, axis], boxes[:, axis + 2])
+    )
+    keep = starts < ends
+    changes = np.bincount(starts[keep], minlength=length + 1) - np.bincount(
+        ends[keep],
+        minlength=length + 1,
+    )
+    res += np.cumsum(changes[:length])
     return res
 
 
@@ -83,123 +92,112 @@ def split_projection_profile(arr_values: np.ndarray, min_value: float, min_gap:
     return arr_start, arr_end
 
 
-def recursive_xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
+def split_boxes_by_projection(
+    boxes: np.ndarray,
+    indices: np.ndarray,
+    axis: int,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Splits boxes sorted by their start along `axis` where their projection has gaps, like
+    `split_projection_profile(projection_by_bboxes(boxes, axis), 0, 1)` does.
+
+    Each group holds the boxes starting within a segment of the projection, and the groups are in
+    the order of their segments. Rather than building the per-pixel projection, segments are found
+    by merging the [start, end) intervals of the boxes, so the cost depends on the number of boxes
+    instead of on the size of the page. Coordinates must not be negative.
+
+    Args:
+        boxes: (N, 4) - (left, top, right, bottom) of each box, sorted by their start along `axis`
+        indices: (N,) - index of each box in the original data
+        axis: 0 - split along the x-axis, 1 - split along the y-axis
+
+    Returns:
+        list: The boxes and indices of each group.
     """
+    starts, ends = boxes[:, axis], boxes[:, axis + 2]
+    # -- boxes spanning no pixel don't add to the projection --
+    keep = starts < ends
+    if not keep.any():
+        return []
+    interval_starts = starts[keep]
+    reach = np.maximum.accumulate(ends[keep])
+    # -- a segment ends before each interval that begins after all those before it ended --
+    gaps = np.flatnonzero(interval_starts[1:] > reach[:-1])
+    if not len(gaps) and keep.all():
+        return [(boxes, indices)]
+    segment_starts = interval_starts[np.append(0, gaps + 1)]
+    segment_ends = reach[np.append(gaps, len(reach) - 1)]
+    # -- boxes starting between segments, which can only be boxes spanning no pixel, are left out --
+    firsts = np.searchsorted(starts, segment_starts)
+    lasts = np.searchsorted(starts, segment_ends)
+    return [(boxes[first:last], indices[first:last]) for first, last in zip(firsts, lasts)]
+
+
+def xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int], axis: int):
+    """XY-cut of `boxes`, cutting along `axis` first, adding the indices of the boxes to `res` in
+    reading order.
+
+    Boxes are first split into groups along `axis`, then each group is split along the other axis;
+    groups that split again are cut the same way, while the boxes of the others are read in the
+    order of the other axis. Pending groups are kept on a stack rather than recursed into, so the
+    depth of the nesting isn't limited by the recursion limit.
 
     Args:
-        boxes: (N, 4)
-        indices: during the recursion process, the index of box in the original data
-         is always represented.
+        boxes: (N, 4) - (left, top, right, bottom) of each box, with non-negative coordinates
+        indices: (N,) - index of each box in the original data
         res: save output
-
+        axis: 0 - cut along the x-axis first, 1 - cut along the y-axis first
     """
-    # project to the y-axis
     assert len(boxes) == len(indices)
+    other_axis = 1 - axis
+    # -- groups still to cut, and groups already in reading order with `None` for boxes --
+    stack: List[Tuple[Optional[np.ndarray], np.ndarray]] = [(boxes, indices)]
+    while stack:
+        group_boxes, group_indices = stack.pop()
+        if group_boxes is None:
+            res.extend(group_indices)
+            continue
 
-    _indices = boxes[:, 1].argsort()
-    y_sorted_boxes = boxes[_indices]
-    y_sorted_indices = indices[_indices]
-
-    # debug_vis(y_sorted_boxes, y_sorted_indices)
-
-    y_projection = projection_by_bboxes(boxes=y_sorted_boxes, axis=1)
-    pos_y = split_projection_profile(y_projection, 0, 1)
-    if not pos_y:
-        return
-
-    arr_y0, arr_y1 = pos_y
-    for r0, r1 in zip(arr_y0, arr_y1):
-        # [r0, r1] means that the areas with bbox will be divided horizontally, and these areas
-        # will be divided vertically.
-        _indices = (r0 <= y_sorted_boxes[:, 1]) & (y_sorted_boxes[:, 1] < r1)
-
-        y_sorted_boxes_chunk = y_sorted_boxes[_indices]
-        y_sorted_indices_chunk = y_sorted_indices[_indices]
+        _indices = group_boxes[:, axis].argsort()
+        pending: List[Tuple[Optional[np.ndarray], np.ndarray]] = []
+        for chunk_boxes, chunk_indices in split_boxes_by_projection(
+            group_boxes[_indices],
+            group_indices[_indices],
+            axis,
+        ):
+            _indices = chunk_boxes[:, other_axis].argsort()
+            chunk_boxes = chunk_boxes[_indices]
+            chunk_indices = chunk_indices[_indices]
+            sub_chunks = split_boxes_by_projection(chunk_boxes, chunk_indices, other_axis)
+            if len(sub_chunks) == 1:
+                # the chunk cannot be divided along the other axis
+                pending.append((None, chunk_indices))
+            else:
+                pending.extend(sub_chunks)
+        stack.extend(reversed(pending))
 
-        _indices = y_sorted_boxes_chunk[:, 0].argsort()
-        x_sorted_boxes_chunk = y_sorted_boxes_chunk[_indices]
-        x_sorted_indices_chunk = y_sorted_indices_chunk[_indices]
 
-        # project in the x direction
-        x_projection = projection_by_bboxes(boxes=x_sorted_boxes_chunk, axis=0)
-        pos_x = split_projection_profile(x_projection, 0, 1)
-        if not pos_x:
-            continue
+def recursive_xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
+    """XY-cut cutting along the y-axis first, see `xy_cut()`.
 
-        arr_x0, arr_x1 = pos_x
-        if len(arr_x0) == 1:
-            # x-direction cannot be divided
-            res.extend(x_sorted_indices_chunk)
-            continue
+    Args:
+        boxes: (N, 4)
+        indices: the index of each box in the original data
+        res: save output
 
-        # can be separated in the x-direction and continue to call recursively
-        for c0, c1 in zip(arr_x0, arr_x1):
-            _indices = (c0 <= x_sorted_boxes_chunk[:, 0]) & (x_sorted_boxes_chunk[:, 0] < c1)
-            recursive_xy_cut(
-                x_sorted_boxes_chunk[_indices],
-                x_sorted_indices_chunk[_indices],
-                res,
-            )
+    """
+    xy_cut(boxes, indices, res, axis=1)
 
 
 def recursive_xy_cut_swapped(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
-    """
+    """XY-cut cutting along the x-axis first, see `xy_cut()`.
+
     Args:
         boxes: (N, 4) - Numpy array representing bounding boxes with shape (N, 4)
         where each row is (left, top, right, bottom)
         indices: An array representing indices that correspond to boxes in the original data
         res: A list to save the output results
     """
-
-    # Sort the bounding boxes based on x-coordinates (flipped)
-    assert len(boxes) == len(indices)
-    _indices = boxes[:, 0].argsort()
-    x_sorted_boxes = boxes[_indices]
-    x_sorted_indices = indices[_indices]
-
-    # Project the boxes onto the x-axis and split the projection profile
-    x_projection = projection_by_bboxes(boxes=x_sorted_boxes, axis=0)
-    pos_x = split_projection_profile(x_projection, 0, 1)
-
-    if not pos_x:
-        return
-
-    arr_x0, arr_x1 = pos_x
-
-    # Loop over the segments obtained from the x-axis projection
-    for c0, c1 in zip(arr_x0, arr_x1):
-        # Obtain sub-boxes in the x-axis segment
-        _indices = (c0 <= x_sorted_boxes[:, 0]) & (x_sorted_boxes[:, 0] < c1)
-        x_sorted_boxes_chunk = x_sorted_boxes[_indices]
-        x_sorted_indices_chunk = x_sorted_indices[_indices]
-
-        # Sort the sub-boxes based on y-coordinates (flipped)
-        _indices = x_sorted_boxes_chunk[:, 1].argsort()
-        y_sorted_boxes_chunk = x_sorted_boxes_chunk[_indices]
-        y_sorted_indices_chunk = x_sorted_indices_chunk[_indices]
-
-        # Project the sub-boxes onto the y-axis and split the projection profile
-        y_projection = projection_by_bboxes(boxes=y_sorted_boxes_chunk, axis=1)
-        pos_y = split_projection_profile(y_projection, 0, 1)
-
-        if not pos_y:
-            continue
-
-        arr_y0, arr_y1 = pos_y
-
-        if len(arr_y0) == 1:
-            # If there's no splitting along the y-axis, add the indices to the result
-            res.extend(y_sorted_indices_chunk)
-            continue
-
-        # Recursive call for sub-boxes along the y-axis segments
-        for r0, r1 in zip(arr_y0, arr_y1):
-            _indices = (r0 <= y_sorted_boxes_chunk[:, 1]) & (y_sorted_boxes_chunk[:, 1] < r1)
-            recursive_xy_cut_swapped(
-                y_sorted_boxes_chunk[_indices],
-                y_sorted_indices_chunk[_indices],
-                res,
-            )
+    xy_cut(boxes, indices, res, axis=0)
 
 
 def points_to_bbox(points):
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import io
+import itertools
 from tempfile import SpooledTemporaryFile
 from typing import IO, Any, Iterator, Optional, cast
 
-import networkx as nx
 import numpy as np
 import pandas as pd
 from lxml.html.soupparser import fromstring as soupparser_fromstring  # pyright: ignore
@@ -55,6 +55,7 @@ def partition_xlsx(
     include_header: bool = False,
     find_subtable: bool = True,
     date_from_file_object: bool = False,
+    rows_per_table: Optional[int] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions Microsoft Excel Documents in .xlsx format into its document elements.
@@ -87,43 +88,46 @@ def partition_xlsx(
     date_from_file_object
         Applies only when providing file via `file` parameter. If this option is True, attempt
         infer last_modified metadata from bytes, otherwise set it to None.
+    rows_per_table
+        When set, each worksheet is streamed in read-only mode and emitted as a sequence of `Table`
+        elements of at most this many rows each, repeating the header row in each of them when
+        `include_header` is True. Only one window of rows is loaded into a DataFrame and rendered
+        at a time, which keeps very large worksheets from being rendered into a single huge
+        element; the elements of all windows are still returned together, so their text and HTML
+        for the whole workbook are held in memory. Subtables are not detected in this mode since
+        that takes the whole worksheet, i.e. `find_subtable` is ignored.
     """
     last_modification_date = None
     header = 0 if include_header else None
 
-    sheets: dict[str, pd.DataFrame] = {}
     if filename:
-        sheets = pd.read_excel(  # pyright: ignore[reportUnknownMemberType]
-            filename, sheet_name=None, header=header
-        )
+        source: str | IO[bytes] = filename
         last_modification_date = get_last_modified_date(filename)
 
     elif file:
         if isinstance(file, SpooledTemporaryFile):
             file.seek(0)
-            f = io.BytesIO(file.read())
+            source = io.BytesIO(file.read())
         else:
-            f = file
-        sheets = pd.read_excel(  # pyright: ignore[reportUnknownMemberType]
-            f, sheet_name=None, header=header
-        )
+            source = file
         last_modification_date = (
             get_last_modified_date_from_file(file) if date_from_file_object else None
         )
     else:
         raise ValueError("Either 'filename' or 'file' argument must be specified")
 
+    sheets = (
+        _iter_worksheet_windows(source, rows_per_table, include_header)
+        if rows_per_table is not None
+        else _iter_worksheets(source, header)
+    )
+
     elements: list[Element] = []
-    for page_number, (sheet_name, sheet) in enumerate(sheets.items(), start=1):
-        if not find_subtable:
-            html_text = (
-                sheet.to_html(  # pyright: ignore[reportUnknownMemberType]
-                    index=False, header=include_header, na_rep=""
-                )
-                if infer_table_structure
-                else None
+    for page_number, sheet_name, sheet in sheets:
+        if rows_per_table is not None or not find_subtable:
+            html_text = sheet.to_html(  # pyright: ignore[reportUnknownMemberType]
+                index=False, header=include_header, na_rep=""
             )
-            # XXX: `html_text` can be `None`. What happens on this call in that case?
             text = cast(
                 str,
                 soupparser_fromstring(  # pyright: ignore[reportUnknownMemberType]
@@ -133,7 +137,7 @@ def partition_xlsx(
 
             if include_metadata:
                 metadata = ElementMetadata(
-                    text_as_html=html_text,
+                    text_as_html=html_text if infer_table_structure else None,
                     page_name=sheet_name,
                     page_number=page_number,
                     filename=metadata_filename or filename,
@@ -276,31 +280,83 @@ class _ConnectedComponents:
     @lazyproperty
     def _connected_components(self) -> list[_ConnectedComponent]:
         """The `_ConnectedComponent` objects comprising this collection."""
-        # -- produce a 2D-graph representing the populated cells of the worksheet (or subsheet).
-        # -- A 2D-graph relates each populated cell to the one above, below, left, and right of it.
-        max_row, max_col = self._worksheet_df.shape
-        node_array = np.indices((max_row, max_col)).T
-        empty_cells = self._worksheet_df.isna().T
-        nodes_to_remove = [tuple(pair) for pair in node_array[empty_cells]]
-
-        graph: nx.Graph = nx.grid_2d_graph(max_row, max_col)  # pyright: ignore
-        graph.remove_nodes_from(nodes_to_remove)  # pyright: ignore
-
-        # -- compute sets of nodes representing each connected-component --
-        connected_node_sets: Iterator[set[_CellCoordinate]]
-        connected_node_sets = nx.connected_components(  # pyright: ignore[reportUnknownMemberType]
-            graph
-        )
-
+        # -- each component only keeps the corners of its bounding box, which is all its extents
+        # -- and subtable depend on --
         return list(
             self._merge_overlapping_tables(
                 [
-                    _ConnectedComponent(self._worksheet_df, component_node_set)
-                    for component_node_set in connected_node_sets
+                    _ConnectedComponent(self._worksheet_df, {(min_x, min_y), (max_x, max_y)})
+                    for min_x, min_y, max_x, max_y in self._component_extents
                 ]
             )
         )
 
+    @lazyproperty
+    def _component_extents(self) -> list[tuple[int, int, int, int]]:
+        """(min_x, min_y, max_x, max_y) of each group of 2D-connected populated cells.
+
+        Groups are in the order of their first cell, row by row, the order of the components of a
+        2D-graph of the worksheet. Rather than building that graph with a node for every cell of
+        the worksheet, the horizontal runs of populated cells in each row are joined with a
+        union-find to the runs they touch in the next row.
+        """
+        populated = self._worksheet_df.notna().to_numpy()
+        n_rows, n_cols = populated.shape
+        if not populated.any():
+            return []
+
+        # -- runs of populated cells in row-major order, `run_ends` being exclusive --
+        padded = np.zeros((n_rows, n_cols + 2), dtype=np.int8)
+        padded[:, 1:-1] = populated
+        changes = np.diff(padded, axis=1)
+        run_rows, run_starts = np.nonzero(changes == 1)
+        _, run_ends = np.nonzero(changes == -1)
+        n_runs = len(run_rows)
+
+        # -- the run of each populated cell, to relate runs of consecutive rows sharing a column --
+        run_ids = np.cumsum(changes[:, :-1] == 1, dtype=np.int64).reshape(n_rows, n_cols) - 1
+        touching = populated[:-1] & populated[1:]
+        upper_runs, lower_runs = run_ids[:-1][touching], run_ids[1:][touching]
+        # -- a pair of runs touches on each of their shared columns, keep one of them --
+        distinct = np.ones(len(upper_runs), dtype=bool)
+        distinct[1:] = (upper_runs[1:] != upper_runs[:-1]) | (lower_runs[1:] != lower_runs[:-1])
+
+        # -- union-find where the root of each group is its first run --
+        parent = list(range(n_runs))
+
+        def find(run: int) -> int:
+            while parent[run] != run:
+                parent[run] = parent[parent[run]]
+                run = parent[run]
+            return run
+
+        for upper_run, lower_run in zip(
+            upper_runs[distinct].tolist(), lower_runs[distinct].tolist()
+        ):
+            upper_root, lower_root = find(upper_run), find(lower_run)
+            if upper_root != lower_root:
+                parent[max(upper_root, lower_root)] = min(upper_root, lower_root)
+
+        roots = np.array(parent)
+        while not np.array_equal(roots[roots], roots):
+            roots = roots[roots]
+        first_runs, groups = np.unique(roots, return_inverse=True)
+
+        max_rows = np.zeros(len(first_runs), dtype=np.int64)
+        np.maximum.at(max_rows, groups, run_rows)
+        min_cols = np.full(len(first_runs), n_cols, dtype=np.int64)
+        np.minimum.at(min_cols, groups, run_starts)
+        max_cols = np.zeros(len(first_runs), dtype=np.int64)
+        np.maximum.at(max_cols, groups, run_ends - 1)
+        return list(
+            zip(
+                run_rows[first_runs].tolist(),
+                min_cols.tolist(),
+                max_rows.tolist(),
+                max_cols.tolist(),
+            )
+        )
+
     def _merge_overlapping_tables(
         self, connected_components: list[_ConnectedComponent]
     ) -> Iterator[_ConnectedComponent]:
@@ -455,3 +511,86 @@ def _get_metadata(
     else:
         metadata = ElementMetadata()
     return metadata
+
+
+def _iter_worksheets(
+    source: str | IO[bytes], header: Optional[int]
+) -> Iterator[tuple[int, str, pd.DataFrame]]:
+    """Generate the page-number, name and dataframe of each worksheet in the workbook."""
+    sheets: dict[str, pd.DataFrame] = pd.read_excel(  # pyright: ignore[reportUnknownMemberType]
+        source, sheet_name=None, header=header
+    )
+    for page_number, (sheet_name, sheet) in enumerate(sheets.items(), start=1):
+        yield page_number, sheet_name, sheet
+
+
+def _iter_worksheet_windows(
+    source: str | IO[bytes], rows_per_table: int, include_header: bool
+) -> Iterator[tuple[int, str, pd.DataFrame]]:
+    """Generate a dataframe of each window of `rows_per_table` rows of each worksheet.
+
+    Worksheets are streamed with openpyxl in read-only mode and cell values are converted the way
+    `pd.read_excel()` converts them, so a window holding a whole worksheet produces the same
+    dataframe that worksheet does without windowing. When `include_header` is True the first row of
+    each worksheet is its header and is repeated in each window.
+    """
+    import openpyxl
+    from pandas.io.parsers import TextParser
+
+    if rows_per_table < 1:
+        raise ValueError(f"rows_per_table must be a positive integer, got {rows_per_table}")
+
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        for page_number, worksheet in enumerate(workbook.worksheets, start=1):
+            rows = _iter_worksheet_rows(worksheet)
+            header_row = next(rows, None) if include_header else None
+            if include_header and header_row is None:
+                continue
+            while window := list(itertools.islice(rows, rows_per_table)):
+                if header_row is not None:
+                    window.insert(0, header_row)
+                # -- extend rows to the width of the widest one, like `pd.read_excel()` does --
+                width = max(len(row) for row in window)
+                window = [row + [""] * (width - len(row)) for row in window]
+                parser = TextParser(
+                    window,
+                    header=0 if header_row is not None else None,
+                    skip_blank_lines=False,
+                )
+                sheet = cast(pd.DataFrame, parser.read())
+                yield page_number, worksheet.title, sheet
+    finally:
+        workbook.close()
+
+
+def _iter_worksheet_rows(worksheet: Any) -> Iterator[list[Any]]:
+    """Generate the cell values of each row of `worksheet`, without trailing empty cells and rows.
+
+    Empty rows are held back until a row with a value follows them so that the empty rows at the
+    end of the worksheet are dropped.
+    """
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    def convert_cell(cell: Any) -> Any:
+        if cell.value is None:
+            return ""
+        if cell.data_type == TYPE_ERROR:
+            return np.nan
+        if cell.data_type == TYPE_NUMERIC and int(cell.value) == cell.value:
+            return int(cell.value)
+        return cell.value
+
+    # -- the dimensions recorded in the file can't be relied on in read-only mode --
+    worksheet.reset_dimensions()
+    empty_rows: list[list[Any]] = []
+    for cells in worksheet.rows:
+        row = [convert_cell(cell) for cell in cells]
+        while row and row[-1] == "":
+            row.pop()
+        if not row:
+            empty_rows.append(row)
+            continue
+        yield from empty_rows
+        empty_rows.clear()
+        yield row
@@ -21,7 +21,7 @@ from unstructured.partition.common import (
     spooled_to_bytes_io_if_needed,
 )
 from unstructured.partition.lang import apply_lang_metadata
-from unstructured.partition.text import element_from_text
+from unstructured.partition.text import elements_from_texts
 
 DETECTION_ORIGIN: str = "xml"
 
@@ -174,11 +174,9 @@ def partition_xml(
             text=text,
             xml_path=xml_path,
         )
-        for leaf_element in leaf_elements:
-            if leaf_element:
-                element = element_from_text(leaf_element)
-                element.metadata = copy.deepcopy(metadata)
-                elements.append(element)
+        for element in elements_from_texts([leaf for leaf in leaf_elements if leaf]):
+            element.metadata = copy.deepcopy(metadata)
+            elements.append(element)
 
     elements = list(
         apply_lang_metadata(
@@ -0,0 +1,61 @@
+"""Base of the SQLite databases shared by the processes of a run.
+
+Every process reads and writes such a database directly, with its own connection, instead of
+going through a manager process, so e.g. the pipeline's databases in its `work_dir` and the
+SQLite partition cache can be used from a pool of workers.
+"""
+
+import os
+import sqlite3
+import typing as t
+from pathlib import Path
+
+# NOTE: keeps the number of parameters of a query under SQLite's default limit
+MAX_QUERY_PARAMS = 500
+
+
+class SQLiteStore:
+    """Holds the connection of the current process to the SQLite database at `path`."""
+
+    def __init__(self, path: t.Union[str, Path]):
+        self.path = str(path)
+        self._connection: t.Optional[sqlite3.Connection] = None
+        self._pid: t.Optional[int] = None
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+    def __getstate__(self) -> dict:
+        # -- connections can't be pickled, each process opens its own --
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pid"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # -- a connection must not be used in a process forked from the one that opened it --
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self.connection)
+
+
+class _Transaction:
+    """Context manager running statements of an autocommit connection in a single transaction."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
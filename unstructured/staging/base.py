@@ -32,8 +32,15 @@ if dependency_exists("pandas"):
 # == DESERIALIZERS ===============================
 
 
-def elements_from_dicts(element_dicts: Iterable[dict[str, Any]]) -> list[Element]:
-    """Convert a list of element-dicts to a list of elements."""
+def elements_from_dicts(
+    element_dicts: Iterable[dict[str, Any]], copy_dicts: bool = True
+) -> list[Element]:
+    """Convert a list of element-dicts to a list of elements.
+
+    Metadata dicts are deep-copied so the elements don't share state with `element_dicts`. Pass
+    `copy_dicts=False` to skip that copy when `element_dicts` was just deserialized and won't be
+    used again.
+    """
     elements: list[Element] = []
 
     for item in element_dicts:
@@ -41,7 +48,7 @@ def elements_from_dicts(element_dicts: Iterable[dict[str, Any]]) -> list[Element
         metadata = (
             ElementMetadata()
             if item.get("metadata") is None
-            else ElementMetadata.from_dict(item["metadata"])
+            else ElementMetadata.from_dict(item["metadata"], copy_dict=copy_dicts)
         )
 
         if item.get("type") in TYPE_TO_TEXT_ELEMENT_MAP:
@@ -72,7 +79,8 @@ def elements_from_json(
     else:
         element_dicts = json.loads(text)
 
-    return elements_from_dicts(element_dicts)
+    # -- the dicts were just parsed and aren't shared, so there's no need to copy them --
+    return elements_from_dicts(element_dicts, copy_dicts=False)
 
 
 # == SERIALIZERS =================================